@@ -0,0 +1,108 @@
+"""
+Time of _enhance_schedule over a synthetic 30-team x 82-game season, vectorized vs the old per-row version
+
+    python benchmarks/bench_enhance_schedule.py --rounds 3
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(ROOT, 'src'))
+
+from scrapers.espn_schedule_scraper import ESPNScheduleScraper
+
+
+def old_enhance_schedule(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    The per-row _enhance_schedule (apply + .loc loop) the vectorized version replaced
+    """
+    def parse_espn_date(date_str):
+        try:
+            temp_date = datetime.strptime(date_str + ', 2025', '%a, %b %d, %Y')
+            if temp_date.month < 10:
+                temp_date = temp_date.replace(year=2026)
+            return pd.Timestamp(temp_date)
+        except Exception:
+            return pd.NaT
+
+    df['ParsedDate'] = df['DATE'].apply(parse_espn_date)
+    df['DayOfWeek'] = df['ParsedDate'].dt.day_name()
+    df = df.sort_values('ParsedDate').reset_index(drop=True)
+
+    df['IsBackToBack'] = False
+    df['BackToBackPosition'] = 'None'
+    for i in range(1, len(df)):
+        if pd.notna(df.loc[i, 'ParsedDate']) and pd.notna(df.loc[i-1, 'ParsedDate']):
+            if (df.loc[i, 'ParsedDate'] - df.loc[i-1, 'ParsedDate']).days == 1:
+                df.loc[i-1, 'IsBackToBack'] = True
+                df.loc[i-1, 'BackToBackPosition'] = 'First'
+                df.loc[i, 'IsBackToBack'] = True
+                df.loc[i, 'BackToBackPosition'] = 'Second'
+
+    df['HomeAway'] = df['OPPONENT'].apply(lambda x: 'Away' if str(x).startswith('@') else 'Home')
+
+    def clean_opponent(opp):
+        opp = str(opp)
+        if opp.startswith('@'):
+            opp = opp[1:]
+        if opp.lower().startswith('vs'):
+            opp = opp[2:]
+        return opp.strip()
+
+    df['OpponentClean'] = df['OPPONENT'].apply(clean_opponent)
+    return df
+
+
+def synthetic_team_schedules(teams: int = 30, games: int = 82, seed: int = 0) -> dict:
+    """
+    Raw scraped schedules (DATE like 'Wed, Oct 22', OPPONENT like '@Orlando') keyed by team
+    """
+    rng = np.random.default_rng(seed)
+    start = pd.Timestamp('2025-10-21')
+    schedules = {}
+    for t in range(teams):
+        days = start + pd.to_timedelta(np.sort(rng.choice(170, size=games, replace=False)), unit='D')
+        opponents = rng.choice(['vsToronto', '@Orlando', 'vsLA', '@Boston', 'vsMiami'], size=games)
+        schedules[f'T{t:02d}'] = pd.DataFrame({'DATE': days.strftime('%a, %b %-d'), 'OPPONENT': opponents})
+    return schedules
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark schedule enhancement, vectorized vs per-row")
+    parser.add_argument('--rounds', type=int, default=3, help="Passes over all teams per version")
+    parser.add_argument('--teams', type=int, default=30)
+    parser.add_argument('--games', type=int, default=82)
+    args = parser.parse_args()
+
+    schedules = synthetic_team_schedules(args.teams, args.games)
+    with contextlib.redirect_stdout(io.StringIO()):
+        scraper = ESPNScheduleScraper()
+    print(f"{args.teams} teams x {args.games} games, {args.rounds} rounds\n")
+
+    versions = {
+        'per-row': lambda team, df: old_enhance_schedule(df),
+        'vectorized': lambda team, df: scraper._enhance_schedule(df, team, '2026'),
+    }
+    results = {}
+    for name, enhance in versions.items():
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(args.rounds):
+                for team, df in schedules.items():
+                    enhance(team, df.copy())
+        results[name] = (time.perf_counter() - start) / args.rounds
+        print(f"{name:<11} {results[name] * 1000:8.1f} ms per season")
+
+    print(f"\nspeedup: {results['per-row'] / results['vectorized']:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
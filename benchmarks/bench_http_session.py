@@ -0,0 +1,108 @@
+"""
+Per-call latency of ESPNFantasyClient requests against a local stub server
+
+Compares a fresh connection per call (requests.get - how the client worked
+before the pooled session) with the client's keep-alive session. The stub
+sleeps `--handshake` seconds on every new connection to stand in for the
+TCP+TLS setup a real ESPN call pays.
+
+    python benchmarks/bench_http_session.py --calls 200 --handshake 0.02
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import socket
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from scrapers.espn_fantasy_client import ESPNFantasyClient
+
+BODY = json.dumps({
+    'settings': {'name': 'Benchmark League', 'size': 12},
+    'teams': [{'id': team_id, 'roster': {'entries': [{'playerId': i} for i in range(13)]}} for team_id in range(12)],
+}).encode()
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    handshake = 0.0
+    connections = 0
+
+    def setup(self):
+        super().setup()
+        # Headers and body go out as separate writes - without this, Nagle + delayed ACK
+        # add ~40 ms to every call on a reused connection
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        StubHandler.connections += 1
+        time.sleep(self.handshake)
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+def timed_calls(call, calls: int):
+    latencies = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        call()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def report(label: str, latencies, connections: int) -> None:
+    latencies = sorted(latencies)
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(f"{label:<28} mean {statistics.mean(latencies):7.2f} ms   p50 {statistics.median(latencies):7.2f} ms   "
+          f"p95 {p95:7.2f} ms   connections {connections}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pooled vs per-call HTTP connections")
+    parser.add_argument('--calls', type=int, default=200, help="Requests per mode")
+    parser.add_argument('--handshake', type=float, default=0.02, help="Seconds the stub spends on each new connection")
+    args = parser.parse_args()
+
+    StubHandler.handshake = args.handshake
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    ESPNFantasyClient.BASE_URL = f"http://127.0.0.1:{server.server_address[1]}"
+    with contextlib.redirect_stdout(io.StringIO()):
+        client = ESPNFantasyClient(1, 2026, use_cache=False, conditional=False)
+    params = {'view': ['mSettings', 'mTeam']}
+
+    print(f"{args.calls} calls per mode, {args.handshake * 1000:.0f} ms simulated handshake\n")
+
+    StubHandler.connections = 0
+    before = timed_calls(lambda: requests.get(client.endpoint, params=params, timeout=30).json(), args.calls)
+    report("requests.get per call", before, StubHandler.connections)
+
+    StubHandler.connections = 0
+    after = timed_calls(lambda: client._make_request(params=params), args.calls)
+    report("pooled keep-alive session", after, StubHandler.connections)
+
+    print(f"\nSpeedup: {statistics.mean(before) / statistics.mean(after):.1f}x per call")
+
+    client.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
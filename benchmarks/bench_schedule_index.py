@@ -0,0 +1,118 @@
+"""
+Per-query time of ScheduleIndex lookups against the DataFrame row masks they replaced
+
+    python benchmarks/bench_schedule_index.py --queries 2000
+    python benchmarks/bench_schedule_index.py --schedule data/team_schedules_2026_season.feather
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(ROOT, 'src'))
+
+from analyzers.schedule_index import ScheduleIndex
+from utils.storage import load_table
+
+
+def synthetic_season(teams: int = 30, games: int = 82, days: int = 170, seed: int = 0) -> pd.DataFrame:
+    """
+    teams x games schedule spread over a season of `days` days
+    """
+    rng = np.random.default_rng(seed)
+    start = pd.Timestamp('2025-10-21')
+    frames = []
+    for t in range(teams):
+        offsets = np.sort(rng.choice(days, size=games, replace=False))
+        frames.append(pd.DataFrame({
+            'Team': f'T{t:02d}',
+            'ParsedDate': start + pd.to_timedelta(offsets, unit='D'),
+            'HomeAway': rng.choice(['Home', 'Away'], size=games),
+            'IsBackToBack': np.r_[False, np.diff(offsets) == 1] | np.r_[np.diff(offsets) == 1, False],
+        }))
+    return pd.concat(frames, ignore_index=True)
+
+
+def mask_game_count(df, team, start, end):
+    mask = (df['Team'] == team) & (df['ParsedDate'] >= start) & (df['ParsedDate'] <= end)
+    return len(df[mask].sort_values('ParsedDate'))
+
+
+def mask_teams_on(df, date):
+    return sorted(df[df['ParsedDate'].dt.date == date.date()]['Team'].unique().tolist())
+
+
+def mask_weekly_breakdown(df):
+    first_monday = df['ParsedDate'].min() - pd.Timedelta(days=df['ParsedDate'].min().dayofweek)
+    weeks = []
+    monday = first_monday
+    while monday <= df['ParsedDate'].max():
+        mask = (df['ParsedDate'] >= monday) & (df['ParsedDate'] <= monday + pd.Timedelta(days=6))
+        weeks.append(df[mask].groupby('Team').size().to_dict())
+        monday += pd.Timedelta(days=7)
+    return weeks
+
+
+def timed(label, calls, old, new):
+    start = time.perf_counter()
+    for args in calls:
+        old(*args)
+    old_us = (time.perf_counter() - start) / len(calls) * 1e6
+
+    start = time.perf_counter()
+    for args in calls:
+        new(*args)
+    new_us = (time.perf_counter() - start) / len(calls) * 1e6
+
+    print(f"{label:<22} {old_us:>10,.1f} us {new_us:>10,.1f} us {old_us / new_us:>9,.0f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ScheduleIndex queries against DataFrame masks")
+    parser.add_argument('--queries', type=int, default=2000, help="Random queries per lookup type")
+    parser.add_argument('--schedule', help="Saved schedule table (default: synthetic 30 x 82 season)")
+    args = parser.parse_args()
+
+    if args.schedule:
+        df = load_table(args.schedule, parse_dates=['ParsedDate'])
+    else:
+        df = synthetic_season()
+    df = df[df['ParsedDate'].notna()].reset_index(drop=True)
+
+    start = time.perf_counter()
+    index = ScheduleIndex(df)
+    build_ms = (time.perf_counter() - start) * 1000
+    print(f"{len(df)} games, {len(index.teams)} teams, {index.num_days} days - index built in {build_ms:.1f} ms\n")
+
+    rng = random.Random(0)
+    first_day = pd.Timestamp(index.first_day)
+
+    def random_range():
+        start = first_day + pd.Timedelta(days=rng.randrange(index.num_days))
+        return start, start + pd.Timedelta(days=6)
+
+    ranges = [(rng.choice(index.teams),) + random_range() for _ in range(args.queries)]
+    dates = [(first_day + pd.Timedelta(days=rng.randrange(index.num_days)),) for _ in range(args.queries)]
+
+    print(f"{'query':<22} {'mask':>13} {'index':>13} {'speedup':>10}")
+    timed('team games (search)', ranges,
+          lambda team, s, e: mask_game_count(df, team, s, e),
+          lambda team, s, e: len(index.team_rows(team, s, e)))
+    timed('game count (cumsum)', ranges,
+          lambda team, s, e: mask_game_count(df, team, s, e),
+          index.game_count)
+    timed('teams on date', dates,
+          lambda date: mask_teams_on(df, date),
+          index.teams_on)
+    timed('weekly breakdown', [()] * max(1, args.queries // 100),
+          lambda: mask_weekly_breakdown(df),
+          lambda: index.by_week(index.games))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Rows per second of the stats-table parser backends on saved ESPN stats pages
+
+    python benchmarks/bench_stats_parser.py --rounds 20
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(ROOT, 'src'))
+
+from scrapers.stats_table_parser import get_stats_parser
+
+FIXTURES = os.path.join(ROOT, 'tests', 'fixtures', 'stats_pages')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark stats page parsing per backend")
+    parser.add_argument('--rounds', type=int, default=20, help="Passes over the fixture pages per backend")
+    parser.add_argument('--pages', default=FIXTURES, help="Directory of saved stats pages (*.html)")
+    args = parser.parse_args()
+
+    pages = []
+    for path in sorted(glob.glob(os.path.join(args.pages, '*.html'))):
+        with open(path, 'rb') as f:
+            pages.append(f.read())
+    print(f"{len(pages)} pages from {args.pages}, {args.rounds} rounds\n")
+
+    results = {}
+    for backend in ('bs4', 'lxml'):
+        try:
+            stats_parser = get_stats_parser(backend)
+        except ImportError as e:
+            print(f"{backend:<6} skipped ({e})")
+            continue
+
+        rows = 0
+        start = time.perf_counter()
+        for _ in range(args.rounds):
+            for content in pages:
+                page = stats_parser.parse_columns(content)
+                rows += len(page) if page else 0
+        elapsed = time.perf_counter() - start
+
+        results[backend] = rows / elapsed
+        print(f"{backend:<6} {rows:>7} rows in {elapsed:6.2f} s   {results[backend]:>9,.0f} rows/s")
+
+    if len(results) == 2:
+        print(f"\nlxml speedup: {results['lxml'] / results['bs4']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
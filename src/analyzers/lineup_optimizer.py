@@ -0,0 +1,135 @@
+from typing import Dict, List, Optional, Set
+
+import numpy as np
+
+
+# ESPN basketball lineup slot IDs (lineupSlotCounts keys, eligibleSlots values)
+LINEUP_SLOTS = {
+    0: 'PG',
+    1: 'SG',
+    2: 'SF',
+    3: 'PF',
+    4: 'C',
+    5: 'G',
+    6: 'F',
+    7: 'SG/SF',
+    8: 'G/F',
+    9: 'PF/C',
+    10: 'F/C',
+    11: 'UT',
+    12: 'BE',
+    13: 'IR',
+}
+BENCH_SLOT = 12
+IR_SLOT = 13
+
+# Starting slots by ESPN defaultPositionId (1 PG ... 5 C), for players without an eligibleSlots list
+POSITION_SLOTS = {
+    1: {0, 5, 8, 11},
+    2: {1, 5, 7, 8, 11},
+    3: {2, 6, 7, 8, 11},
+    4: {3, 6, 9, 10, 11},
+    5: {4, 9, 10, 11},
+}
+
+
+def eligible_slots(player: Dict) -> Set[int]:
+    """
+    Starting slots a roster player can fill
+
+    Args:
+        player: Roster entry from get_my_team (eligible_slots, position, lineup_slot)
+
+    Returns:
+        Set of starting slot IDs (empty for players parked on IR)
+    """
+    if player.get('lineup_slot') == IR_SLOT:
+        return set()
+    slots = player.get('eligible_slots') or POSITION_SLOTS.get(player.get('position'), {11})
+    return {int(slot) for slot in slots if int(slot) not in (BENCH_SLOT, IR_SLOT)}
+
+
+class LineupOptimizer:
+    """
+    Daily lineup solver: which players start, given the league's slot counts
+
+    A day's lineup is a bipartite matching between the players with a game and
+    the starting slots they are eligible for. A started game's value depends
+    only on the player, not on the slot, so matching players in order of value
+    with augmenting paths (Kuhn's algorithm) gives the best lineup exactly -
+    the sets of players that fit the slots form a transversal matroid, where
+    greedy by weight is optimal. With ~13 players and ~10 slots a day is a few
+    dozen Python steps, so no solver dependency is needed.
+    """
+
+    def __init__(self, roster_slots: Dict):
+        """
+        Initialize optimizer
+
+        Args:
+            roster_slots: lineupSlotCounts from get_league_info (slot ID -> count, keys may be strings)
+        """
+        self.slots: List[int] = []
+        for slot, count in sorted((int(slot), int(count)) for slot, count in (roster_slots or {}).items()):
+            if slot not in (BENCH_SLOT, IR_SLOT):
+                self.slots.extend([slot] * count)
+
+    def assign_day(self, eligible: List[Set[int]], values: List[float]) -> List[Optional[int]]:
+        """
+        Best lineup for one day
+
+        Args:
+            eligible: Starting slot IDs of each player with a game that day
+            values: Value of a started game for each player (higher starts first)
+
+        Returns:
+            Slot ID per player, None for players left on the bench
+        """
+        owner: List[Optional[int]] = [None] * len(self.slots)
+        options = [[i for i, slot in enumerate(self.slots) if slot in slots] for slots in eligible]
+
+        def place(player: int, seen: Set[int]) -> bool:
+            for i in options[player]:
+                if i in seen:
+                    continue
+                seen.add(i)
+                if owner[i] is None or place(owner[i], seen):
+                    owner[i] = player
+                    return True
+            return False
+
+        for player in sorted(range(len(eligible)), key=lambda p: -values[p]):
+            place(player, set())
+
+        assigned: List[Optional[int]] = [None] * len(eligible)
+        for i, player in enumerate(owner):
+            if player is not None:
+                assigned[player] = self.slots[i]
+        return assigned
+
+    def started_games(self, eligible: List[Set[int]], games: np.ndarray, values: List[float]) -> np.ndarray:
+        """
+        Games each player starts over a stretch of days
+
+        Args:
+            eligible: Starting slot IDs of each player
+            games: players x days games matrix (from ScheduleIndex.team_games)
+            values: Value of a started game for each player
+
+        Returns:
+            players x days matrix with only started games kept
+        """
+        if not self.slots:
+            # League without slot counts - every game counts
+            return games
+
+        started = np.zeros_like(games)
+        lineups = {}
+        for day in range(games.shape[1]):
+            playing = tuple(np.flatnonzero(games[:, day]))
+            if playing not in lineups:
+                lineups[playing] = self.assign_day([eligible[p] for p in playing], [values[p] for p in playing])
+            for p, slot in zip(playing, lineups[playing]):
+                if slot is not None:
+                    started[p, day] = games[p, day]
+        return started
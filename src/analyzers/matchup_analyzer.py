@@ -2,7 +2,7 @@ import pandas as pd
 import sys
 import os
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 from dotenv import load_dotenv
 
 # Add parent directory to path to import our modules
@@ -10,6 +10,15 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from scrapers.espn_fantasy_client import ESPNFantasyClient
 from analyzers.schedule_analyzer import ScheduleAnalyzer
+from analyzers.player_index import PlayerNameIndex
+from analyzers.projection_engine import (
+    ProjectionEngine, RosterProjection, LeagueProjection, DEFAULT_PROJECTED_STATS, ESPN_STAT_COLUMNS, RATIO_CATEGORIES, stat_column
+)
+from analyzers.matchup_simulator import MatchupSimulator
+from analyzers.streaming_optimizer import StreamingOptimizer
+from analyzers.lineup_optimizer import LineupOptimizer, eligible_slots
+from analyzers.recency_model import RecencyModel, recency_path
+from utils.storage import find_table, load_table
 
 
 class MatchupAnalyzer:
@@ -17,6 +26,19 @@ class MatchupAnalyzer:
     Analyzes current H2H category matchup with projections for rest of week
     """
     
+    # Views read by the analyzer: settings, team names, rosters and matchup scores
+    LEAGUE_VIEWS = ['mSettings', 'mTeam', 'mRoster', 'mMatchup', 'mMatchupScore']
+    
+    # Player stat columns used for projections - only these are read from the stats table
+    PLAYER_STAT_COLUMNS = ['Name', 'Team', 'PlayerID', 'GP', 'MIN', 'PTS', 'REB', 'AST', 'STL', 'BLK',
+                           '3PM', '3PA', 'FGM', 'FGA', 'FTM', 'FTA', 'TO']
+    
+    # Stats shown side by side by compare_with_opponent
+    COMPARISON_STATS = ['PTS', 'REB', 'AST', 'STL', 'BLK', '3PM', 'TO']
+    
+    # Points league weights used for the projected fantasy points
+    POINTS_WEIGHTS = {'PTS': 1.0, 'REB': 1.2, 'AST': 1.5, 'STL': 3.0, 'BLK': 3.0, '3PM': 0.5, 'TO': -1.0}
+    
     def __init__(self, league_id: int, team_id: int, year: int = 2025, 
                  espn_s2: str = None, swid: str = None):
         """
@@ -37,13 +59,30 @@ class MatchupAnalyzer:
         self.schedule_analyzer = ScheduleAnalyzer()
         
         # Load player stats
-        stats_file = "data/player_stats_2025_season.csv"
-        if not os.path.exists(stats_file):
+        stats_file = "data/player_stats_2025_season.feather"
+        if find_table(stats_file) is None:
             raise FileNotFoundError(f"Player stats file not found: {stats_file}")
         
-        self.player_stats = pd.read_csv(stats_file)
+        self.player_stats = load_table(stats_file, columns=self.PLAYER_STAT_COLUMNS)
         print(f"✓ Loaded {len(self.player_stats)} player stat records")
         
+        # This season's game logs, folded into recency-weighted averages by recency_model
+        # Season averages stay the prior, so early-season projections are not built on a few games
+        recency_file = recency_path(year)
+        if find_table(recency_file) is not None:
+            recency = RecencyModel.load(recency_file)
+            self.player_stats = recency.blend(self.player_stats)
+            print(f"✓ Using recency-weighted averages for {len(recency)} players with game logs")
+        else:
+            print(f"ℹ️  No game logs for {year} ({recency_file}) - projecting from season averages")
+        
+        # ESPN ID / normalized name -> stats row, so roster lookups are dict hits
+        self.player_index = PlayerNameIndex(self.player_stats)
+        
+        # Fetch every league view we need in one round trip
+        # get_league_info, get_my_team and the matchup scores all read from this snapshot
+        self.refresh()
+        
         # Get league info to determine scoring categories
         self.league_info = self.espn_client.get_league_info()
         raw_scoring_type = self.league_info.get('scoring_type')
@@ -57,39 +96,123 @@ class MatchupAnalyzer:
             self.scoring_type = raw_scoring_type
         
         # Check if scoring categories exist (definitive proof of H2H Category)
+        self.categories = []
         if 'scoring_categories' in self.league_info and self.league_info['scoring_categories']:
             self.scoring_type = 'H2H Category'
             self.categories = self.league_info['scoring_categories']
             print(f"✓ Detected H2H Category league with {len(self.categories)} categories")
         else:
             print(f"ℹ️  League type: {self.scoring_type} (raw: {raw_scoring_type})")
+        
+        # Per-game rate matrix for the standard stats plus whatever the league scores
+        self.category_names = [self._map_stat_id_to_column(cat['stat_id']) for cat in self.categories]
+        scored = [name for name in self.category_names if name in ESPN_STAT_COLUMNS.values()]
+        self.projection_engine = ProjectionEngine(self.player_stats, DEFAULT_PROJECTED_STATS + scored)
+        self.simulator = MatchupSimulator(self.projection_engine)
+        
+        # Daily lineups: only games a player can start in one of the league's slots count
+        self.lineup_optimizer = LineupOptimizer(self.league_info.get('roster_slots', {}))
+        self.lineup_weights = self._lineup_weights()
+    
+    def refresh(self, week: int = None) -> None:
+        """
+        Re-fetch league settings, rosters and matchup scores in a single request
+        
+        Args:
+            week: Specific week (optional - uses current if not provided)
+        """
+        self.espn_client.fetch_views(self.LEAGUE_VIEWS, scoring_period_id=week)
+    
+    def _lineup_weights(self) -> Dict[str, float]:
+        """
+        Per-game value weights deciding who starts when more players have games than slots
+        
+        Points leagues use the scoring weights. Category leagues weigh every scored
+        counting stat by 1 / its league-wide per-game average (negative for TO-like
+        categories), so no single category dominates.
+        """
+        counting = [cat for cat in self.categories
+                    if self._map_stat_id_to_column(cat['stat_id']) in self.projection_engine.columns]
+        if not counting:
+            return dict(self.POINTS_WEIGHTS)
+        
+        means = self.projection_engine.rates.mean(axis=0)
+        weights = {}
+        for cat in counting:
+            column = self._map_stat_id_to_column(cat['stat_id'])
+            mean = means[self.projection_engine.columns.index(column)]
+            if mean > 0:
+                weights[column] = (-1.0 if cat['is_negative'] else 1.0) / float(mean)
+        return weights
     
     def _map_stat_id_to_column(self, stat_id: int) -> str:
         """
-        Map ESPN's stat ID to our CSV column name
-        
-        Common stat IDs:
-        0: PTS, 1: BLK, 2: STL, 3: AST, 6: REB, 
-        11: TO, 13: FGM, 14: FGA, 15: FTM, 16: FTA,
-        17: 3PM, 18: 3PA
-        """
-        stat_map = {
-            0: 'PTS',
-            1: 'BLK', 
-            2: 'STL',
-            3: 'AST',
-            6: 'REB',
-            11: 'TO',
-            13: 'FGM',
-            14: 'FGA',
-            15: 'FTM',
-            16: 'FTA',
-            17: '3PM',
-            18: '3PA',
-            19: 'FG%',
-            20: 'FT%'
-        }
-        return stat_map.get(stat_id, f'STAT_{stat_id}')
+        Map ESPN's stat ID (int or string, as found in scoreByStat keys) to our stats column name
+        See ESPN_STAT_COLUMNS for the known IDs - unknown ones map to 'STAT_<id>'
+        """
+        return stat_column(stat_id)
+    
+    def _stat_totals(self, score_by_stat: Dict) -> Dict[str, float]:
+        """
+        Known stat columns -> value from a scoreByStat dictionary
+        """
+        totals = {}
+        for stat_id, stat in score_by_stat.items():
+            column = self._map_stat_id_to_column(stat_id)
+            value = stat.get('score') if isinstance(stat, dict) else stat
+            if column in ESPN_STAT_COLUMNS.values() and value is not None:
+                totals[column] = float(value)
+        return totals
+    
+    def _week_to_date(self, matchup: Dict, your_proj: RosterProjection, opp_proj: RosterProjection) -> Tuple[Dict[str, float], Dict[str, float]]:
+        """
+        Week-to-date totals for the simulators, keyed by stat column
+        
+        Counting categories use the current scores. Percentage categories need
+        made/attempted: ESPN's own totals when scoreByStat carries them, else
+        pseudo-counts - the roster's expected attempts over the games already
+        played this week, at the current percentage - so a percentage lead
+        weighs as much as the volume behind it.
+        
+        Args:
+            matchup: Result of get_current_matchup_scores
+            your_proj: Your roster projection
+            opp_proj: Opponent roster projection
+            
+        Returns:
+            Tuple of (your totals, opponent totals)
+        """
+        today = pd.Timestamp(datetime.now().date())
+        week_start = today - pd.Timedelta(days=today.weekday())
+        yesterday = today - pd.Timedelta(days=1)
+        
+        sides = []
+        for score_key, totals_key, projection in (('your_score', 'your_stat_totals', your_proj),
+                                                    ('opp_score', 'opp_stat_totals', opp_proj)):
+            reported = matchup.get(totals_key, {})
+            current = {}
+            played = None
+            for cat in matchup['category_breakdown']:
+                name = cat['category']
+                if name not in RATIO_CATEGORIES:
+                    current[name] = cat[score_key]
+                    continue
+                
+                made, attempted = RATIO_CATEGORIES[name]
+                if made in reported and attempted in reported:
+                    current[made], current[attempted] = reported[made], reported[attempted]
+                    continue
+                
+                # Expected attempts over the games each player's team has played since Monday
+                if played is None:
+                    games, _ = self.schedule_analyzer.index.team_games(projection.teams, week_start, yesterday)
+                    played = games.sum(axis=1)
+                attempts = float(self.projection_engine.values(projection.rows, {attempted: 1.0}) @ played)
+                current[attempted] = attempts
+                current[made] = cat[score_key] * attempts
+            sides.append(current)
+        
+        return sides[0], sides[1]
     
     def get_current_matchup_scores(self, week: int = None) -> Dict:
         """
@@ -102,15 +225,8 @@ class MatchupAnalyzer:
         Returns:
             Dictionary with matchup details and scores
         """
-        # Get matchup from ESPN API with detailed scoring view
-        params = {
-            'view': ['mMatchup', 'mMatchupScore']
-        }
-        
-        if week:
-            params['scoringPeriodId'] = week
-        
-        data = self.espn_client._make_request(params=params)
+        # Get matchup with detailed scoring view (served from the snapshot when possible)
+        data = self.espn_client._view_data(['mMatchup', 'mMatchupScore'], scoring_period_id=week)
         
         current_period = data.get('scoringPeriodId', week)
         schedule = data.get('schedule', [])
@@ -214,6 +330,10 @@ class MatchupAnalyzer:
                     'is_negative': is_negative
                 })
             
+            # Week-to-date totals of every stat ESPN reports, scored or not (made/attempted for percentages)
+            your_stat_totals = self._stat_totals(your_stats)
+            opp_stat_totals = self._stat_totals(opp_stats)
+            
             # Use calculated wins if totalPoints is 0
             if your_cats_won == 0 and opp_cats_won == 0:
                 your_cats_won = your_wins
@@ -227,8 +347,11 @@ class MatchupAnalyzer:
                 'categories_won': your_cats_won,
                 'categories_lost': opp_cats_won,
                 'categories_tied': ties,
+                'matchup_period': your_matchup.get('matchupPeriodId'),
                 'is_winning': your_cats_won > opp_cats_won,
-                'category_breakdown': category_breakdown
+                'category_breakdown': category_breakdown,
+                'your_stat_totals': your_stat_totals,
+                'opp_stat_totals': opp_stat_totals
             }
         else:
             # Points league (fallback)
@@ -240,6 +363,7 @@ class MatchupAnalyzer:
                 'scoring_type': 'Points',
                 'your_team_id': self.team_id,
                 'opponent_team_id': away.get('teamId') if is_home else home.get('teamId'),
+                'matchup_period': your_matchup.get('matchupPeriodId'),
                 'your_total_score': your_score,
                 'opponent_total_score': opp_score,
                 'is_winning': your_score > opp_score,
@@ -248,9 +372,10 @@ class MatchupAnalyzer:
         
         return result
     
-    def get_player_projections(self, roster: List[Dict], start_date: str, end_date: str) -> pd.DataFrame:
+    def project_roster(self, roster: List[Dict], start_date: str, end_date: str) -> RosterProjection:
         """
-        Project stats for your roster for remaining games in date range
+        Project stats for a roster's remaining games in a date range
+        Only games a player starts in the day's best lineup count (see LineupOptimizer)
         
         Args:
             roster: List of player dictionaries from get_my_team()
@@ -258,68 +383,191 @@ class MatchupAnalyzer:
             end_date: End date (YYYY-MM-DD)
             
         Returns:
-            DataFrame with projected stats per player
+            RosterProjection (per-player matrix + team totals) - players without stats are left out
+        """
+        players, teams, rows, eligible = self._resolve_roster(roster)
+        
+        # Remaining games per day for each player's team, then only the ones they start
+        games, _ = self.schedule_analyzer.index.team_games(teams, start_date, end_date)
+        values = self.projection_engine.values(rows, self.lineup_weights)
+        started = self.lineup_optimizer.started_games(eligible, games, values)
+        
+        # Projected stats = per-game averages * games started, for all players and stats at once
+        return self.projection_engine.project(rows, started.sum(axis=1), players, teams)
+    
+    def _resolve_roster(self, roster: List[Dict], verbose: bool = True) -> Tuple[List[str], List[str], List[int], List[Set[int]]]:
+        """
+        Match roster players to stats table rows
+        
+        Args:
+            roster: List of player dictionaries from get_my_team()
+            verbose: Print players without stats and players who changed teams
+            
+        Returns:
+            Tuple of (player names, pro teams, stats rows, eligible starting slots) for players with stats
         """
-        projections = []
+        players, teams, rows, eligible = [], [], [], []
         
         for player in roster:
             player_name = player['name']
             pro_team = self.espn_client.map_espn_team_to_abbr(player['pro_team_id'])
             
-            # Find player in stats CSV - try exact team match first
-            player_stats_row = self.player_stats[
-                (self.player_stats['Name'].str.lower() == player_name.lower()) &
-                (self.player_stats['Team'] == pro_team)
-            ]
-            
-            # If not found, try just name match (player changed teams)
-            if player_stats_row.empty:
-                player_stats_row = self.player_stats[
-                    self.player_stats['Name'].str.lower() == player_name.lower()
-                ]
-                
-                if not player_stats_row.empty:
-                    old_team = player_stats_row.iloc[0]['Team']
-                    print(f"ℹ️  Found {player_name} - was on {old_team}, now on {pro_team}")
-                else:
+            # Find player in stats table - by ESPN ID, then name, preferring the current team
+            row = self.player_index.find(player_name, pro_team, player.get('player_id'))
+            if row is None:
+                if verbose:
                     print(f"⚠️  Could not find stats for {player_name} (searched all teams)")
-                    continue
+                continue
+            
+            # Player changed teams since the stats were scraped
+            old_team = self.player_stats['Team'].iat[row]
+            if verbose and old_team != pro_team:
+                print(f"ℹ️  Found {player_name} - was on {old_team}, now on {pro_team}")
+            
+            players.append(player_name)
+            teams.append(pro_team)
+            rows.append(row)
+            eligible.append(eligible_slots(player))
+        
+        return players, teams, rows, eligible
+    
+    def matchup_dates(self, week: int = None) -> Tuple[str, str]:
+        """
+        Remaining date range of a matchup period
+        
+        Scoring periods are days, so period p falls (p - current period) days from
+        today. Days already played are left out; a finished period gives an empty range.
+        
+        Args:
+            week: Matchup period (optional - the one holding the current scoring period)
             
-            # Get per-game averages
-            stats = player_stats_row.iloc[0]
+        Returns:
+            Tuple of (start date, end date) as YYYY-MM-DD - today to Sunday when the
+            league settings do not list the period
+        """
+        today = datetime.now()
+        matchup_periods = self.league_info.get('matchup_periods') or {}
+        current = self.espn_client.get_current_scoring_period()
+        
+        if week is None and current is not None:
+            week = next((period for period, days in matchup_periods.items() if current in days), None)
+        
+        days = matchup_periods.get(week)
+        if not days or current is None:
+            week_end = today + timedelta(days=(6 - today.weekday()))
+            return today.strftime('%Y-%m-%d'), week_end.strftime('%Y-%m-%d')
+        
+        start = today + timedelta(days=max(min(days) - current, 0))
+        end = today + timedelta(days=max(days) - current)
+        return start.strftime('%Y-%m-%d'), end.strftime('%Y-%m-%d')
+    
+    def project_league(self, week: int = None, start_date: str = None, end_date: str = None) -> LeagueProjection:
+        """
+        Project every team in the league over the rest of a matchup period in one pass
+        
+        All rosters come from one mRoster response. Every rostered player's
+        schedule row, per-game value and projected stats are computed together;
+        only the daily lineup solve runs per team, since slots are per roster.
+        
+        Args:
+            week: Matchup period (optional - uses current if not provided, see matchup_dates)
+            start_date: Start date override (YYYY-MM-DD)
+            end_date: End date override (YYYY-MM-DD)
             
-            # Get remaining games for this player's team
-            games = self.schedule_analyzer.get_games_in_date_range(
-                pro_team, start_date, end_date
+        Returns:
+            LeagueProjection - category_matrix() gives the teams x categories table
+        """
+        if start_date is None or end_date is None:
+            period_start, period_end = self.matchup_dates(week)
+            start_date = start_date or period_start
+            end_date = end_date or period_end
+        
+        rosters = self.espn_client.get_all_rosters()
+        
+        team_ids, team_names, players, teams, rows, eligible = [], [], [], [], [], []
+        missing = 0
+        for team_id, team in rosters.items():
+            team_players, team_teams, team_rows, team_eligible = self._resolve_roster(team['roster'], verbose=False)
+            missing += len(team['roster']) - len(team_rows)
+            team_ids.append(team_id)
+            team_names.append(team['team_name'])
+            players.append(team_players)
+            teams.append(team_teams)
+            rows.append(team_rows)
+            eligible.append(team_eligible)
+        
+        if missing:
+            print(f"⚠️  No stats for {missing} rostered players - left out of the projections")
+        
+        # Schedule rows and lineup values for every rostered player at once
+        all_teams = [team for team_teams in teams for team in team_teams]
+        all_rows = [row for team_rows in rows for row in team_rows]
+        games, _ = self.schedule_analyzer.index.team_games(all_teams, start_date, end_date)
+        values = self.projection_engine.values(all_rows, self.lineup_weights)
+        
+        # Lineups are solved per roster; each team's slice of the shared matrices
+        started = []
+        offset = 0
+        for team_eligible in eligible:
+            size = len(team_eligible)
+            team_started = self.lineup_optimizer.started_games(
+                team_eligible, games[offset:offset + size], values[offset:offset + size]
             )
+            started.append(team_started.sum(axis=1))
+            offset += size
+        
+        return self.projection_engine.project_teams(team_ids, team_names, rows, started, players, teams)
+    
+    def print_league_projection(self, week: int = None, start_date: str = None, end_date: str = None) -> LeagueProjection:
+        """
+        Print projected category totals for every team over the rest of a matchup period
+        
+        Args:
+            week: Matchup period (optional - uses current if not provided)
+            start_date: Start date override (YYYY-MM-DD)
+            end_date: End date override (YYYY-MM-DD)
             
-            games_remaining = len(games)
-            
-            # Project stats = per-game avg * games remaining
-            projection = {
-                'Player': player_name,
-                'Team': pro_team,
-                'GamesRemaining': games_remaining,
-                'PTS': stats.get('PTS', 0) * games_remaining,
-                'REB': stats.get('REB', 0) * games_remaining,
-                'AST': stats.get('AST', 0) * games_remaining,
-                'STL': stats.get('STL', 0) * games_remaining,
-                'BLK': stats.get('BLK', 0) * games_remaining,
-                '3PM': stats.get('3PM', 0) * games_remaining,
-                'FGM': stats.get('FGM', 0) * games_remaining,
-                'FGA': stats.get('FGA', 0) * games_remaining,
-                'FTM': stats.get('FTM', 0) * games_remaining,
-                'FTA': stats.get('FTA', 0) * games_remaining,
-                'TO': stats.get('TO', 0) * games_remaining,
-                'FG%_Contribution': (stats.get('FGM', 0) * games_remaining, 
-                                     stats.get('FGA', 0) * games_remaining),
-                'FT%_Contribution': (stats.get('FTM', 0) * games_remaining,
-                                     stats.get('FTA', 0) * games_remaining)
-            }
+        Returns:
+            LeagueProjection for the range
+        """
+        league = self.project_league(week, start_date, end_date)
+        categories = [name for name in self.category_names if name in ESPN_STAT_COLUMNS.values()] or self.COMPARISON_STATS
+        matrix = league.category_matrix(categories)
+        
+        print("=" * 70)
+        print("LEAGUE PROJECTIONS")
+        print("=" * 70)
+        print(f"\n{'TEAM':<25}" + "".join(f"{name:>8}" for name in categories))
+        print("-" * (25 + 8 * len(categories)))
+        for _, team in matrix.iterrows():
+            cells = "".join(
+                f"{team[name]:>8.3f}" if name in RATIO_CATEGORIES else f"{team[name]:>8.1f}"
+                for name in categories
+            )
+            print(f"{str(team['Team'])[:24]:<25}{cells}")
+        
+        return league
+    
+    def get_player_projections(self, roster: List[Dict], start_date: str, end_date: str) -> pd.DataFrame:
+        """
+        Project stats for your roster for remaining games in date range
+        
+        Args:
+            roster: List of player dictionaries from get_my_team()
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD)
             
-            projections.append(projection)
+        Returns:
+            DataFrame with projected stats per player
+        """
+        projection = self.project_roster(roster, start_date, end_date)
+        if not projection.players:
+            return pd.DataFrame()
         
-        return pd.DataFrame(projections)
+        projections = projection.to_dataframe()
+        projections['FG%_Contribution'] = list(zip(projections['FGM'], projections['FGA']))
+        projections['FT%_Contribution'] = list(zip(projections['FTM'], projections['FTA']))
+        return projections
     
     def analyze_matchup(self, week: int = None) -> Dict:
         """
@@ -365,46 +613,43 @@ class MatchupAnalyzer:
         # Get your roster
         my_team = self.espn_client.get_my_team(self.team_id)
         
-        # Calculate date range for rest of week
-        today = datetime.now()
-        week_end = today + timedelta(days=(6 - today.weekday()))  # End on Sunday
+        # Rest of the matchup period (multi-week periods included)
+        start_date, end_date = self.matchup_dates(matchup.get('matchup_period'))
         
         # Project remaining stats
         print(f"\n{'=' * 70}")
         print(f"PROJECTIONS FOR REST OF WEEK")
-        print(f"Date Range: {today.strftime('%Y-%m-%d')} to {week_end.strftime('%Y-%m-%d')}")
+        print(f"Date Range: {start_date} to {end_date}")
         print(f"{'=' * 70}")
         
-        projections_df = self.get_player_projections(
-            my_team['roster'],
-            today.strftime('%Y-%m-%d'),
-            week_end.strftime('%Y-%m-%d')
-        )
+        projection = self.project_roster(my_team['roster'], start_date, end_date)
         
-        if projections_df.empty:
+        if not projection.players:
             print("⚠️  No projections available")
             return matchup
         
+        projections_df = projection.to_dataframe()
+        
         # Show detailed stats
         print("\nYOUR PROJECTED STATS (Rest of Week):")
-        print(f"Total Games Remaining: {projections_df['GamesRemaining'].sum()}")
+        print(f"Total Games Remaining: {int(projection.games.sum())}")
         print("\nCounting Stats:")
-        print(f"  Points:    {projections_df['PTS'].sum():>6.1f}")
-        print(f"  Rebounds:  {projections_df['REB'].sum():>6.1f}")
-        print(f"  Assists:   {projections_df['AST'].sum():>6.1f}")
-        print(f"  Steals:    {projections_df['STL'].sum():>6.1f}")
-        print(f"  Blocks:    {projections_df['BLK'].sum():>6.1f}")
-        print(f"  3-Pointers: {projections_df['3PM'].sum():>6.1f}")
-        print(f"  Turnovers: {projections_df['TO'].sum():>6.1f}")
+        print(f"  Points:    {projection.total('PTS'):>6.1f}")
+        print(f"  Rebounds:  {projection.total('REB'):>6.1f}")
+        print(f"  Assists:   {projection.total('AST'):>6.1f}")
+        print(f"  Steals:    {projection.total('STL'):>6.1f}")
+        print(f"  Blocks:    {projection.total('BLK'):>6.1f}")
+        print(f"  3-Pointers: {projection.total('3PM'):>6.1f}")
+        print(f"  Turnovers: {projection.total('TO'):>6.1f}")
         
         # Calculate percentage stats
-        total_fgm = projections_df['FGM'].sum()
-        total_fga = projections_df['FGA'].sum()
-        total_ftm = projections_df['FTM'].sum()
-        total_fta = projections_df['FTA'].sum()
+        total_fgm = projection.total('FGM')
+        total_fga = projection.total('FGA')
+        total_ftm = projection.total('FTM')
+        total_fta = projection.total('FTA')
         
-        fg_pct = (total_fgm / total_fga * 100) if total_fga > 0 else 0
-        ft_pct = (total_ftm / total_fta * 100) if total_fta > 0 else 0
+        fg_pct = projection.category_value('FG%') * 100
+        ft_pct = projection.category_value('FT%') * 100
         
         print("\nPercentage Stats:")
         print(f"  FG%: {fg_pct:.1f}% ({total_fgm:.0f}/{total_fga:.0f})")
@@ -427,20 +672,10 @@ class MatchupAnalyzer:
                 current_opp = cat['opp_score']
                 is_negative = cat['is_negative']
                 
-                # Map category name to projection column
-                proj_col = cat_name
-                if proj_col in projections_df.columns:
-                    proj_value = projections_df[proj_col].sum()
-                elif cat_name == 'FG%':
-                    proj_value = fg_pct / 100
-                    current_yours = current_yours  # Already a percentage
-                    current_opp = current_opp
-                elif cat_name == 'FT%':
-                    proj_value = ft_pct / 100
-                    current_yours = current_yours
-                    current_opp = current_opp
-                else:
+                # Categories without per-game data (unknown stat IDs) are not projected
+                if cat_name not in ESPN_STAT_COLUMNS.values():
                     continue
+                proj_value = projection.category_value(cat_name)
                 
                 # Project final scores (assuming opponent maintains pace)
                 # This is simplified - ideally we'd project opponent too
@@ -480,14 +715,8 @@ class MatchupAnalyzer:
         
         # Add projections to result
         matchup['projections'] = {
-            'total_games': int(projections_df['GamesRemaining'].sum()),
-            'PTS': float(projections_df['PTS'].sum()),
-            'REB': float(projections_df['REB'].sum()),
-            'AST': float(projections_df['AST'].sum()),
-            'STL': float(projections_df['STL'].sum()),
-            'BLK': float(projections_df['BLK'].sum()),
-            '3PM': float(projections_df['3PM'].sum()),
-            'TO': float(projections_df['TO'].sum()),
+            'total_games': int(projection.games.sum()),
+            **{stat: projection.total(stat) for stat in self.COMPARISON_STATS},
             'FG%': float(fg_pct),
             'FT%': float(ft_pct),
             'top_performers': top_performers.to_dict('records')
@@ -507,22 +736,25 @@ class MatchupAnalyzer:
         Returns:
             DataFrame with opponent's projected stats
         """
+        projection = self._project_opponent(opponent_team_id, start_date, end_date)
+        if projection is None or not projection.players:
+            return pd.DataFrame()
+        return projection.to_dataframe()
+    
+    def _project_opponent(self, opponent_team_id: int, start_date: str, end_date: str) -> Optional[RosterProjection]:
+        """
+        Project the opponent's roster, or None if their roster could not be fetched
+        """
         try:
             # Get opponent's roster
             opp_team = self.espn_client.get_my_team(opponent_team_id)
             
             # Project their stats using same method
-            opp_projections = self.get_player_projections(
-                opp_team['roster'],
-                start_date,
-                end_date
-            )
-            
-            return opp_projections
+            return self.project_roster(opp_team['roster'], start_date, end_date)
             
         except Exception as e:
             print(f"⚠️  Could not get opponent projections: {e}")
-            return pd.DataFrame()
+            return None
     
     def compare_with_opponent(self, week: int = None) -> Dict:
         """
@@ -543,73 +775,27 @@ class MatchupAnalyzer:
         if not matchup:
             return None
         
-        # Get date range
-        today = datetime.now()
-        week_end = today + timedelta(days=(6 - today.weekday()))
-        
-        # Get your projections
-        my_team = self.espn_client.get_my_team(self.team_id)
-        your_proj = self.get_player_projections(
-            my_team['roster'],
-            today.strftime('%Y-%m-%d'),
-            week_end.strftime('%Y-%m-%d')
-        )
-        
-        # Get opponent projections
-        opp_proj = self.get_opponent_projections(
-            matchup['opponent_team_id'],
-            today.strftime('%Y-%m-%d'),
-            week_end.strftime('%Y-%m-%d')
-        )
+        # Both rosters come out of the one league-wide projection over the rest of this matchup period
+        try:
+            league = self.project_league(matchup.get('matchup_period'))
+        except Exception as e:
+            print(f"⚠️  Could not get league projections: {e}")
+            return matchup
+        your_proj = league.rosters.get(self.team_id)
+        opp_proj = league.rosters.get(matchup['opponent_team_id'])
         
-        if your_proj.empty or opp_proj.empty:
+        if your_proj is None or not your_proj.players or opp_proj is None or not opp_proj.players:
             print("⚠️  Could not get complete projection data")
             return matchup
         
-        # Calculate totals
-        your_totals = {
-            'games': your_proj['GamesRemaining'].sum(),
-            'PTS': your_proj['PTS'].sum(),
-            'REB': your_proj['REB'].sum(),
-            'AST': your_proj['AST'].sum(),
-            'STL': your_proj['STL'].sum(),
-            'BLK': your_proj['BLK'].sum(),
-            '3PM': your_proj['3PM'].sum(),
-            'TO': your_proj['TO'].sum()
-        }
-        
-        opp_totals = {
-            'games': opp_proj['GamesRemaining'].sum(),
-            'PTS': opp_proj['PTS'].sum(),
-            'REB': opp_proj['REB'].sum(),
-            'AST': opp_proj['AST'].sum(),
-            'STL': opp_proj['STL'].sum(),
-            'BLK': opp_proj['BLK'].sum(),
-            '3PM': opp_proj['3PM'].sum(),
-            'TO': opp_proj['TO'].sum()
-        }
+        # Team totals come straight from each roster's games @ rates product
+        your_totals = {'games': your_proj.games.sum(), **your_proj.category_totals(self.COMPARISON_STATS)}
+        opp_totals = {'games': opp_proj.games.sum(), **opp_proj.category_totals(self.COMPARISON_STATS)}
         
         # Calculate fantasy points if Points league
         if self.scoring_type == 'Points':
-            your_proj_fpts = (
-                your_proj['PTS'] * 1.0 +
-                your_proj['REB'] * 1.2 +
-                your_proj['AST'] * 1.5 +
-                your_proj['STL'] * 3.0 +
-                your_proj['BLK'] * 3.0 +
-                your_proj['3PM'] * 0.5 +
-                your_proj['TO'] * -1.0
-            ).sum()
-            
-            opp_proj_fpts = (
-                opp_proj['PTS'] * 1.0 +
-                opp_proj['REB'] * 1.2 +
-                opp_proj['AST'] * 1.5 +
-                opp_proj['STL'] * 3.0 +
-                opp_proj['BLK'] * 3.0 +
-                opp_proj['3PM'] * 0.5 +
-                opp_proj['TO'] * -1.0
-            ).sum()
+            your_proj_fpts = sum(your_totals[stat] * weight for stat, weight in self.POINTS_WEIGHTS.items())
+            opp_proj_fpts = sum(opp_totals[stat] * weight for stat, weight in self.POINTS_WEIGHTS.items())
             
             your_final = matchup['your_total_score'] + your_proj_fpts
             opp_final = matchup['opponent_total_score'] + opp_proj_fpts
@@ -642,33 +828,155 @@ class MatchupAnalyzer:
         # Show detailed stats comparison
         print(f"\n{'STAT COMPARISON':<15} {'YOU':>12} {'OPP':>12} {'ADVANTAGE':>15}")
         print("-" * 70)
-        for stat in ['PTS', 'REB', 'AST', 'STL', 'BLK', '3PM', 'TO']:
+        for stat in self.COMPARISON_STATS:
             diff = your_totals[stat] - opp_totals[stat]
             advantage = f"{'+' if diff > 0 else ''}{diff:.1f}"
             print(f"{stat:<15} {your_totals[stat]:>12.1f} {opp_totals[stat]:>12.1f} {advantage:>15}")
         
+        # Simulated rest of week - category and overall win probabilities
+        if matchup['scoring_type'] == 'H2H Category':
+            matchup['simulation'] = self.simulate_matchup(your_proj, opp_proj, matchup)
+        
         print("\n" + "=" * 70)
         
         return matchup
+    
+    def simulate_matchup(self, your_proj: RosterProjection, opp_proj: RosterProjection, matchup: Dict) -> Dict:
         """
-        Side-by-side comparison of you vs opponent in each category
-        Includes current + projected final
+        Monte Carlo win probabilities for an H2H category matchup
+        
+        Week-to-date scores are added to every simulated week - percentages as
+        made/attempted totals (see _week_to_date).
+        
+        Args:
+            your_proj: Your roster projection (from project_roster)
+            opp_proj: Opponent roster projection
+            matchup: Result of get_current_matchup_scores
+            
+        Returns:
+            Simulation result (see MatchupSimulator.simulate)
+        """
+        categories = matchup['category_breakdown']
+        current_yours, current_opp = self._week_to_date(matchup, your_proj, opp_proj)
+        
+        result = self.simulator.simulate(your_proj, opp_proj, categories, current_yours, current_opp)
+        
+        print(f"\nWIN PROBABILITY ({result['trials']:,} simulated weeks)")
+        print(f"{'CATEGORY':<15} {'YOU':>12} {'OPP':>12} {'WIN %':>10}")
+        print("-" * 70)
+        for name, cat in result['categories'].items():
+            print(f"{name:<15} {cat['your_mean']:>12.3f} {cat['opp_mean']:>12.3f} {cat['win'] * 100:>9.1f}%")
+        
+        print(f"\nExpected categories won: {result['expected_categories_won']:.1f} of {len(result['categories'])}")
+        print(f"Matchup: {result['win_probability'] * 100:.1f}% win, {result['tie_probability'] * 100:.1f}% tie, "
+              f"{result['loss_probability'] * 100:.1f}% loss")
+        
+        return result
+    
+    def acquisitions_left(self, matchup_period: Optional[int], days_left: int) -> int:
+        """
+        Pickups still allowed in a matchup
+        
+        acquisitionLimit is a season total and matchupAcquisitionLimit a per-matchup
+        one (-1 = no limit); the used counts come from the team's transactionCounter.
+        Without any limit, at most one pickup per remaining day is planned.
+        
+        Args:
+            matchup_period: Matchup period ID (for the per-matchup count)
+            days_left: Days left in the matchup
+            
+        Returns:
+            Number of pickups left (0 or more)
+        """
+        team = next((t for t in self.espn_client.get_teams() if t['id'] == self.team_id), {})
+        season_limit = self.league_info.get('acquisition_limit', -1)
+        matchup_limit = self.league_info.get('matchup_acquisition_limit', -1)
+        
+        limits = []
+        if season_limit is not None and season_limit >= 0:
+            used = team.get('acquisitions', 0)
+            print(f"Season acquisitions: {used} of {season_limit} used")
+            limits.append(season_limit - used)
+        if matchup_limit is not None and matchup_limit >= 0:
+            used = team.get('matchup_acquisitions', {}).get(str(matchup_period), 0)
+            print(f"Matchup acquisitions: {used} of {matchup_limit} used")
+            limits.append(matchup_limit - used)
+        
+        return max(min(limits), 0) if limits else days_left
+    
+    def optimize_streaming(self, week: int = None, free_agent_count: int = 500) -> Dict:
+        """
+        Plan free-agent pickups for the rest of the week by their effect on category win probabilities
         
         Args:
             week: Specific week (optional)
+            free_agent_count: Free agents to fetch (most owned first, max ~2000)
             
         Returns:
-            DataFrame with category comparison
+            StreamingOptimizer.optimize result, or None if there is nothing to optimize
         """
-        # This would require getting opponent's roster too
-        # For now, just shows your projections
-        # TODO: Add opponent analysis when ESPN API provides that data
+        print("=" * 70)
+        print("STREAMING OPTIMIZER")
+        print("=" * 70)
         
-        print("⚠️  Opponent projections require additional API calls")
-        print("Currently showing only YOUR projections")
+        matchup = self.get_current_matchup_scores(week)
+        if not matchup or matchup['scoring_type'] != 'H2H Category':
+            print("⚠️  Streaming optimizer needs an H2H Category matchup")
+            return None
         
-        matchup = self.analyze_matchup(week)
-        return matchup
+        start_date, end_date = self.matchup_dates(matchup.get('matchup_period'))
+        
+        # Pickups left under the league's season and per-matchup limits
+        days_left = max((pd.Timestamp(end_date) - pd.Timestamp(start_date)).days + 1, 0)
+        acquisitions = self.acquisitions_left(matchup.get('matchup_period'), days_left)
+        print(f"Acquisitions available: {acquisitions}")
+        
+        my_team = self.espn_client.get_my_team(self.team_id)
+        your_proj = self.project_roster(my_team['roster'], start_date, end_date)
+        opp_proj = self._project_opponent(matchup['opponent_team_id'], start_date, end_date)
+        if not your_proj.players or opp_proj is None:
+            print("⚠️  Could not get complete projection data")
+            return None
+        
+        # Both sides count only the games their daily lineups start
+        players, teams, rows, eligible = self._resolve_roster(my_team['roster'], verbose=False)
+        roster = pd.DataFrame({'Player': players, 'Team': teams, 'Row': rows, 'Eligible': eligible})
+        
+        # Free agents with a stats row - players the stats table does not know cannot be projected
+        free_agents = self.espn_client.get_free_agents(size=free_agent_count)
+        candidates = []
+        for agent in free_agents.to_dict('records'):
+            team = self.espn_client.map_espn_team_to_abbr(agent['pro_team_id'])
+            row = self.player_index.find(agent['name'], team, agent.get('player_id'))
+            if row is not None:
+                candidates.append({'Player': agent['name'], 'Team': team, 'Row': row, 'Eligible': eligible_slots(agent)})
+        candidates = pd.DataFrame(candidates, columns=['Player', 'Team', 'Row', 'Eligible'])
+        print(f"Scoring {len(candidates)} free agents with stats against {len(roster)} roster players")
+        
+        categories = matchup['category_breakdown']
+        current_yours, current_opp = self._week_to_date(matchup, your_proj, opp_proj)
+        
+        optimizer = StreamingOptimizer(self.projection_engine, self.schedule_analyzer.index, categories,
+                                       self.lineup_optimizer, self.lineup_weights)
+        result = optimizer.optimize(roster, candidates, opp_proj, start_date, end_date, acquisitions,
+                                    current_yours, current_opp)
+        
+        baseline, final = result['baseline'], result['final']
+        print(f"\nCurrent outlook: {baseline['expected_categories_won']:.2f} categories, "
+              f"{baseline['win_probability'] * 100:.1f}% to win the week")
+        
+        if result['moves'].empty:
+            print("\nℹ No pickup improves your outlook - hold your roster")
+        else:
+            print(f"\n{'DAY':<12} {'DROP':<24} {'ADD':<24} {'GAMES':>7} {'WIN %':>8}")
+            print("-" * 79)
+            for move in result['moves'].to_dict('records'):
+                games = f"-{move['GamesLost']}/+{move['GamesAdded']}"
+                print(f"{move['Day']:<12} {move['Drop'][:23]:<24} {move['Add'][:23]:<24} {games:>7} {move['WinProbability'] * 100:>7.1f}%")
+            print(f"\nWith these moves: {final['expected_categories_won']:.2f} categories, "
+                  f"{final['win_probability'] * 100:.1f}% to win the week")
+        
+        return result
 
 
 def main():
@@ -704,13 +1012,21 @@ def main():
         print("=" * 70)
         print("\n1. Quick Analysis (your projections only)")
         print("2. Full Comparison (you vs opponent projections)")
+        print("3. Streaming Optimizer (best pickups for the rest of the week)")
+        print("4. League Projections (every team's rest of week)")
         print("\nNote: Option 2 provides complete win/loss prediction")
         
-        choice = input("\nSelect option (1 or 2): ").strip()
+        choice = input("\nSelect option (1-4): ").strip()
         
         if choice == "2":
             # Full comparison with opponent
             result = analyzer.compare_with_opponent()
+        elif choice == "3":
+            # Pickup plan for the rest of the week
+            result = analyzer.optimize_streaming()
+        elif choice == "4":
+            # Category totals for every team
+            result = {'league_projection': analyzer.print_league_projection()}
         else:
             # Quick analysis (default)
             result = analyzer.analyze_matchup()
@@ -0,0 +1,165 @@
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from analyzers.projection_engine import ProjectionEngine, RosterProjection, RATIO_CATEGORIES
+
+
+# Variance / mean of a per-game stat line. Points come in 2s and 3s, so a plain
+# Poisson count of points is about half as wide as real scoring - everything
+# else is treated as Poisson (ratio 1).
+DISPERSION = {'PTS': 2.0}
+
+
+class MatchupSimulator:
+    """
+    Monte Carlo win probabilities for an H2H category matchup
+
+    Each trial draws a stat line for every remaining game of every player on
+    both rosters: counting stats are Poisson (negative binomial for the
+    columns in DISPERSION) around the player's per-game average, and makes
+    are binomial draws over the simulated attempts at the player's shooting
+    percentage, so FG%/FT% come from simulated makes and attempts. Sums of
+    independent per-game draws have the same distribution as one draw with
+    games x average, so a player's week is drawn in one step - and for stats
+    that do not feed a percentage, the roster's week too (Poisson and
+    same-p negative binomial sums stay in the family). All trials are drawn
+    at once as (trials x players) arrays.
+    """
+
+    def __init__(self, engine: ProjectionEngine, trials: int = 10000, seed: Optional[int] = None):
+        """
+        Initialize simulator
+
+        Args:
+            engine: Projection engine holding the per-game rate matrix
+            trials: Simulated weeks per matchup
+            seed: Random seed (for reproducible runs)
+        """
+        if trials < 1:
+            raise ValueError("trials must be at least 1")
+
+        self.engine = engine
+        self.trials = trials
+        self.rng = np.random.default_rng(seed)
+
+    def _counts(self, means: np.ndarray, dispersion: float) -> np.ndarray:
+        # trials x players draws with the given means and variance = dispersion * mean
+        size = (self.trials, len(means))
+        if dispersion <= 1:
+            return self.rng.poisson(means, size=size)
+
+        # Negative binomial with n = mean / (d - 1), p = 1 / d has mean `mean` and variance d * mean
+        n = np.where(means > 0, means / (dispersion - 1), 1.0)
+        draws = self.rng.negative_binomial(n, 1 / dispersion, size=size)
+        return np.where(means > 0, draws, 0)
+
+    def simulate_totals(self, projection: RosterProjection) -> np.ndarray:
+        """
+        Simulated team totals for one roster
+
+        Args:
+            projection: Roster projection from ProjectionEngine.project
+
+        Returns:
+            trials x len(engine.columns) array of simulated totals
+        """
+        columns = self.engine.columns
+        rates = self.engine.rates[projection.rows]
+        means = projection.per_player
+        totals = np.zeros((self.trials, len(columns)), dtype=np.float64)
+
+        made_columns = {
+            made: attempted for made, attempted in RATIO_CATEGORIES.values()
+            if made in columns and attempted in columns
+        }
+        attempts = {}
+
+        for j, column in enumerate(columns):
+            if column in made_columns:
+                continue
+            if column in made_columns.values():
+                # Per-player attempts - each player's makes are drawn at their own percentage
+                attempts[column] = self._counts(means[:, j], DISPERSION.get(column, 1.0))
+                totals[:, j] = attempts[column].sum(axis=1)
+            else:
+                totals[:, j] = self._counts(means[:, j].sum(keepdims=True), DISPERSION.get(column, 1.0))[:, 0]
+
+        # Makes out of the simulated attempts, at each player's own percentage
+        for made, attempted in made_columns.items():
+            m, a = columns.index(made), columns.index(attempted)
+            pct = np.divide(rates[:, m], rates[:, a], out=np.zeros(len(rates)), where=rates[:, a] > 0)
+            totals[:, m] = self.rng.binomial(attempts[attempted], np.clip(pct, 0, 1)).sum(axis=1)
+
+        return totals
+
+    def _category_values(self, totals: np.ndarray, category: str, current: Dict[str, float]) -> np.ndarray:
+        columns = self.engine.columns
+        if category in RATIO_CATEGORIES:
+            made, attempted = RATIO_CATEGORIES[category]
+            made_total = totals[:, columns.index(made)] + current.get(made, 0)
+            attempted_total = totals[:, columns.index(attempted)] + current.get(attempted, 0)
+            return np.divide(made_total, attempted_total, out=np.zeros(len(totals)), where=attempted_total > 0)
+        return totals[:, columns.index(category)] + current.get(category, 0)
+
+    def simulate(self, yours: RosterProjection, opponent: RosterProjection, categories: List[Dict],
+                 current_yours: Dict[str, float] = None, current_opp: Dict[str, float] = None) -> Dict:
+        """
+        Simulate the rest of the week for both rosters
+
+        Args:
+            yours: Your roster projection
+            opponent: Opponent roster projection
+            categories: Scored categories as {'category': name, 'is_negative': bool}
+                        (categories the engine does not project are skipped)
+            current_yours: Week-to-date totals keyed by stat column - percentages
+                           need their made/attempted columns (e.g. 'FGM', 'FGA')
+            current_opp: Opponent week-to-date totals, same keys
+
+        Returns:
+            Dictionary with per-category win/tie/loss probabilities and mean
+            values, the overall win/tie/loss probabilities and the expected
+            number of categories won
+        """
+        current_yours = current_yours or {}
+        current_opp = current_opp or {}
+
+        your_totals = self.simulate_totals(yours)
+        opp_totals = self.simulate_totals(opponent)
+
+        projected = [
+            cat for cat in categories
+            if all(column in self.engine.columns for column in RATIO_CATEGORIES.get(cat['category'], (cat['category'],)))
+        ]
+
+        wins = np.zeros(self.trials, dtype=np.int32)
+        losses = np.zeros(self.trials, dtype=np.int32)
+        category_results = {}
+
+        for cat in projected:
+            name = cat['category']
+            your_values = self._category_values(your_totals, name, current_yours)
+            opp_values = self._category_values(opp_totals, name, current_opp)
+
+            margin = opp_values - your_values if cat.get('is_negative') else your_values - opp_values
+            won = margin > 0
+            lost = margin < 0
+            wins += won
+            losses += lost
+
+            category_results[name] = {
+                'win': float(won.mean()),
+                'tie': float((margin == 0).mean()),
+                'loss': float(lost.mean()),
+                'your_mean': float(your_values.mean()),
+                'opp_mean': float(opp_values.mean()),
+            }
+
+        return {
+            'trials': self.trials,
+            'categories': category_results,
+            'win_probability': float((wins > losses).mean()),
+            'tie_probability': float((wins == losses).mean()),
+            'loss_probability': float((wins < losses).mean()),
+            'expected_categories_won': float(wins.mean()),
+        }
@@ -0,0 +1,108 @@
+import re
+import unicodedata
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+
+# Generational suffixes dropped from names ("Jaren Jackson Jr." == "Jaren Jackson")
+NAME_SUFFIXES = {'jr', 'sr', 'ii', 'iii', 'iv'}
+
+
+def normalize_name(name: str) -> str:
+    """
+    Canonical form of a player name for matching across sources
+
+    Accents are stripped ("Jokić" -> "jokic"), case and punctuation are ignored
+    ("D'Angelo" -> "dangelo", "P.J." -> "pj") and suffixes are dropped.
+
+    Args:
+        name: Player name as shown by ESPN
+
+    Returns:
+        Normalized name ('' for missing names)
+    """
+    if not isinstance(name, str):
+        return ''
+    name = unicodedata.normalize('NFKD', name)
+    name = ''.join(ch for ch in name if not unicodedata.combining(ch)).lower()
+    name = re.sub(r"[.'’`]", '', name)
+    tokens = re.sub(r'[^a-z0-9]+', ' ', name).split()
+    while len(tokens) > 1 and tokens[-1] in NAME_SUFFIXES:
+        tokens.pop()
+    return ' '.join(tokens)
+
+
+class PlayerNameIndex:
+    """
+    Lookup from ESPN player ID or normalized name to stats table rows, built once at load
+
+    Each key maps to the row positions carrying it, in table order, so a lookup
+    is a dict hit plus a scan of (almost always) one row instead of a
+    lowercasing pass over the whole Name column.
+    """
+
+    def __init__(self, stats_df: pd.DataFrame):
+        """
+        Build the index
+
+        Args:
+            stats_df: Player stats with Name, Team and (optionally) PlayerID columns
+        """
+        self.teams: List[str] = stats_df['Team'].astype(str).tolist() if 'Team' in stats_df else [''] * len(stats_df)
+        self.by_name: Dict[str, List[int]] = {}
+        self.by_id: Dict[str, List[int]] = {}
+
+        for row, name in enumerate(stats_df['Name'].tolist()):
+            key = normalize_name(name)
+            if key:
+                self.by_name.setdefault(key, []).append(row)
+
+        if 'PlayerID' in stats_df:
+            for row, player_id in enumerate(stats_df['PlayerID'].tolist()):
+                key = self._id_key(player_id)
+                if key:
+                    self.by_id.setdefault(key, []).append(row)
+
+    @staticmethod
+    def _id_key(player_id) -> Optional[str]:
+        # IDs come back as ints from the fantasy API and as text (or floats, via CSV) from the stats table
+        if player_id is None or (isinstance(player_id, float) and player_id != player_id):
+            return None
+        text = str(player_id).strip()
+        if text.endswith('.0'):
+            text = text[:-2]
+        return text or None
+
+    def _pick(self, rows: List[int], team: Optional[str]) -> int:
+        # Prefer the row for the player's current team, else the first one
+        if team is not None:
+            for row in rows:
+                if self.teams[row] == team:
+                    return row
+        return rows[0]
+
+    def find(self, name: str = None, team: str = None, player_id=None) -> Optional[int]:
+        """
+        Row position of a player in the stats table
+
+        The ESPN player ID is tried first, then the normalized name. Among rows
+        with the same key, the one for `team` wins.
+
+        Args:
+            name: Player name
+            team: Current team abbreviation (optional)
+            player_id: ESPN player ID (optional)
+
+        Returns:
+            Row position, or None if the player is not in the table
+        """
+        rows = self.by_id.get(self._id_key(player_id)) if player_id is not None else None
+        if not rows:
+            rows = self.by_name.get(normalize_name(name))
+        if not rows:
+            return None
+        return self._pick(rows, team)
+
+    def __len__(self) -> int:
+        return len(self.by_name)
@@ -0,0 +1,273 @@
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+# ESPN fantasy stat ID -> stats table column (shared by everything that reads scoring categories)
+ESPN_STAT_COLUMNS = {
+    0: 'PTS',
+    1: 'BLK',
+    2: 'STL',
+    3: 'AST',
+    6: 'REB',
+    11: 'TO',
+    13: 'FGM',
+    14: 'FGA',
+    15: 'FTM',
+    16: 'FTA',
+    17: '3PM',
+    18: '3PA',
+    19: 'FG%',
+    20: 'FT%',
+    21: '3P%',
+}
+
+# Percentage categories and the (made, attempted) counting columns they are computed from
+RATIO_CATEGORIES = {
+    'FG%': ('FGM', 'FGA'),
+    'FT%': ('FTM', 'FTA'),
+    '3P%': ('3PM', '3PA'),
+}
+
+# Counting stats projected when no category list is given (standard 9-cat plus makes/attempts)
+DEFAULT_PROJECTED_STATS = ['PTS', 'REB', 'AST', 'STL', 'BLK', '3PM', 'FGM', 'FGA', 'FTM', 'FTA', 'TO']
+
+
+def stat_column(stat_id) -> str:
+    """
+    Stats table column for an ESPN stat ID (int or string), 'STAT_<id>' if unknown
+    """
+    try:
+        return ESPN_STAT_COLUMNS.get(int(stat_id), f'STAT_{stat_id}')
+    except (TypeError, ValueError):
+        return f'STAT_{stat_id}'
+
+
+def counting_columns(categories: Iterable[str]) -> List[str]:
+    """
+    Counting stat columns needed to project a list of categories
+
+    Percentage categories expand to their made/attempted columns.
+
+    Args:
+        categories: Category names (e.g., ['PTS', 'FG%', 'TO'])
+
+    Returns:
+        Column names in first-use order, without duplicates
+    """
+    columns = []
+    for category in categories:
+        for column in RATIO_CATEGORIES.get(category, (category,)):
+            if column not in columns:
+                columns.append(column)
+    return columns
+
+
+@dataclass
+class RosterProjection:
+    """
+    Projected stats for one roster: a players x columns matrix plus team totals
+    """
+    players: List[str]
+    teams: List[str]
+    rows: np.ndarray
+    games: np.ndarray
+    columns: List[str]
+    per_player: np.ndarray
+    totals: np.ndarray
+
+    def total(self, column: str) -> float:
+        """
+        Team total for a counting column (0.0 if it is not projected)
+        """
+        if column not in self.columns:
+            return 0.0
+        return float(self.totals[self.columns.index(column)])
+
+    def category_value(self, category: str) -> float:
+        """
+        Projected team value for a category - percentages are made / attempted over the whole roster
+        """
+        if category in RATIO_CATEGORIES:
+            made, attempted = RATIO_CATEGORIES[category]
+            attempts = self.total(attempted)
+            return self.total(made) / attempts if attempts > 0 else 0.0
+        return self.total(category)
+
+    def category_totals(self, categories: Iterable[str]) -> Dict[str, float]:
+        """
+        Projected team value for each category
+        """
+        return {category: self.category_value(category) for category in categories}
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Per-player projections: Player, Team, GamesRemaining, then one column per projected stat
+        """
+        df = pd.DataFrame(self.per_player, columns=self.columns)
+        df.insert(0, 'Player', self.players)
+        df.insert(1, 'Team', self.teams)
+        df.insert(2, 'GamesRemaining', self.games.astype(int))
+        return df
+
+
+@dataclass
+class LeagueProjection:
+    """
+    Projected stats for every team in a league: a teams x columns totals matrix plus each roster's projection
+    """
+    team_ids: List[int]
+    team_names: List[str]
+    columns: List[str]
+    totals: np.ndarray
+    rosters: Dict[int, RosterProjection]
+
+    def category_matrix(self, categories: Iterable[str]) -> pd.DataFrame:
+        """
+        Teams x categories projected values, indexed by team ID
+
+        Percentages are each team's made / attempted; categories without
+        projected columns come out as 0.
+        """
+        def column(name: str) -> np.ndarray:
+            if name not in self.columns:
+                return np.zeros(len(self.team_ids))
+            return self.totals[:, self.columns.index(name)]
+
+        values = {}
+        for category in categories:
+            if category in RATIO_CATEGORIES:
+                made, attempted = (column(name) for name in RATIO_CATEGORIES[category])
+                values[category] = np.divide(made, attempted, out=np.zeros(len(made)), where=attempted > 0)
+            else:
+                values[category] = column(category)
+
+        df = pd.DataFrame(values, index=pd.Index(self.team_ids, name='TeamID'))
+        df.insert(0, 'Team', self.team_names)
+        return df
+
+
+class ProjectionEngine:
+    """
+    Projects rosters from per-game averages with one matrix product per roster
+
+    The stats table is turned into a dense players x columns float matrix once.
+    A roster is then an array of row positions plus a games-remaining vector:
+    per-player projections are rates[rows] * games[:, None] and team totals are
+    games @ rates[rows], for however many categories the league scores.
+    """
+
+    def __init__(self, stats_df: pd.DataFrame, categories: Optional[Iterable[str]] = None):
+        """
+        Build the rate matrix
+
+        Args:
+            stats_df: Per-game averages, one row per player
+            categories: Category names to project (default: DEFAULT_PROJECTED_STATS)
+        """
+        self.columns = counting_columns(categories or DEFAULT_PROJECTED_STATS)
+
+        missing = [column for column in self.columns if column not in stats_df.columns]
+        if missing:
+            print(f"⚠️  No per-game data for {', '.join(missing)} - projected as 0")
+
+        self.rates = np.zeros((len(stats_df), len(self.columns)), dtype=np.float64)
+        for j, column in enumerate(self.columns):
+            if column in stats_df.columns:
+                self.rates[:, j] = pd.to_numeric(stats_df[column], errors='coerce').fillna(0).to_numpy(dtype=np.float64)
+
+    def values(self, rows: Iterable[int], weights: Dict[str, float]) -> np.ndarray:
+        """
+        Weighted per-game value of players (projected columns missing from weights count 0)
+
+        Args:
+            rows: Stats table row positions
+            weights: Column name -> weight
+
+        Returns:
+            Value per row
+        """
+        w = np.array([weights.get(column, 0.0) for column in self.columns])
+        return self.rates[np.asarray(rows, dtype=np.intp)] @ w
+
+    def project(self, rows: Iterable[int], games: Iterable[float], players: List[str] = None,
+                teams: List[str] = None) -> RosterProjection:
+        """
+        Project one roster
+
+        Args:
+            rows: Stats table row position of each player
+            games: Games remaining for each player
+            players: Player names (for to_dataframe)
+            teams: Team abbreviations (for to_dataframe)
+
+        Returns:
+            RosterProjection with per-player and team totals
+        """
+        rows = np.asarray(rows, dtype=np.intp)
+        games = np.asarray(games, dtype=np.float64)
+        roster_rates = self.rates[rows]
+
+        return RosterProjection(
+            players=list(players) if players is not None else [''] * len(rows),
+            teams=list(teams) if teams is not None else [''] * len(rows),
+            rows=rows,
+            games=games,
+            columns=self.columns,
+            per_player=roster_rates * games[:, None],
+            totals=games @ roster_rates,
+        )
+
+    def project_teams(self, team_ids: List[int], team_names: List[str], rows: List[np.ndarray],
+                      games: List[np.ndarray], players: List[List[str]] = None,
+                      teams: List[List[str]] = None) -> LeagueProjection:
+        """
+        Project several rosters in one pass
+
+        All players of all rosters are stacked into one rows/games array, so the
+        per-player products are a single array operation and team totals a
+        single segmented sum.
+
+        Args:
+            team_ids: Fantasy team IDs
+            team_names: Fantasy team names
+            rows: Stats table row positions per roster
+            games: Games counted per player, per roster
+            players: Player names per roster (optional)
+            teams: Pro team abbreviations per roster (optional)
+
+        Returns:
+            LeagueProjection with the teams x columns totals matrix
+        """
+        sizes = [len(r) for r in rows]
+        all_rows = np.concatenate([np.asarray(r, dtype=np.intp) for r in rows]) if rows else np.empty(0, dtype=np.intp)
+        all_games = np.concatenate([np.asarray(g, dtype=np.float64) for g in games]) if games else np.empty(0)
+        owner = np.repeat(np.arange(len(team_ids)), sizes)
+
+        per_player = self.rates[all_rows] * all_games[:, None]
+        totals = np.zeros((len(team_ids), len(self.columns)), dtype=np.float64)
+        np.add.at(totals, owner, per_player)
+
+        rosters = {}
+        bounds = np.concatenate([[0], np.cumsum(sizes)]).astype(np.intp)
+        for t, team_id in enumerate(team_ids):
+            lo, hi = bounds[t], bounds[t + 1]
+            rosters[team_id] = RosterProjection(
+                players=list(players[t]) if players is not None else [''] * (hi - lo),
+                teams=list(teams[t]) if teams is not None else [''] * (hi - lo),
+                rows=all_rows[lo:hi],
+                games=all_games[lo:hi],
+                columns=self.columns,
+                per_player=per_player[lo:hi],
+                totals=totals[t],
+            )
+
+        return LeagueProjection(
+            team_ids=list(team_ids),
+            team_names=list(team_names),
+            columns=self.columns,
+            totals=totals,
+            rosters=rosters,
+        )
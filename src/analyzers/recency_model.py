@@ -0,0 +1,270 @@
+import argparse
+import os
+import sys
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+from dotenv import load_dotenv
+
+# Add parent directory to path to import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scrapers.espn_fantasy_client import ESPNFantasyClient
+from scrapers.espn_game_log_scraper import ESPNGameLogScraper, GAME_LOG_COLUMNS
+from utils.storage import find_table, load_table, save_table, table_path
+
+
+class RecencyModel:
+    """
+    Exponentially weighted per-game averages, updated incrementally from new games
+
+    Each player's state is a decayed weighted sum per stat plus the decayed
+    weight W. A new game x updates it as S = decay * S + x, W = decay * W + 1,
+    and the average is S / W - O(1) work per game and per stat, so the nightly
+    update costs the new games, not the whole log. A batch of k games is folded
+    in at once: old state scaled by decay^k plus each game weighted by decay^age.
+
+    Games at or before a player's last folded-in scoring period are skipped,
+    so feeding the same lines (or the whole log) twice is harmless.
+    """
+
+    def __init__(self, half_life: float = 10.0, columns: List[str] = None):
+        """
+        Initialize an empty model
+
+        Args:
+            half_life: Games after which a game counts half as much as the latest one
+            columns: Stat columns to average (default: GAME_LOG_COLUMNS)
+        """
+        if half_life <= 0:
+            raise ValueError("half_life must be positive")
+
+        self.half_life = float(half_life)
+        self.decay = 0.5 ** (1 / self.half_life)
+        self.columns = list(columns or GAME_LOG_COLUMNS)
+        self.state = pd.DataFrame(
+            {
+                'Name': pd.Series(dtype=object),
+                'Team': pd.Series(dtype=object),
+                'Games': pd.Series(dtype=np.int32),
+                'LastPeriod': pd.Series(dtype=np.int32),
+                'Weight': pd.Series(dtype=np.float64),
+                **{column: pd.Series(dtype=np.float64) for column in self.columns},
+            },
+            index=pd.Index([], dtype=np.int64, name='PlayerID'),
+        )
+
+    def __len__(self) -> int:
+        return len(self.state)
+
+    @classmethod
+    def load(cls, filepath: str) -> 'RecencyModel':
+        """
+        Load a saved model state (see save)
+        """
+        df = load_table(filepath)
+        columns = [column for column in df.columns if column not in ('PlayerID', 'Name', 'Team', 'Games', 'LastPeriod', 'Weight', 'HalfLife')]
+        model = cls(float(df['HalfLife'].iat[0]) if len(df) else 10.0, columns)
+        state = df.drop(columns='HalfLife').set_index('PlayerID')
+        state.index = state.index.astype(np.int64)
+        model.state = state[model.state.columns]
+        return model
+
+    def save(self, filepath: str) -> str:
+        """
+        Save the model state - one row per player, with the half-life alongside
+
+        Returns:
+            Path the state was written to
+        """
+        df = self.state.reset_index()
+        df['HalfLife'] = self.half_life
+        return save_table(df, filepath)
+
+    def update(self, games: pd.DataFrame) -> int:
+        """
+        Fold new game lines into the averages
+
+        Args:
+            games: Game lines with PlayerID, Name, Team, ScoringPeriod and stat columns
+
+        Returns:
+            Number of games folded in
+        """
+        if games is None or games.empty:
+            return 0
+
+        games = games.sort_values(['PlayerID', 'ScoringPeriod'], kind='stable')
+        ids = games['PlayerID'].to_numpy(dtype=np.int64)
+
+        # Skip games the state already holds
+        last = self.state['LastPeriod'].reindex(ids).fillna(-1).to_numpy()
+        games = games[games['ScoringPeriod'].to_numpy() > last]
+        games = games.drop_duplicates(['PlayerID', 'ScoringPeriod'], keep='last')
+        if games.empty:
+            return 0
+        ids = games['PlayerID'].to_numpy(dtype=np.int64)
+
+        # Weight of each new game = decay ** (newer games of the same player in this batch)
+        by_player = games.groupby(ids, sort=False)
+        age = by_player.cumcount(ascending=False).to_numpy()
+        weights = self.decay ** age
+        values = games.reindex(columns=self.columns, fill_value=0).to_numpy(dtype=np.float64)
+
+        batch = pd.DataFrame(values * weights[:, None], columns=self.columns, index=ids)
+        batch['Weight'] = weights
+        sums = batch.groupby(level=0).sum()
+        counts = by_player.size()
+        latest = by_player[['Name', 'Team', 'ScoringPeriod']].last()
+
+        # Old state decays by decay ** k for a player with k new games
+        state = self.state.reindex(self.state.index.union(sums.index))
+        new_players = state['Games'].isna()
+        state.loc[new_players, ['Games', 'LastPeriod', 'Weight'] + self.columns] = 0
+
+        k = counts.reindex(state.index, fill_value=0).to_numpy()
+        scale = self.decay ** k
+        summed = ['Weight'] + self.columns
+        state[summed] = state[summed].to_numpy(dtype=np.float64) * scale[:, None] + \
+            sums[summed].reindex(state.index, fill_value=0).to_numpy()
+        state['Games'] = state['Games'].to_numpy(dtype=np.int64) + k
+
+        state.loc[latest.index, 'Name'] = latest['Name'].to_numpy()
+        state.loc[latest.index, 'Team'] = latest['Team'].to_numpy()
+        # Whole-column assignment: pandas will not upcast the int32 column in place for int64 input
+        last_period = state['LastPeriod'].to_numpy(dtype=np.int64)
+        last_period[state.index.get_indexer(latest.index)] = latest['ScoringPeriod'].to_numpy(dtype=np.int64)
+        state['LastPeriod'] = last_period
+
+        state.index.name = 'PlayerID'
+        self.state = state.astype({'Games': np.int32, 'LastPeriod': np.int32})
+        return len(games)
+
+    def averages(self) -> pd.DataFrame:
+        """
+        Recency-weighted per-game averages: PlayerID, Name, Team, GP (games logged), then the stat columns
+        """
+        weight = self.state['Weight'].to_numpy()
+        values = self.state[self.columns].to_numpy() / np.where(weight > 0, weight, 1)[:, None]
+
+        df = pd.DataFrame(values, columns=self.columns)
+        df.insert(0, 'PlayerID', self.state.index.astype(str))
+        df.insert(1, 'Name', self.state['Name'].to_numpy())
+        df.insert(2, 'Team', self.state['Team'].to_numpy())
+        df.insert(3, 'GP', self.state['Games'].to_numpy())
+        return df
+
+    def blend(self, season_stats: pd.DataFrame, prior_games: float = 5.0) -> pd.DataFrame:
+        """
+        Season stats table with recency-weighted averages where game logs exist
+
+        Season averages act as a prior worth `prior_games` games, so a player
+        with two logged games is not projected from those two alone. Matched
+        players take their current team from the log; logged players missing
+        from the season table (rookies) are appended with their log averages.
+
+        Args:
+            season_stats: Per-game season averages (Name, Team, PlayerID, stat columns)
+            prior_games: Weight of the season average, in games
+
+        Returns:
+            Stats table in the season table's column layout
+        """
+        stats = season_stats.copy()
+        if self.state.empty:
+            return stats
+
+        if 'PlayerID' in stats:
+            keys = pd.to_numeric(stats['PlayerID'], errors='coerce')
+        else:
+            keys = pd.Series(np.nan, index=stats.index)
+        matched = keys.isin(self.state.index).to_numpy()
+        logged = self.state.loc[keys[matched].astype(np.int64)]
+
+        weight = logged['Weight'].to_numpy()
+        for column in self.columns:
+            if column not in stats:
+                continue
+            values = pd.to_numeric(stats[column], errors='coerce').astype(np.float64)
+            prior = values[matched].fillna(0).to_numpy()
+            values[matched] = (logged[column].to_numpy() + prior_games * prior) / (weight + prior_games)
+            stats[column] = values
+
+        if 'Team' in stats:
+            stats.loc[matched, 'Team'] = logged['Team'].to_numpy()
+
+        # Logged players the season table does not have
+        known = set(keys[matched].astype(np.int64))
+        extra = self.averages()
+        extra = extra[[int(player_id) not in known for player_id in extra['PlayerID']]]
+        if not extra.empty:
+            stats = pd.concat([stats, extra.reindex(columns=stats.columns)], ignore_index=True)
+
+        return stats
+
+
+def recency_path(season: int, data_dir: str = "data") -> str:
+    """
+    Path of the saved model state for a season
+    """
+    return table_path(f"player_recency_{season}_season", data_dir)
+
+
+def update_model(scraper: ESPNGameLogScraper, new_lines: pd.DataFrame, half_life: float = 10.0,
+                 filepath: Optional[str] = None) -> RecencyModel:
+    """
+    Fold freshly ingested game lines into the saved model (built from the whole log the first time)
+
+    Args:
+        scraper: Game log scraper holding the log table
+        new_lines: Lines returned by the scraper's ingest/refresh
+        half_life: Half-life in games for a new model
+        filepath: Model state path (default: recency_path(scraper.season))
+
+    Returns:
+        The updated model
+    """
+    filepath = filepath or recency_path(scraper.season)
+
+    if find_table(filepath) is None:
+        model = RecencyModel(half_life)
+        new_lines = scraper.load()
+    else:
+        model = RecencyModel.load(filepath)
+
+    folded = model.update(new_lines)
+    model.save(filepath)
+    print(f"✓ Folded {folded} games into recency averages for {len(model)} players ({filepath})")
+    return model
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ingest new game logs and update the recency-weighted averages")
+    parser.add_argument('--fixture', help="Saved kona_player_info JSON or game log table to ingest instead of ESPN")
+    parser.add_argument('--season', type=int, default=2026, help="Season year (ending year)")
+    parser.add_argument('--half-life', type=float, default=10.0, help="Half-life in games for a new model")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("RECENCY-WEIGHTED PLAYER AVERAGES")
+    print("=" * 60)
+
+    if args.fixture:
+        scraper = ESPNGameLogScraper(season=args.season)
+        new_lines = scraper.ingest_fixture(args.fixture)
+    else:
+        load_dotenv()
+        client = ESPNFantasyClient(int(os.getenv('LEAGUE_ID') or 265333986), args.season,
+                                   os.getenv('ESPN_S2'), os.getenv('SWID'))
+        scraper = ESPNGameLogScraper(client, season=args.season)
+        new_lines = scraper.refresh()
+
+    model = update_model(scraper, new_lines, args.half_life)
+    top = model.averages().nlargest(10, 'PTS')
+    print("\nTop recent scorers:")
+    print(top[['Name', 'Team', 'GP', 'PTS', 'REB', 'AST']].round(1).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
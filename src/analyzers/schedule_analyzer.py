@@ -2,26 +2,39 @@ import pandas as pd
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple
 import os
+import sys
+
+# Add parent directory to path to import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.storage import find_table, load_table
+from analyzers.schedule_index import ScheduleIndex
 
 class ScheduleAnalyzer:
     """
     Analyzes NBA team schedules for fantasy basketball streaming strategies
     """
     
-    def __init__(self, schedule_filepath: str = "data/team_schedules_2026_season.csv"):
+    def __init__(self, schedule_filepath: str = "data/team_schedules_2026_season.feather"):
         """
         Initialize analyzer with schedule data
         
         Args:
-            schedule_filepath: Path to the schedule CSV file
+            schedule_filepath: Path to the schedule table (Feather/Parquet, or a legacy CSV)
         """
-        if not os.path.exists(schedule_filepath):
+        if find_table(schedule_filepath) is None:
             raise FileNotFoundError(f"Schedule file not found: {schedule_filepath}")
         
-        self.schedule_df = pd.read_csv(schedule_filepath)
+        # Memory-mapped Feather load keeps ParsedDate as datetime64
+        # (only a CSV fallback still needs the date column parsed)
+        self.schedule_df = load_table(schedule_filepath, parse_dates=['ParsedDate'])
         
-        # Convert ParsedDate to datetime
-        self.schedule_df['ParsedDate'] = pd.to_datetime(self.schedule_df['ParsedDate'])
+        # Team x day game matrix + per-team sorted dates - every range query below is a lookup
+        self.index = ScheduleIndex(self.schedule_df)
+        
+        # Team x week breakdown, computed on first use and shared by every weekly report
+        self._weekly_breakdown = None
+        self._team_trends = None
         
         print(f"Loaded schedule: {len(self.schedule_df)} games, {self.schedule_df['Team'].nunique()} teams")
         print(f"Date range: {self.schedule_df['ParsedDate'].min()} to {self.schedule_df['ParsedDate'].max()}")
@@ -40,12 +53,7 @@ class ScheduleAnalyzer:
             >>> analyzer.get_teams_playing_on('2025-10-22')
             ['ATL', 'BOS', 'LAL', ...]
         """
-        target_date = pd.to_datetime(date).date()
-        
-        games = self.schedule_df[self.schedule_df['ParsedDate'].dt.date == target_date]
-        teams = games['Team'].unique().tolist()
-        
-        return sorted(teams)
+        return self.index.teams_on(pd.to_datetime(date))
     
     def get_games_in_date_range(self, team: str, start_date: str, end_date: str) -> pd.DataFrame:
         """
@@ -62,16 +70,8 @@ class ScheduleAnalyzer:
         Example:
             >>> analyzer.get_games_in_date_range('ATL', '2025-10-22', '2025-10-28')
         """
-        start = pd.to_datetime(start_date)
-        end = pd.to_datetime(end_date)
-        
-        mask = (
-            (self.schedule_df['Team'] == team.upper()) &
-            (self.schedule_df['ParsedDate'] >= start) &
-            (self.schedule_df['ParsedDate'] <= end)
-        )
-        
-        return self.schedule_df[mask].sort_values('ParsedDate')
+        rows = self.index.team_rows(team.upper(), start_date, end_date)
+        return self.schedule_df.iloc[rows]
     
     def get_game_count_in_range(self, team: str, start_date: str, end_date: str) -> int:
         """
@@ -85,8 +85,7 @@ class ScheduleAnalyzer:
         Returns:
             Number of games
         """
-        games = self.get_games_in_date_range(team, start_date, end_date)
-        return len(games)
+        return self.index.game_count(team.upper(), start_date, end_date)
     
     def find_back_to_back_opportunities(self, start_date: str, end_date: str) -> pd.DataFrame:
         """
@@ -102,16 +101,7 @@ class ScheduleAnalyzer:
         Example:
             >>> analyzer.find_back_to_back_opportunities('2025-10-22', '2025-10-28')
         """
-        start = pd.to_datetime(start_date)
-        end = pd.to_datetime(end_date)
-        
-        mask = (
-            (self.schedule_df['ParsedDate'] >= start) &
-            (self.schedule_df['ParsedDate'] <= end) &
-            (self.schedule_df['IsBackToBack'] == True)
-        )
-        
-        b2b_games = self.schedule_df[mask].sort_values(['Team', 'ParsedDate'])
+        b2b_games = self.schedule_df.iloc[self.index.back_to_back_rows(start_date, end_date)]
         
         return b2b_games[['Team', 'ParsedDate', 'DATE', 'DayOfWeek', 'OpponentClean', 
                           'HomeAway', 'BackToBackPosition']]
@@ -181,24 +171,8 @@ class ScheduleAnalyzer:
                 ...
             }
         """
-        start = pd.to_datetime(start_date)
-        end = pd.to_datetime(end_date)
-        
-        mask = (
-            (self.schedule_df['ParsedDate'] >= start) &
-            (self.schedule_df['ParsedDate'] <= end)
-        )
-        
-        games_in_range = self.schedule_df[mask]
-        
-        # Group by date
-        daily_teams = {}
-        for date in games_in_range['ParsedDate'].dt.date.unique():
-            date_str = str(date)
-            teams = games_in_range[games_in_range['ParsedDate'].dt.date == date]['Team'].tolist()
-            daily_teams[date_str] = sorted(teams)
-        
-        return dict(sorted(daily_teams.items()))
+        # Days come out of the game matrix already in date order
+        return self.index.teams_by_day(start_date, end_date)
     
     def get_teams_with_most_games(self, start_date: str, end_date: str, top_n: int = 10) -> pd.DataFrame:
         """
@@ -213,23 +187,16 @@ class ScheduleAnalyzer:
         Returns:
             DataFrame with top teams by game count
         """
-        start = pd.to_datetime(start_date)
-        end = pd.to_datetime(end_date)
+        total = self.index.game_counts(start_date, end_date)
+        home = self.index.home_counts(start_date, end_date)
+        playing = total > 0
         
-        mask = (
-            (self.schedule_df['ParsedDate'] >= start) &
-            (self.schedule_df['ParsedDate'] <= end)
-        )
-        
-        games = self.schedule_df[mask]
-        
-        team_counts = games.groupby('Team').agg({
-            'ParsedDate': 'count',
-            'HomeAway': lambda x: f"{(x=='Home').sum()}H/{(x=='Away').sum()}A"
-        }).reset_index()
-        
-        team_counts.columns = ['Team', 'TotalGames', 'HomeAway']
-        team_counts = team_counts.sort_values('TotalGames', ascending=False).head(top_n)
+        team_counts = pd.DataFrame({
+            'Team': [team for team, plays in zip(self.index.teams, playing) if plays],
+            'TotalGames': total[playing].astype(int),
+            'HomeAway': [f"{h}H/{t - h}A" for t, h in zip(total[playing], home[playing])]
+        }).astype({'Team': str, 'HomeAway': str})
+        team_counts = team_counts.sort_values('TotalGames', ascending=False, kind='stable').head(top_n)
         
         return team_counts
     
@@ -246,51 +213,36 @@ class ScheduleAnalyzer:
             Week1    4    3    4   ...
             Week2    3    4    2   ...
         """
-        # Get date range
-        min_date = self.schedule_df['ParsedDate'].min()
-        max_date = self.schedule_df['ParsedDate'].max()
-        
-        # Find first Monday
-        first_monday = min_date - timedelta(days=min_date.dayofweek)
-        
-        # Create list of all weeks
-        weeks_data = []
-        current_monday = first_monday
-        week_num = 1
-        
-        while current_monday <= max_date:
-            week_end = current_monday + timedelta(days=6)
-            
-            # Get games for this week
-            mask = (
-                (self.schedule_df['ParsedDate'] >= current_monday) &
-                (self.schedule_df['ParsedDate'] <= week_end)
-            )
-            week_games = self.schedule_df[mask]
-            
-            # Count games per team
-            team_counts = week_games.groupby('Team').size().to_dict()
-            
-            # Add week info
-            week_info = {
-                'Week': f'Week{week_num}',
-                'WeekStart': current_monday.strftime('%Y-%m-%d'),
-                'WeekEnd': week_end.strftime('%Y-%m-%d')
-            }
-            week_info.update(team_counts)
-            weeks_data.append(week_info)
-            
-            current_monday += timedelta(days=7)
-            week_num += 1
+        if self._weekly_breakdown is None:
+            self._weekly_breakdown = self._build_weekly_breakdown()
+            team_columns = [col for col in self._weekly_breakdown.columns if col not in ['Week', 'WeekStart', 'WeekEnd']]
+            print(f"\nGenerated weekly breakdown: {len(self._weekly_breakdown)} weeks, {len(team_columns)} teams")
         
-        df = pd.DataFrame(weeks_data)
-        
-        # Fill NaN with 0 (teams with no games that week)
-        team_columns = [col for col in df.columns if col not in ['Week', 'WeekStart', 'WeekEnd']]
-        df[team_columns] = df[team_columns].fillna(0).astype(int)
+        # Callers add columns to the result, so hand out a copy of the cached table
+        return self._weekly_breakdown.copy()
+    
+    def _build_weekly_breakdown(self) -> pd.DataFrame:
+        """
+        Week x team game counts in one pass: the index's team x day matrix folded into Monday-Sunday weeks
+        """
+        weekly_counts = self.index.by_week(self.index.games)
+        week_starts = self.index.week_starts()
+        
+        df = pd.DataFrame({
+            'Week': [f'Week{i}' for i in range(1, len(week_starts) + 1)],
+            'WeekStart': week_starts.strftime('%Y-%m-%d'),
+            'WeekEnd': (week_starts + timedelta(days=6)).strftime('%Y-%m-%d')
+        })
+        
+        # Teams in order of their first week with a game, alphabetical within a week
+        first_week = (weekly_counts > 0).argmax(axis=1)
+        team_order = sorted(range(len(self.index.teams)), key=lambda t: (first_week[t], self.index.teams[t]))
+        counts = pd.DataFrame(
+            weekly_counts[team_order].T.astype(int),
+            columns=[self.index.teams[t] for t in team_order]
+        )
         
-        print(f"\nGenerated weekly breakdown: {len(df)} weeks, {len(team_columns)} teams")
-        return df
+        return pd.concat([df, counts], axis=1)
     
     def get_season_schedule_summary(self) -> pd.DataFrame:
         """
@@ -347,9 +299,55 @@ class ScheduleAnalyzer:
         
         return result
     
+    def get_all_team_trends(self) -> pd.DataFrame:
+        """
+        Week-by-week schedule details for every team, built in one grouped pass and cached
+        
+        Returns:
+            DataFrame with one row per (team, week): Team, Week, WeekStart, WeekEnd, GamesInWeek,
+            GameDays, HasBackToBack, Home, Away
+        """
+        if self._team_trends is None:
+            self._team_trends = self._build_team_trends()
+        return self._team_trends.copy()
+    
+    def _build_team_trends(self) -> pd.DataFrame:
+        """
+        Group every game by (team, week) once instead of re-querying the schedule per team and week
+        """
+        weekly_df = self.get_all_weekly_breakdowns()
+        weeks = weekly_df[['Week', 'WeekStart', 'WeekEnd']]
+        
+        games = self.schedule_df[self.schedule_df['ParsedDate'].notna()]
+        games = games.assign(
+            WeekIndex=(games['ParsedDate'].dt.normalize() - pd.Timestamp(self.index.first_monday)).dt.days // 7,
+            IsHome=games['HomeAway'] == 'Home',
+            IsAway=games['HomeAway'] == 'Away'
+        ).sort_values(['Team', 'ParsedDate'], kind='stable')
+        
+        grouped = games.groupby(['Team', 'WeekIndex']).agg(
+            GamesInWeek=('ParsedDate', 'size'),
+            GameDays=('DayOfWeek', ', '.join),
+            HasBackToBack=('IsBackToBack', 'any'),
+            Home=('IsHome', 'sum'),
+            Away=('IsAway', 'sum')
+        )
+        
+        # Every team gets every week, including weeks without games
+        full_index = pd.MultiIndex.from_product([self.index.teams, range(len(weeks))], names=['Team', 'WeekIndex'])
+        trends = grouped.reindex(full_index)
+        trends = trends.fillna({'GamesInWeek': 0, 'GameDays': 'No games', 'HasBackToBack': False, 'Home': 0, 'Away': 0})
+        trends = trends.astype({'GamesInWeek': int, 'HasBackToBack': bool, 'Home': int, 'Away': int}).reset_index()
+        
+        week_info = weeks.iloc[trends['WeekIndex'].to_numpy()].reset_index(drop=True)
+        trends = pd.concat([trends[['Team']], week_info, trends.drop(columns=['Team', 'WeekIndex'])], axis=1)
+        
+        return trends
+    
     def get_team_schedule_trends(self, team: str) -> pd.DataFrame:
         """
         Get week-by-week schedule for a specific team with context
+        Slice of get_all_team_trends() - the grouped pass runs once for all teams
         
         Args:
             team: Team abbreviation
@@ -357,41 +355,14 @@ class ScheduleAnalyzer:
         Returns:
             DataFrame showing team's weekly game counts and schedule details
         """
-        weekly_df = self.get_all_weekly_breakdowns()
+        if self._team_trends is None:
+            self._team_trends = self._build_team_trends()
         
-        if team.upper() not in weekly_df.columns:
+        team_rows = self._team_trends['Team'] == team.upper()
+        if not team_rows.any():
             raise ValueError(f"Team {team} not found in schedule data")
         
-        team_schedule = weekly_df[['Week', 'WeekStart', 'WeekEnd', team.upper()]].copy()
-        team_schedule.columns = ['Week', 'WeekStart', 'WeekEnd', 'GamesInWeek']
-        
-        # Add context - get actual game details for each week
-        details = []
-        for _, row in team_schedule.iterrows():
-            games = self.get_games_in_date_range(team, row['WeekStart'], row['WeekEnd'])
-            
-            if len(games) > 0:
-                game_days = ', '.join(games['DayOfWeek'].tolist())
-                has_b2b = games['IsBackToBack'].any()
-                home_count = (games['HomeAway'] == 'Home').sum()
-                away_count = (games['HomeAway'] == 'Away').sum()
-            else:
-                game_days = 'No games'
-                has_b2b = False
-                home_count = 0
-                away_count = 0
-            
-            details.append({
-                'GameDays': game_days,
-                'HasBackToBack': has_b2b,
-                'Home': home_count,
-                'Away': away_count
-            })
-        
-        details_df = pd.DataFrame(details)
-        result = pd.concat([team_schedule, details_df], axis=1)
-        
-        return result
+        return self._team_trends[team_rows].drop(columns='Team').reset_index(drop=True)
     
     def save_weekly_breakdown(self, filepath: str = "data/weekly_game_counts.csv"):
         """
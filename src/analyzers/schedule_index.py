@@ -0,0 +1,209 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Tuple
+
+
+class ScheduleIndex:
+    """
+    Dense team x day index over a schedule DataFrame, built once at load
+
+    games[t, d] is the number of games team t plays on day d (days counted from
+    the first game date). Prefix sums over that matrix turn any date-range game
+    count into two lookups, and per-team sorted date arrays turn "games of team X
+    between A and B" into a searchsorted slice instead of a mask over every row.
+    """
+
+    def __init__(self, schedule_df: pd.DataFrame):
+        """
+        Build the index
+
+        Args:
+            schedule_df: Schedule with Team, ParsedDate (datetime64), HomeAway and IsBackToBack columns
+        """
+        dates = pd.to_datetime(schedule_df['ParsedDate']).to_numpy(dtype='datetime64[ns]')
+        valid = ~np.isnat(dates)
+        positions = np.flatnonzero(valid)
+        dates = dates[valid]
+        teams = schedule_df['Team'].to_numpy()[valid].astype(str)
+
+        self.teams: List[str] = sorted(set(teams))
+        self.team_ids: Dict[str, int] = {team: i for i, team in enumerate(self.teams)}
+
+        days = dates.astype('datetime64[D]')
+        self.first_day = days.min() if len(days) else np.datetime64('NaT', 'D')
+        self.num_days = int((days.max() - self.first_day).astype(int)) + 1 if len(days) else 0
+
+        team_idx = np.array([self.team_ids[team] for team in teams], dtype=np.intp)
+        day_idx = (days - self.first_day).astype(np.intp)
+
+        def matrix(weights: Optional[np.ndarray] = None) -> np.ndarray:
+            counts = np.zeros((len(self.teams), self.num_days), dtype=np.int8)
+            np.add.at(counts, (team_idx, day_idx), 1 if weights is None else weights.astype(np.int8))
+            return counts
+
+        home = schedule_df['HomeAway'].to_numpy()[valid] == 'Home' if 'HomeAway' in schedule_df else np.zeros(len(dates), bool)
+        b2b = schedule_df['IsBackToBack'].to_numpy()[valid].astype(bool) if 'IsBackToBack' in schedule_df else np.zeros(len(dates), bool)
+
+        self.games = matrix()
+        self.home_games = matrix(home)
+        self.back_to_backs = matrix(b2b)
+
+        # cumulative[:, d] = games before day d, so a range [lo, hi) is cumulative[:, hi] - cumulative[:, lo]
+        self.cumulative = np.zeros((len(self.teams), self.num_days + 1), dtype=np.int32)
+        np.cumsum(self.games, axis=1, out=self.cumulative[:, 1:])
+        self.home_cumulative = np.zeros_like(self.cumulative)
+        np.cumsum(self.home_games, axis=1, out=self.home_cumulative[:, 1:])
+
+        # Per-team rows in date order (stable, so same-day rows keep file order)
+        order = np.lexsort((dates, team_idx))
+        bounds = np.searchsorted(team_idx[order], np.arange(len(self.teams) + 1))
+        self.team_dates: List[np.ndarray] = []
+        self.team_positions: List[np.ndarray] = []
+        for t in range(len(self.teams)):
+            rows = order[bounds[t]:bounds[t + 1]]
+            self.team_dates.append(dates[rows])
+            self.team_positions.append(positions[rows])
+        self._back_to_back_rows = np.zeros(len(schedule_df), dtype=bool)
+        self._back_to_back_rows[positions[b2b]] = True
+
+    @staticmethod
+    def _timestamp(date) -> np.datetime64:
+        return pd.Timestamp(date).to_datetime64().astype('datetime64[ns]')
+
+    def day_offset(self, date) -> int:
+        """
+        Day column of a date (may fall outside 0..num_days-1)
+        """
+        day = pd.Timestamp(date).to_datetime64().astype('datetime64[D]')
+        return int((day - self.first_day).astype(int))
+
+    def day_date(self, offset: int) -> pd.Timestamp:
+        """
+        Date of a day column
+        """
+        return pd.Timestamp(self.first_day + np.timedelta64(offset, 'D'))
+
+    def _day_range(self, start_date, end_date) -> Tuple[int, int]:
+        # Days d with start <= day(d) <= end, as a half-open [lo, hi) clipped to the index
+        # A start with a time of day excludes that day's midnight games, like the row masks did
+        start = pd.Timestamp(start_date)
+        lo = self.day_offset(start) + (1 if start != start.normalize() else 0)
+        hi = self.day_offset(end_date) + 1
+        lo = min(max(lo, 0), self.num_days)
+        hi = min(max(hi, lo), self.num_days)
+        return lo, hi
+
+    def game_counts(self, start_date, end_date) -> np.ndarray:
+        """
+        Games per team (in self.teams order) between two dates, inclusive
+        """
+        lo, hi = self._day_range(start_date, end_date)
+        return self.cumulative[:, hi] - self.cumulative[:, lo]
+
+    def home_counts(self, start_date, end_date) -> np.ndarray:
+        """
+        Home games per team (in self.teams order) between two dates, inclusive
+        """
+        lo, hi = self._day_range(start_date, end_date)
+        return self.home_cumulative[:, hi] - self.home_cumulative[:, lo]
+
+    def game_count(self, team: str, start_date, end_date) -> int:
+        """
+        Games for one team between two dates, inclusive (0 for unknown teams)
+        """
+        t = self.team_ids.get(team)
+        if t is None:
+            return 0
+        lo, hi = self._day_range(start_date, end_date)
+        return int(self.cumulative[t, hi] - self.cumulative[t, lo])
+
+    def team_games(self, teams: List[str], start_date, end_date) -> Tuple[np.ndarray, pd.DatetimeIndex]:
+        """
+        Games per day for a list of teams between two dates, inclusive
+
+        Args:
+            teams: Team abbreviations (repeats allowed, unknown teams play no games)
+            start_date: First day
+            end_date: Last day
+
+        Returns:
+            Tuple of (len(teams) x days int8 matrix, dates of the day columns)
+        """
+        lo, hi = self._day_range(start_date, end_date)
+        matrix = np.zeros((len(teams), hi - lo), dtype=np.int8)
+        for i, team in enumerate(teams):
+            t = self.team_ids.get(team)
+            if t is not None:
+                matrix[i] = self.games[t, lo:hi]
+        dates = pd.DatetimeIndex(self.first_day + np.arange(lo, hi) * np.timedelta64(1, 'D'))
+        return matrix, dates
+
+    def teams_on(self, date) -> List[str]:
+        """
+        Teams with a game on a date, sorted
+        """
+        d = self.day_offset(date)
+        if not 0 <= d < self.num_days:
+            return []
+        return [self.teams[t] for t in np.flatnonzero(self.games[:, d])]
+
+    def teams_by_day(self, start_date, end_date) -> Dict[str, List[str]]:
+        """
+        Sorted teams playing on each day with games between two dates, keyed by 'YYYY-MM-DD'
+        """
+        lo, hi = self._day_range(start_date, end_date)
+        window = self.games[:, lo:hi]
+        return {
+            str(self.first_day + np.timedelta64(lo + d, 'D')): [self.teams[t] for t in np.flatnonzero(window[:, d])]
+            for d in np.flatnonzero(window.any(axis=0))
+        }
+
+    def team_rows(self, team: str, start_date, end_date) -> np.ndarray:
+        """
+        Row positions of one team's games between two timestamps, inclusive, in date order
+        """
+        t = self.team_ids.get(team)
+        if t is None:
+            return np.empty(0, dtype=np.intp)
+        dates = self.team_dates[t]
+        lo = np.searchsorted(dates, self._timestamp(start_date), side='left')
+        hi = np.searchsorted(dates, self._timestamp(end_date), side='right')
+        return self.team_positions[t][lo:hi]
+
+    @property
+    def first_monday(self) -> np.datetime64:
+        """
+        Monday of the week containing the first game day (week 1 starts here)
+        """
+        return self.first_day - self._week_offset
+
+    @property
+    def _week_offset(self) -> int:
+        # Days between the first Monday and the first game day (1970-01-01 was a Thursday)
+        return int((self.first_day.astype(int) + 3) % 7)
+
+    @property
+    def num_weeks(self) -> int:
+        return -(-(self._week_offset + self.num_days) // 7)
+
+    def by_week(self, day_matrix: np.ndarray) -> np.ndarray:
+        """
+        Fold a team x day matrix into team x week sums (Monday-Sunday weeks from first_monday)
+        """
+        padded = np.zeros((day_matrix.shape[0], self.num_weeks * 7), dtype=np.int32)
+        padded[:, self._week_offset:self._week_offset + self.num_days] = day_matrix
+        return padded.reshape(day_matrix.shape[0], self.num_weeks, 7).sum(axis=2)
+
+    def week_starts(self) -> pd.DatetimeIndex:
+        """
+        Monday of every week covered by the index
+        """
+        return pd.DatetimeIndex(self.first_monday + np.arange(self.num_weeks) * np.timedelta64(7, 'D'))
+
+    def back_to_back_rows(self, start_date, end_date) -> np.ndarray:
+        """
+        Row positions of back-to-back games between two timestamps, ordered by team then date
+        """
+        rows = [self.team_rows(team, start_date, end_date) for team in self.teams]
+        rows = np.concatenate(rows) if rows else np.empty(0, dtype=np.intp)
+        return rows[self._back_to_back_rows[rows]]
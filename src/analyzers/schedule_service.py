@@ -0,0 +1,397 @@
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+
+# Add parent directory to path to import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analyzers.schedule_analyzer import ScheduleAnalyzer
+from utils.http_session import create_session
+from utils.storage import find_table
+
+
+# Endpoint path -> (ScheduleAnalyzer method, [(query parameter, type, default)])
+# Parameters without a default are required
+ENDPOINTS = {
+    '/teams-playing-on': ('get_teams_playing_on', [('date', str, None)]),
+    '/games-in-range': ('get_games_in_date_range', [('team', str, None), ('start', str, None), ('end', str, None)]),
+    '/game-count': ('get_game_count_in_range', [('team', str, None), ('start', str, None), ('end', str, None)]),
+    '/back-to-backs': ('find_back_to_back_opportunities', [('start', str, None), ('end', str, None)]),
+    '/weekly-game-counts': ('calculate_weekly_game_counts', [('week_start', str, None)]),
+    '/streaming-days': ('get_optimal_streaming_days', [('start', str, None), ('end', str, None)]),
+    '/most-games': ('get_teams_with_most_games', [('start', str, None), ('end', str, None), ('top_n', int, 10)]),
+    '/weekly-breakdown': ('get_all_weekly_breakdowns', []),
+    '/season-summary': ('get_season_schedule_summary', []),
+    '/best-streaming-weeks': ('find_best_streaming_weeks', [('top_n', int, 10)]),
+    '/team-trends': ('get_team_schedule_trends', [('team', str, None)]),
+    '/all-team-trends': ('get_all_team_trends', []),
+}
+
+
+def _to_json(result: Any) -> bytes:
+    """
+    Serialize an analyzer result (DataFrame, dict, list or scalar) to JSON
+    """
+    if isinstance(result, pd.DataFrame):
+        # Keep a named index (e.g. the season summary's Team index) as a column
+        if result.index.name is not None:
+            result = result.reset_index()
+        return result.to_json(orient='records', date_format='iso').encode()
+    return json.dumps(result, default=str).encode()
+
+
+class ScheduleService:
+    """
+    Keeps one ScheduleAnalyzer loaded and answers queries from memory
+
+    Results are cached per (endpoint, parameters). The schedule file's mtime is
+    checked at most every `reload_interval` seconds; when it changes the
+    analyzer is rebuilt and swapped in, and the response cache is dropped.
+    """
+
+    def __init__(self, schedule_filepath: str = "data/team_schedules_2026_season.feather",
+                 cache_size: int = 1024, reload_interval: float = 2.0):
+        """
+        Initialize service
+
+        Args:
+            schedule_filepath: Schedule table to serve (see utils.storage.find_table)
+            cache_size: Max cached responses
+            reload_interval: Seconds between checks of the schedule file's mtime
+        """
+        self.schedule_filepath = schedule_filepath
+        self.cache_size = cache_size
+        self.reload_interval = reload_interval
+
+        self.hits = 0
+        self.misses = 0
+        self.reloads = 0
+
+        self._cache: "OrderedDict[Tuple, bytes]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._reload_lock = threading.Lock()
+        self._last_check = 0.0
+
+        self.analyzer, self._mtime = self._load()
+
+    def _load(self) -> Tuple[ScheduleAnalyzer, float]:
+        path = find_table(self.schedule_filepath)
+        if path is None:
+            raise FileNotFoundError(f"Schedule file not found: {self.schedule_filepath}")
+        return ScheduleAnalyzer(path), os.path.getmtime(path)
+
+    def maybe_reload(self) -> bool:
+        """
+        Reload the analyzer if the schedule file changed since it was loaded
+
+        Returns:
+            True if a new schedule was loaded
+        """
+        now = time.monotonic()
+        if now - self._last_check < self.reload_interval:
+            return False
+
+        with self._reload_lock:
+            if now - self._last_check < self.reload_interval:
+                return False
+            self._last_check = now
+
+            path = find_table(self.schedule_filepath)
+            if path is None or os.path.getmtime(path) == self._mtime:
+                return False
+
+            try:
+                analyzer, mtime = self._load()
+            except Exception as e:
+                # Keep serving the old schedule (e.g. file caught mid-write)
+                print(f"⚠️  Schedule reload failed, keeping previous data: {e}")
+                return False
+
+            # Swap, then drop responses computed from the old schedule
+            self.analyzer, self._mtime = analyzer, mtime
+            with self._cache_lock:
+                self._cache.clear()
+            self.reloads += 1
+            print(f"✓ Reloaded schedule from {path}")
+            return True
+
+    def query(self, path: str, params: Dict[str, str]) -> bytes:
+        """
+        Run an endpoint's analyzer method (or return its cached response)
+
+        Args:
+            path: Endpoint path from ENDPOINTS
+            params: Query parameters
+
+        Returns:
+            JSON response body
+
+        Raises:
+            KeyError for unknown endpoints, ValueError for missing/invalid parameters
+        """
+        method_name, spec = ENDPOINTS[path]
+
+        args = []
+        for name, kind, default in spec:
+            if name in params:
+                args.append(kind(params[name]))
+            elif default is not None:
+                args.append(default)
+            else:
+                raise ValueError(f"Missing query parameter: {name}")
+
+        self.maybe_reload()
+
+        key = (path, tuple(args))
+        with self._cache_lock:
+            body = self._cache.get(key)
+            if body is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return body
+            self.misses += 1
+
+        analyzer = self.analyzer
+        body = _to_json(getattr(analyzer, method_name)(*args))
+
+        with self._cache_lock:
+            # Don't cache a result computed from a schedule that was swapped out meanwhile
+            if analyzer is self.analyzer:
+                self._cache[key] = body
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        return body
+
+    def stats(self) -> Dict:
+        """
+        Cache counters and loaded schedule info
+        """
+        total = self.hits + self.misses
+        return {
+            'games': len(self.analyzer.schedule_df),
+            'cached_responses': len(self._cache),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'reloads': self.reloads
+        }
+
+
+def make_handler(service: ScheduleService):
+    """
+    Build a request handler class bound to a service
+    """
+
+    class ScheduleRequestHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        # Headers and body go out in separate writes - without TCP_NODELAY each keep-alive
+        # response stalls ~40ms on delayed ACKs
+        disable_nagle_algorithm = True
+
+        def _send(self, status: int, body: bytes) -> None:
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _error(self, status: int, message: str) -> None:
+            self._send(status, json.dumps({'error': message}).encode())
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            params = {name: values[-1] for name, values in parse_qs(url.query).items()}
+
+            if url.path == '/health':
+                self._send(200, b'{"status": "ok"}')
+                return
+            if url.path == '/stats':
+                self._send(200, json.dumps(service.stats()).encode())
+                return
+            if url.path == '/endpoints':
+                listing = {path: [name for name, _, _ in spec] for path, (_, spec) in ENDPOINTS.items()}
+                self._send(200, json.dumps(listing).encode())
+                return
+            if url.path not in ENDPOINTS:
+                self._error(404, f"Unknown endpoint: {url.path}")
+                return
+
+            try:
+                self._send(200, service.query(url.path, params))
+            except ValueError as e:
+                self._error(400, str(e))
+            except Exception as e:
+                self._error(500, f"{type(e).__name__}: {e}")
+
+        def log_message(self, format, *args):
+            # Per-request access logs would dominate the console under load
+            pass
+
+    return ScheduleRequestHandler
+
+
+class ScheduleHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+def serve(host: str = '127.0.0.1', port: int = 8765, schedule_filepath: str = "data/team_schedules_2026_season.feather",
+          cache_size: int = 1024, reload_interval: float = 2.0) -> ScheduleHTTPServer:
+    """
+    Create the HTTP server (call serve_forever() on the result, or run it in a thread)
+
+    Args:
+        host: Interface to bind
+        port: Port to bind (0 picks a free one)
+        schedule_filepath: Schedule table to serve
+        cache_size: Max cached responses
+        reload_interval: Seconds between checks of the schedule file's mtime
+
+    Returns:
+        Bound, not yet serving, ScheduleHTTPServer
+    """
+    service = ScheduleService(schedule_filepath, cache_size, reload_interval)
+    server = ScheduleHTTPServer((host, port), make_handler(service))
+    server.service = service
+    return server
+
+
+def default_load_paths(analyzer: ScheduleAnalyzer) -> List[str]:
+    """
+    A realistic query mix over the loaded season (what bots and dashboards ask for)
+    """
+    first = analyzer.schedule_df['ParsedDate'].min().normalize()
+    teams = sorted(analyzer.schedule_df['Team'].unique())
+    paths = []
+    for week in range(4):
+        monday = first - pd.Timedelta(days=first.dayofweek) + pd.Timedelta(weeks=week)
+        sunday = monday + pd.Timedelta(days=6)
+        start, end = monday.strftime('%Y-%m-%d'), sunday.strftime('%Y-%m-%d')
+        paths += [
+            f"/teams-playing-on?date={start}",
+            f"/most-games?start={start}&end={end}",
+            f"/streaming-days?start={start}&end={end}",
+            f"/back-to-backs?start={start}&end={end}",
+            f"/weekly-game-counts?week_start={start}",
+        ]
+        paths += [f"/game-count?team={team}&start={start}&end={end}" for team in teams[:5]]
+    paths += ["/best-streaming-weeks?top_n=5", "/season-summary"]
+    paths += [f"/team-trends?team={team}" for team in teams[:5]]
+    return paths
+
+
+def load_test(base_url: str, paths: List[str], total_requests: int = 2000, concurrency: int = 16) -> Dict:
+    """
+    Hammer the service with a query mix and report latency percentiles
+
+    Args:
+        base_url: Service URL (e.g. http://127.0.0.1:8765)
+        paths: Endpoint paths with query strings, cycled through
+        total_requests: Number of requests to send
+        concurrency: Client threads
+
+    Returns:
+        Dictionary with requests, errors, throughput and p50/p90/p99/max latency in ms
+    """
+    session = create_session(pool_size=concurrency, max_retries=0)
+    latencies = []
+    errors = 0
+    lock = threading.Lock()
+
+    def worker(i: int) -> None:
+        nonlocal errors
+        start = time.perf_counter()
+        try:
+            ok = session.get(base_url + paths[i % len(paths)], timeout=30).status_code == 200
+        except Exception:
+            ok = False
+        elapsed = (time.perf_counter() - start) * 1000
+        with lock:
+            latencies.append(elapsed)
+            errors += 0 if ok else 1
+
+    wall_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(worker, range(total_requests)))
+    wall = time.perf_counter() - wall_start
+    session.close()
+
+    latencies = pd.Series(latencies)
+    return {
+        'requests': total_requests,
+        'errors': errors,
+        'requests_per_second': round(total_requests / wall, 1),
+        'p50_ms': round(latencies.quantile(0.50), 2),
+        'p90_ms': round(latencies.quantile(0.90), 2),
+        'p99_ms': round(latencies.quantile(0.99), 2),
+        'max_ms': round(latencies.max(), 2)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Schedule analyzer query service")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    serve_parser = subparsers.add_parser('serve', help="Run the HTTP service")
+    serve_parser.add_argument('--host', default='127.0.0.1')
+    serve_parser.add_argument('--port', type=int, default=8765)
+    serve_parser.add_argument('--schedule', default="data/team_schedules_2026_season.feather")
+    serve_parser.add_argument('--cache-size', type=int, default=1024)
+    serve_parser.add_argument('--reload-interval', type=float, default=2.0)
+
+    load_parser = subparsers.add_parser('loadtest', help="Start an in-process service and report p50/p99 latency")
+    load_parser.add_argument('--schedule', default="data/team_schedules_2026_season.feather")
+    load_parser.add_argument('--requests', type=int, default=2000)
+    load_parser.add_argument('--concurrency', type=int, default=16)
+    load_parser.add_argument('--url', default=None, help="Test an already running service instead")
+
+    args = parser.parse_args()
+
+    if args.command == 'serve':
+        server = serve(args.host, args.port, args.schedule, args.cache_size, args.reload_interval)
+        print(f"✓ Schedule service listening on http://{args.host}:{server.server_address[1]}")
+        print(f"  Endpoints: {', '.join(ENDPOINTS)}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print("\nShutting down")
+        finally:
+            server.server_close()
+        return
+
+    server = None
+    if args.url:
+        base_url = args.url.rstrip('/')
+        paths = default_load_paths(ScheduleAnalyzer(args.schedule))
+    else:
+        server = serve(port=0, schedule_filepath=args.schedule)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        paths = default_load_paths(server.service.analyzer)
+
+    print(f"\nLoad test: {args.requests} requests, {args.concurrency} clients, {len(paths)} distinct queries")
+    results = load_test(base_url, paths, args.requests, args.concurrency)
+
+    print("=" * 60)
+    for name, value in results.items():
+        print(f"  {name:<20} {value}")
+    print("=" * 60)
+
+    if server is not None:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
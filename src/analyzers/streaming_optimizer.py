@@ -0,0 +1,324 @@
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from analyzers.projection_engine import ProjectionEngine, RosterProjection, RATIO_CATEGORIES
+from analyzers.matchup_simulator import DISPERSION
+from analyzers.lineup_optimizer import LineupOptimizer
+from analyzers.schedule_index import ScheduleIndex
+
+
+def _normal_cdf(z: np.ndarray) -> np.ndarray:
+    # Standard normal CDF through the Abramowitz-Stegun 7.1.26 erf approximation (error < 1.5e-7)
+    x = np.abs(z) / np.sqrt(2)
+    t = 1 / (1 + 0.3275911 * x)
+    poly = t * (0.254829592 + t * (-0.284496736 + t * (1.421413741 + t * (-1.453152027 + t * 1.061405429))))
+    erf = 1 - poly * np.exp(-x * x)
+    return 0.5 * (1 + np.sign(z) * erf)
+
+
+class StreamingOptimizer:
+    """
+    Picks (drop, add, day) roster swaps that raise the chance of winning an H2H category week
+
+    Category outcomes use a normal approximation of each side's final total
+    (Poisson-style variance for counts, binomial variance for percentages),
+    so a swap's value is a closed-form change in category win probabilities.
+    Every swap is scored at once as a free agents x roster x days x columns
+    tensor of projected totals. Free agents with no games left are pruned,
+    the rest are pre-screened by their add-only value, and moves are picked
+    greedily - after each pick the roster is updated and everything is
+    re-scored, so a streamer added on Monday can be streamed out again later.
+
+    With a LineupOptimizer, only games a player starts in the day's best
+    lineup count, as in MatchupAnalyzer.project_roster. The tensor then
+    scores a swap with the added player's scheduled games (an upper bound),
+    and the `refine` best swaps of each round are re-scored exactly by
+    re-solving the daily lineups of the changed roster.
+    """
+
+    def __init__(self, engine: ProjectionEngine, schedule_index: ScheduleIndex, categories: List[Dict],
+                 lineup: Optional[LineupOptimizer] = None, lineup_weights: Optional[Dict[str, float]] = None,
+                 refine: int = 25):
+        """
+        Initialize optimizer
+
+        Args:
+            engine: Projection engine holding the per-game rate matrix
+            schedule_index: Schedule index (games per team per day)
+            categories: Scored categories as {'category': name, 'is_negative': bool}
+                        (categories the engine does not project are skipped)
+            lineup: Daily lineup solver (optional - without one every scheduled game counts)
+            lineup_weights: Column weights ranking players for lineup spots
+            refine: Swaps per round re-scored with exact lineups
+        """
+        self.engine = engine
+        self.index = schedule_index
+        self.lineup = lineup if lineup is not None and lineup.slots else None
+        self.lineup_weights = lineup_weights or {}
+        self.refine = refine
+        self.categories = [
+            cat for cat in categories
+            if all(column in engine.columns for column in RATIO_CATEGORIES.get(cat['category'], (cat['category'],)))
+        ]
+        self.dispersion = np.array([DISPERSION.get(column, 1.0) for column in engine.columns])
+
+    def _category_distribution(self, totals: np.ndarray, current: Dict[str, float]):
+        # Mean and variance of every category's final value, for totals of shape (..., columns)
+        columns = self.engine.columns
+        means, variances = [], []
+        for cat in self.categories:
+            name = cat['category']
+            if name in RATIO_CATEGORIES:
+                made, attempted = RATIO_CATEGORIES[name]
+                made_total = totals[..., columns.index(made)] + current.get(made, 0)
+                attempted_total = totals[..., columns.index(attempted)] + current.get(attempted, 0)
+                safe_attempts = np.where(attempted_total > 0, attempted_total, 1)
+                pct = np.where(attempted_total > 0, made_total / safe_attempts, 0)
+                means.append(pct)
+                variances.append(np.where(attempted_total > 0, np.clip(pct * (1 - pct), 0, None) / safe_attempts, 0))
+            else:
+                j = columns.index(name)
+                means.append(totals[..., j] + current.get(name, 0))
+                variances.append(self.dispersion[j] * totals[..., j])
+        return np.stack(means, axis=-1), np.stack(variances, axis=-1)
+
+    def _win_probabilities(self, totals: np.ndarray, current: Dict[str, float],
+                           opp_mean: np.ndarray, opp_var: np.ndarray) -> np.ndarray:
+        # P(win) per category for totals of shape (..., columns) -> (..., categories)
+        mean, var = self._category_distribution(totals, current)
+        sign = np.array([-1.0 if cat.get('is_negative') else 1.0 for cat in self.categories])
+        margin = sign * (mean - opp_mean)
+        spread = np.sqrt(var + opp_var)
+        z = np.divide(margin, spread, out=np.zeros_like(margin), where=spread > 0)
+        sure = np.where(margin > 0, 1.0, np.where(margin < 0, 0.0, 0.5))
+        return np.where(spread > 0, _normal_cdf(z), sure)
+
+    @staticmethod
+    def _matchup_win_probability(category_probs: np.ndarray) -> np.ndarray:
+        # P(more categories won than lost), categories independent (ties have probability 0 here)
+        num_categories = category_probs.shape[-1]
+        dist = np.zeros(category_probs.shape[:-1] + (num_categories + 1,))
+        dist[..., 0] = 1
+        for k in range(num_categories):
+            p = category_probs[..., k:k + 1]
+            dist[..., 1:] = dist[..., 1:] * (1 - p) + dist[..., :-1] * p
+            dist[..., 0] *= 1 - p[..., 0]
+        return dist[..., num_categories // 2 + 1:].sum(axis=-1)
+
+    def _summary(self, category_probs: np.ndarray) -> Dict:
+        return {
+            'categories': {cat['category']: float(p) for cat, p in zip(self.categories, category_probs)},
+            'expected_categories_won': float(category_probs.sum()),
+            'win_probability': float(self._matchup_win_probability(category_probs)),
+        }
+
+    def optimize(self, roster: pd.DataFrame, free_agents: pd.DataFrame, opponent: RosterProjection,
+                 start_date, end_date, acquisitions: int, current_yours: Dict[str, float] = None,
+                 current_opp: Dict[str, float] = None, max_candidates: int = 300,
+                 min_gain: float = 0.01, top_n: int = 10) -> Dict:
+        """
+        Plan streaming moves for the rest of the week
+
+        Args:
+            roster: Your players with Player, Team and Row (stats table row) columns,
+                    plus Eligible (starting slot sets) when a lineup solver is used
+            free_agents: Available players, same columns
+            opponent: Opponent roster projection for the same dates
+            start_date: First day moves can take effect
+            end_date: Last day of the matchup
+            acquisitions: Pickups still allowed this week
+            current_yours: Week-to-date totals keyed by stat column
+            current_opp: Opponent week-to-date totals
+            max_candidates: Free agents kept after the add-only pre-screen
+            min_gain: Smallest gain in expected categories won worth a pickup
+            top_n: Best single swaps to report
+
+        Returns:
+            Dictionary with 'baseline' and 'final' outlooks (per-category win
+            probabilities, expected categories won, matchup win probability),
+            'moves' (DataFrame of the chosen swaps in order) and 'top_swaps'
+            (DataFrame of the best single swaps before any move)
+        """
+        move_columns = ['Day', 'Drop', 'DropTeam', 'Add', 'AddTeam', 'GamesLost',
+                        'GamesAdded', 'Gain', 'ExpectedCategories', 'WinProbability']
+        if not self.categories:
+            # Nothing the engine projects is scored - no swap can be valued
+            empty = self._summary(np.zeros(0))
+            return {'baseline': empty, 'final': empty, 'moves': pd.DataFrame(columns=move_columns),
+                    'top_swaps': pd.DataFrame()}
+
+        current_yours = current_yours or {}
+        current_opp = current_opp or {}
+        rates = self.engine.rates
+        use_lineup = self.lineup is not None and 'Eligible' in roster and 'Eligible' in free_agents
+
+        opp_mean, opp_var = self._category_distribution(opponent.totals, current_opp)
+
+        def started(scheduled: np.ndarray, rows: np.ndarray, eligible: List) -> np.ndarray:
+            # Games that count: the daily lineups' starts, or every scheduled game without a solver
+            if not use_lineup:
+                return scheduled
+            values = self.engine.values(rows, self.lineup_weights)
+            return self.lineup.started_games(eligible, scheduled, values)
+
+        # Roster entries: scheduled games per day they are rostered for (dropping zeroes the days from
+        # the drop on), and the games that count after the daily lineups
+        roster_games, dates = self.index.team_games(roster['Team'].tolist(), start_date, end_date)
+        entry_rows = roster['Row'].to_numpy(dtype=np.intp)
+        entry_names = roster['Player'].tolist()
+        entry_teams = roster['Team'].tolist()
+        entry_eligible = roster['Eligible'].tolist() if use_lineup else [set()] * len(roster)
+        entry_scheduled = roster_games.astype(np.float64)
+        entry_games = started(entry_scheduled, entry_rows, entry_eligible)
+        entry_since = np.zeros(len(roster), dtype=np.intp)
+        entry_dropped = np.zeros(len(roster), dtype=bool)
+        num_days = len(dates)
+
+        # Free agents: prune duplicates, rostered players and the ones without games left
+        free_agents = free_agents.drop_duplicates('Row')
+        pool_games, _ = self.index.team_games(free_agents['Team'].tolist(), start_date, end_date)
+        keep = (pool_games.sum(axis=1) > 0) & ~free_agents['Row'].isin(entry_rows).to_numpy()
+        pool = free_agents[keep].reset_index(drop=True)
+        pool_games = pool_games[keep].astype(np.float64)
+        pool_rows = pool['Row'].to_numpy(dtype=np.intp)
+        pool_eligible = pool['Eligible'].tolist() if use_lineup else [set()] * len(pool)
+
+        def team_totals() -> np.ndarray:
+            return entry_games.sum(axis=1) @ rates[entry_rows]
+
+        def outlook(totals: np.ndarray) -> np.ndarray:
+            return self._win_probabilities(totals, current_yours, opp_mean, opp_var)
+
+        baseline = outlook(team_totals())
+
+        # Pre-screen: add-only value of every free agent from the first day
+        if len(pool) > max_candidates:
+            add_only = team_totals()[None, :] + pool_games.sum(axis=1)[:, None] * rates[pool_rows]
+            value = outlook(add_only).sum(axis=1)
+            best = np.sort(np.argsort(-value, kind='stable')[:max_candidates])
+            pool = pool.iloc[best].reset_index(drop=True)
+            pool_games = pool_games[best]
+            pool_rows = pool_rows[best]
+            pool_eligible = [pool_eligible[i] for i in best]
+
+        def swap(f: int, r: int, d: int):
+            # Roster after dropping entry r and adding free agent f on day d, with its counted games
+            scheduled = entry_scheduled.copy()
+            scheduled[r, d:] = 0
+            added = np.zeros((1, num_days))
+            added[0, d:] = pool_games[f, d:]
+            scheduled = np.vstack([scheduled, added])
+            rows = np.append(entry_rows, pool_rows[f])
+            return scheduled, rows, started(scheduled, rows, entry_eligible + [pool_eligible[f]])
+
+        available = np.ones(len(pool), dtype=bool)
+        moves = []
+        top_swaps = None
+        current_probs = baseline
+
+        for _ in range(max(acquisitions, 0)):
+            if not available.any() or num_days == 0:
+                break
+
+            # games from day d on: suffix sums over days
+            drop_games = np.cumsum(entry_games[:, ::-1], axis=1)[:, ::-1]
+            add_games = np.cumsum(pool_games[:, ::-1], axis=1)[:, ::-1]
+
+            # free agents x roster x days x columns projected totals
+            totals = (team_totals()[None, None, None, :]
+                      - drop_games[None, :, :, None] * rates[entry_rows][None, :, None, :]
+                      + add_games[:, None, :, None] * rates[pool_rows][:, None, None, :])
+            probs = outlook(totals)
+            gain = probs.sum(axis=-1) - current_probs.sum()
+
+            # A player can be dropped once, on or after the day they joined
+            valid = (np.arange(num_days)[None, :] >= entry_since[:, None]) & ~entry_dropped[:, None]
+            valid = valid[None, :, :] & available[:, None, None]
+            gain = np.where(valid, gain, -np.inf)
+
+            # Games the added player starts, per flat (f, r, d) index of a re-scored swap - with a lineup
+            # solver they depend on who is dropped, so add_games[f, d] only holds the scheduled games
+            refined_games = {}
+            if use_lineup:
+                # Re-score the best candidates with the lineups the swap really leads to
+                candidates = np.argsort(-gain, axis=None, kind='stable')[:max(self.refine, top_n)]
+                candidates = [int(idx) for idx in candidates if np.isfinite(gain.flat[idx])]
+                for idx in candidates:
+                    f, r, d = np.unravel_index(idx, gain.shape)
+                    _, _, games = swap(f, r, d)
+                    probs[f, r, d] = outlook(games.sum(axis=1) @ rates[np.append(entry_rows, pool_rows[f])])
+                    gain[f, r, d] = probs[f, r, d].sum() - current_probs.sum()
+                    refined_games[idx] = games[-1, d:].sum()
+                refined = np.zeros(gain.shape, dtype=bool)
+                refined.flat[candidates] = True
+                gain = np.where(refined, gain, -np.inf)
+
+            if top_swaps is None:
+                top_swaps = self._top_swaps(gain, probs, pool, entry_names, entry_teams, dates,
+                                            drop_games, add_games, refined_games, top_n)
+
+            f, r, d = np.unravel_index(np.argmax(gain), gain.shape)
+            if not np.isfinite(gain[f, r, d]) or gain[f, r, d] < min_gain:
+                break
+
+            new_probs = probs[f, r, d]
+            added = refined_games.get(int(np.ravel_multi_index((f, r, d), gain.shape)), add_games[f, d])
+            moves.append({
+                'Day': dates[d].strftime('%Y-%m-%d'),
+                'Drop': entry_names[r],
+                'DropTeam': entry_teams[r],
+                'Add': pool['Player'].iat[f],
+                'AddTeam': pool['Team'].iat[f],
+                'GamesLost': int(drop_games[r, d]),
+                'GamesAdded': int(added),
+                'Gain': float(gain[f, r, d]),
+                'ExpectedCategories': float(new_probs.sum()),
+                'WinProbability': float(self._matchup_win_probability(new_probs)),
+            })
+
+            # Apply the move: the dropped player stops counting on day d, the new one starts
+            entry_scheduled, entry_rows, entry_games = swap(f, r, d)
+            entry_dropped[r] = True
+            entry_eligible = entry_eligible + [pool_eligible[f]]
+            entry_since = np.append(entry_since, d)
+            entry_dropped = np.append(entry_dropped, False)
+            entry_names.append(pool['Player'].iat[f])
+            entry_teams.append(pool['Team'].iat[f])
+            available[f] = False
+            current_probs = new_probs
+
+        return {
+            'baseline': self._summary(baseline),
+            'final': self._summary(current_probs),
+            'moves': pd.DataFrame(moves, columns=move_columns),
+            'top_swaps': top_swaps if top_swaps is not None else pd.DataFrame(),
+        }
+
+    def _top_swaps(self, gain: np.ndarray, probs: np.ndarray, pool: pd.DataFrame, entry_names: List[str],
+                   entry_teams: List[str], dates: pd.DatetimeIndex, drop_games: np.ndarray,
+                   add_games: np.ndarray, refined_games: Dict[int, float], top_n: int) -> pd.DataFrame:
+        # Best day for every (add, drop) pair - the earliest one on ties - then the top_n pairs
+        best_day = np.argmax(gain, axis=2)
+        best_gain = np.take_along_axis(gain, best_day[:, :, None], axis=2)[:, :, 0]
+        order = np.argsort(-best_gain, axis=None, kind='stable')[:top_n]
+
+        swaps = []
+        for f, r in zip(*np.unravel_index(order, best_gain.shape)):
+            if not np.isfinite(best_gain[f, r]):
+                break
+            d = best_day[f, r]
+            added = refined_games.get(int(np.ravel_multi_index((f, r, d), gain.shape)), add_games[f, d])
+            swaps.append({
+                'Day': dates[d].strftime('%Y-%m-%d'),
+                'Drop': entry_names[r],
+                'DropTeam': entry_teams[r],
+                'Add': pool['Player'].iat[f],
+                'AddTeam': pool['Team'].iat[f],
+                'GamesLost': int(drop_games[r, d]),
+                'GamesAdded': int(added),
+                'Gain': float(best_gain[f, r]),
+                'WinProbability': float(self._matchup_win_probability(probs[f, r, d])),
+            })
+        return pd.DataFrame(swaps)
@@ -0,0 +1,296 @@
+import asyncio
+import json
+import os
+import sys
+from typing import List, Dict, Optional, Iterable
+
+import httpx
+import pandas as pd
+
+# Add parent directory to path to import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scrapers.espn_fantasy_client import ESPNFantasyClient, LeagueSnapshot
+from utils.response_cache import ResponseCache
+
+
+def create_async_client(pool_size: int = 100, max_retries: int = 3, timeout: float = 30.0) -> httpx.AsyncClient:
+    """
+    Create an httpx AsyncClient with a keep-alive connection pool
+
+    One client can be shared by many AsyncESPNFantasyClient instances so
+    every league refresh rides the same pool of open connections.
+
+    Args:
+        pool_size: Max open connections (and keep-alive connections)
+        max_retries: Retries for failed connection attempts
+        timeout: Request timeout in seconds
+
+    Returns:
+        Configured httpx.AsyncClient
+    """
+    limits = httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+    transport = httpx.AsyncHTTPTransport(retries=max_retries, limits=limits)
+    return httpx.AsyncClient(transport=transport, timeout=timeout)
+
+
+class AsyncESPNFantasyClient(ESPNFantasyClient):
+    """
+    Asyncio version of ESPNFantasyClient
+    Same methods as coroutines, so one event loop can refresh many leagues at once
+    """
+
+    def __init__(self, league_id: int, year: int = 2025, espn_s2: str = None, swid: str = None,
+                 client: httpx.AsyncClient = None, semaphore: asyncio.Semaphore = None,
+                 max_concurrency: int = 20, cache: ResponseCache = None, use_cache: bool = True,
+                 conditional: bool = True):
+        """
+        Initialize async ESPN Fantasy Basketball client
+
+        Args:
+            league_id: Your ESPN Fantasy league ID
+            year: Season year (2025 for 2024-25 season - use ending year)
+            espn_s2: ESPN authentication cookie (for private leagues)
+            swid: ESPN SWID cookie with curly braces (for private leagues)
+            client: Shared httpx.AsyncClient (optional - one is created if not provided)
+            semaphore: Shared semaphore bounding in-flight requests across clients (optional)
+            max_concurrency: In-flight request limit when creating our own semaphore
+            cache: Shared ResponseCache (optional)
+            use_cache: Set False to always go to the API
+            conditional: Send ETag/If-Modified-Since validators and skip decoding unchanged responses
+        """
+        super().__init__(league_id, year, espn_s2, swid, cache=cache, use_cache=use_cache,
+                         conditional=conditional)
+
+        self._owns_client = client is None
+        self._client = client
+        self.semaphore = semaphore or asyncio.Semaphore(max_concurrency)
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        Pooled async HTTP client (created on first use)
+        """
+        if self._client is None:
+            self._client = create_async_client()
+        return self._client
+
+    async def aclose(self) -> None:
+        """
+        Close the HTTP client if this instance created it
+        """
+        if self.cache is not None:
+            self.cache.save()
+
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    async def _make_request(self, params: Dict = None, headers: Dict = None) -> Dict:
+        """
+        Make authenticated API request with proper headers
+
+        Args:
+            params: Query parameters (e.g., {'view': 'mRoster'})
+            headers: Additional headers (e.g., X-Fantasy-Filter)
+
+        Returns:
+            JSON response as dictionary
+        """
+        request_key = self._request_key(params, headers)
+        if self.cache is not None:
+            cached = self.cache.get(request_key)
+            if cached is not None:
+                return cached
+
+        try:
+            async with self.semaphore:
+                response = await self.client.get(
+                    self.endpoint,
+                    params=params,
+                    headers=self._request_headers(request_key, headers),
+                    cookies=self.cookies
+                )
+
+                if self._validators_lost(request_key, response):
+                    response = await self.client.get(
+                        self.endpoint,
+                        params=params,
+                        headers=self._default_headers(headers),
+                        cookies=self.cookies
+                    )
+
+            data = self._decode_response(request_key, response)
+
+        except json.JSONDecodeError as e:
+            print(f"JSON Decode Error: {e}")
+            print(f"Response text: {response.text[:500]}")
+            raise Exception(f"Invalid JSON response. Received HTML or malformed data.")
+        except Exception as e:
+            raise Exception(f"Error making request: {e}")
+
+        if self.cache is not None:
+            self.cache.put(request_key, data)
+
+        return data
+
+    async def fetch_views(self, views: List[str], scoring_period_id: int = None) -> LeagueSnapshot:
+        """
+        Fetch several league views in a single request and keep them as the snapshot
+
+        Args:
+            views: View names (e.g., ['mSettings', 'mTeam', 'mRoster'])
+            scoring_period_id: Specific scoring period (optional)
+
+        Returns:
+            LeagueSnapshot with the combined response
+        """
+        views = list(dict.fromkeys(views))
+        data = await self._request_views(views, scoring_period_id)
+
+        self.snapshot = LeagueSnapshot(
+            views=frozenset(views),
+            data=data,
+            scoring_period_id=scoring_period_id
+        )
+        return self.snapshot
+
+    async def _view_data(self, views: List[str], scoring_period_id: int = None) -> Dict:
+        """
+        Get response data for the given views, from the snapshot when it covers them
+        """
+        if self.snapshot is not None and self.snapshot.covers(views, scoring_period_id, self._view_ttl(views)):
+            return self.snapshot.data
+
+        return await self._request_views(views, scoring_period_id)
+
+    async def _request_views(self, views: List[str], scoring_period_id: int = None) -> Dict:
+        """
+        Request several views at once, leaving out separable views that are cached on their own
+        """
+        cached, fetch = self._cached_view_parts(views, scoring_period_id)
+        data = await self._make_request(params=self._view_params(fetch, scoring_period_id))
+        return self._merge_view_parts(views, scoring_period_id, data, cached)
+
+    async def get_league_info(self) -> Dict:
+        """
+        Get league settings and information
+        """
+        data = await self._view_data(['mSettings'])
+        return self._parse_league_info(data)
+
+    async def get_teams(self) -> List[Dict]:
+        """
+        Get all teams in the league
+        """
+        data = await self._view_data(['mTeam'])
+        return self._parse_teams(data)
+
+    async def get_my_team(self, team_id: int = None) -> Dict:
+        """
+        Get your team's roster
+
+        Args:
+            team_id: Your team ID (optional - will use first team if not provided)
+        """
+        data = await self._view_data(['mRoster'])
+        return self._parse_my_team(data, team_id)
+
+    async def get_all_rosters(self, scoring_period_id: int = None) -> Dict[int, Dict]:
+        """
+        Get every team's roster from a single mRoster response
+
+        Args:
+            scoring_period_id: Specific scoring period (optional - uses current if not provided)
+        """
+        data = await self._view_data(['mRoster'], scoring_period_id)
+        return self._parse_all_rosters(data)
+
+    async def get_free_agents(self, size: int = 50, position: str = None) -> pd.DataFrame:
+        """
+        Get available free agents with X-Fantasy-Filter header
+
+        Args:
+            size: Number of players to return (max ~2000)
+            position: Filter by position (PG, SG, SF, PF, C, G, F)
+        """
+        headers = {
+            'x-fantasy-filter': json.dumps(self._free_agent_filters(size, position))
+        }
+
+        data = await self._make_request(params={'view': 'kona_player_info'}, headers=headers)
+        return self._parse_free_agents(data)
+
+    async def get_player_game_logs(self, scoring_period_ids: List[int], size: int = 1000) -> Dict:
+        """
+        Get per-game stat lines for a set of scoring periods (days)
+
+        Args:
+            scoring_period_ids: Scoring periods to include
+            size: Maximum number of players returned
+        """
+        headers = {'x-fantasy-filter': json.dumps(self._game_log_filters(scoring_period_ids, size))}
+
+        return await self._make_request(params={'view': 'kona_player_info'}, headers=headers)
+
+    async def get_current_scoring_period(self) -> Optional[int]:
+        """
+        Current scoring period (day of the fantasy season)
+        """
+        data = await self._view_data(['mSettings'])
+        return self._parse_current_scoring_period(data)
+
+    async def get_current_matchup(self, team_id: int = None, week: int = None) -> Dict:
+        """
+        Get current or specific week matchup details
+
+        Args:
+            team_id: Your team ID (optional)
+            week: Specific week/scoring period (optional - uses current if not provided)
+        """
+        data = await self._view_data(['mMatchup', 'mMatchupScore'], scoring_period_id=week)
+        return self._parse_current_matchup(data, week)
+
+
+async def refresh_leagues(league_ids: Iterable[int], year: int = 2025, espn_s2: str = None,
+                          swid: str = None, views: Optional[List[str]] = None,
+                          max_concurrency: int = 50, pool_size: int = 100) -> Dict[int, object]:
+    """
+    Refresh many leagues concurrently over one shared connection pool
+
+    Total wall time is roughly that of the slowest league rather than the sum,
+    as long as the number of leagues stays within max_concurrency.
+
+    Args:
+        league_ids: League IDs to refresh
+        year: Season year
+        espn_s2: ESPN authentication cookie
+        swid: ESPN SWID cookie
+        views: Views to fetch per league (default: settings, teams, rosters, matchups)
+        max_concurrency: Max in-flight requests across all leagues
+        pool_size: Connection pool size of the shared client
+
+    Returns:
+        Dictionary of league ID -> LeagueSnapshot (or the Exception raised for that league)
+    """
+    views = views or ['mSettings', 'mTeam', 'mRoster', 'mMatchup', 'mMatchupScore']
+    semaphore = asyncio.Semaphore(max_concurrency)
+    league_ids = list(league_ids)
+
+    async with create_async_client(pool_size=pool_size) as http_client:
+        clients = [
+            AsyncESPNFantasyClient(league_id, year, espn_s2, swid, client=http_client, semaphore=semaphore)
+            for league_id in league_ids
+        ]
+        results = await asyncio.gather(
+            *(client.fetch_views(views) for client in clients),
+            return_exceptions=True
+        )
+
+    return dict(zip(league_ids, results))
@@ -1,10 +1,91 @@
 import requests
 import pandas as pd
 import json
-from typing import List, Dict, Optional
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Dict, Optional, FrozenSet, Iterable, Tuple
 import os
+import sys
 from dotenv import load_dotenv
 
+# Add parent directory to path to import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.http_session import create_session
+from utils.response_cache import ResponseCache, DEFAULT_VIEW_TTLS
+from utils.conditional import ValidatorStore
+
+
+# ESPN proTeamId -> standard team abbreviation
+ESPN_TEAM_ABBRS = {
+    1: 'ATL', 2: 'BOS', 3: 'NO', 4: 'CHI', 5: 'CLE',
+    6: 'DAL', 7: 'DEN', 8: 'DET', 9: 'GSW', 10: 'HOU',
+    11: 'IND', 12: 'LAC', 13: 'LAL', 14: 'MIA', 15: 'MIL',
+    16: 'MIN', 17: 'BKN', 18: 'NYK', 19: 'ORL', 20: 'PHI',
+    21: 'PHX', 22: 'POR', 23: 'SAC', 24: 'SAS', 25: 'OKC',
+    26: 'TOR', 27: 'UTAH', 28: 'WAS', 29: 'CHA', 30: 'MEM'
+}
+
+# kona_player_info stat split holding a single scoring period (one day's game)
+SINGLE_PERIOD_SPLIT = 5
+
+# Views whose data sits under top-level keys no other view writes to.
+# A combined request caches them under their own single-view key (with the
+# view's own TTL), and later combined requests leave them out while that entry
+# is fresh - so mSettings is fetched every few hours, not with every score refresh.
+SEPARABLE_VIEWS = {
+    'mSettings': ('settings',),
+}
+
+# League document fields returned with every view
+LEAGUE_KEYS = ('id', 'gameId', 'seasonId', 'segmentId', 'scoringPeriodId', 'status')
+
+
+@dataclass
+class LeagueSnapshot:
+    """
+    Combined response for several league views fetched in one request
+    The v3 endpoint merges every requested view into a single JSON document
+    """
+    views: FrozenSet[str]
+    data: Dict
+    scoring_period_id: Optional[int] = None
+    fetched_at: datetime = field(default_factory=datetime.now)
+    
+    def covers(self, views: Iterable[str], scoring_period_id: Optional[int] = None,
+               max_age: Optional[float] = None) -> bool:
+        """
+        Check whether this snapshot already holds the given views
+        
+        Args:
+            views: View names required by the caller
+            scoring_period_id: Scoring period the caller asked for (None = current)
+            max_age: Oldest acceptable snapshot in seconds (None = any age)
+        
+        Returns:
+            True if the data can be served from this snapshot
+        """
+        if max_age is not None and (datetime.now() - self.fetched_at).total_seconds() > max_age:
+            return False
+        return set(views) <= self.views and scoring_period_id == self.scoring_period_id
+    
+    @property
+    def settings(self) -> Dict:
+        return self.data.get('settings', {})
+    
+    @property
+    def teams(self) -> List[Dict]:
+        return self.data.get('teams', [])
+    
+    @property
+    def schedule(self) -> List[Dict]:
+        return self.data.get('schedule', [])
+    
+    @property
+    def current_scoring_period(self) -> Optional[int]:
+        return self.data.get('scoringPeriodId', self.scoring_period_id)
+
+
 class ESPNFantasyClient:
     """
     ESPN Fantasy Basketball API Client
@@ -14,7 +95,10 @@ class ESPNFantasyClient:
     # CRITICAL: Use the new base URL (changed April 2024)
     BASE_URL = "https://lm-api-reads.fantasy.espn.com/apis/v3/games/fba"
     
-    def __init__(self, league_id: int, year: int = 2025, espn_s2: str = None, swid: str = None):
+    def __init__(self, league_id: int, year: int = 2025, espn_s2: str = None, swid: str = None,
+                 session: requests.Session = None, pool_size: int = 10, max_retries: int = 3,
+                 backoff_factor: float = 0.5, cache: ResponseCache = None, use_cache: bool = True,
+                 conditional: bool = True):
         """
         Initialize ESPN Fantasy Basketball client
         
@@ -23,10 +107,36 @@ class ESPNFantasyClient:
             year: Season year (2025 for 2024-25 season - use ending year)
             espn_s2: ESPN authentication cookie (for private leagues)
             swid: ESPN SWID cookie with curly braces (for private leagues)
+            session: Existing pooled session to share between clients (optional)
+            pool_size: Keep-alive connections per host when creating our own session
+            max_retries: Retries for connection errors and 429/5xx responses
+            backoff_factor: Exponential backoff factor between retries
+            cache: Shared ResponseCache (optional - an in-memory one is created if not provided)
+            use_cache: Set False to always go to the API
+            conditional: Send ETag/If-Modified-Since validators and skip decoding unchanged responses
         """
         self.league_id = league_id
         self.year = year
         
+        # Pooled keep-alive session reused by every view call
+        # Cookies are sent per request so one session can serve several leagues
+        self._owns_session = session is None
+        self._session = session
+        self._session_config = {
+            'pool_size': pool_size,
+            'max_retries': max_retries,
+            'backoff_factor': backoff_factor
+        }
+        
+        # Latest combined multi-view response (see fetch_views)
+        self.snapshot: Optional[LeagueSnapshot] = None
+        
+        # TTL response cache keyed by league/year/views/period/filter
+        self.cache = (cache or ResponseCache()) if use_cache else None
+        
+        # ETag/Last-Modified/content-hash validators for conditional requests
+        self.validators = ValidatorStore() if conditional else None
+        
         # Build endpoint with /segments/0/ structure (required for v3 API)
         self.endpoint = f"{self.BASE_URL}/seasons/{year}/segments/0/leagues/{league_id}"
         
@@ -46,16 +156,36 @@ class ESPNFantasyClient:
         else:
             print("ℹ No authentication cookies provided (public league only)")
     
-    def _make_request(self, params: Dict = None, headers: Dict = None) -> Dict:
+    @property
+    def session(self) -> requests.Session:
         """
-        Make authenticated API request with proper headers
-        
-        Args:
-            params: Query parameters (e.g., {'view': 'mRoster'})
-            headers: Additional headers (e.g., X-Fantasy-Filter)
+        Pooled HTTP session (created on first use)
+        """
+        if self._session is None:
+            self._session = create_session(**self._session_config)
+        return self._session
+    
+    def close(self) -> None:
+        """
+        Close the HTTP session if this client created it
+        Shared sessions are left open for their other users
+        """
+        if self.cache is not None:
+            self.cache.save()
         
-        Returns:
-            JSON response as dictionary
+        if self._owns_session and self._session is not None:
+            self._session.close()
+            self._session = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _default_headers(self, headers: Dict = None) -> Dict:
+        """
+        Build request headers, merging any custom headers over the defaults
         """
         # Default headers - CRITICAL for getting JSON instead of HTML
         default_headers = {
@@ -68,32 +198,133 @@ class ESPNFantasyClient:
         if headers:
             default_headers.update(headers)
         
+        return default_headers
+    
+    def _check_response(self, status_code: int, content_type: str, url: str) -> None:
+        """
+        Raise a descriptive error for HTML or error responses from the API
+        
+        Args:
+            status_code: HTTP status code
+            content_type: Response Content-Type header
+            url: Final request URL (for the error report)
+        """
+        # Check if we got HTML instead of JSON
+        if 'application/json' not in content_type:
+            print(f"ERROR: Received HTML instead of JSON!")
+            print(f"Status: {status_code}")
+            print(f"Content-Type: {content_type}")
+            print(f"URL: {url}")
+            raise Exception(f"API returned HTML instead of JSON. Check base URL and view parameters.")
+        
+        # Handle HTTP errors
+        if status_code == 401:
+            raise Exception("Authentication failed. Check your espn_s2 and SWID cookies.")
+        elif status_code == 404:
+            raise Exception(f"League {self.league_id} not found for year {self.year}.")
+    
+    def _request_key(self, params: Dict = None, headers: Dict = None) -> tuple:
+        """
+        Key identifying a request for the response cache and validator store
+        """
+        params = params or {}
+        views = params.get('view', [])
+        if isinstance(views, str):
+            views = [views]
+        
+        fantasy_filter = None
+        for name, value in (headers or {}).items():
+            if name.lower() == 'x-fantasy-filter':
+                fantasy_filter = value
+        
+        return ResponseCache.make_key(
+            self.league_id, self.year, views, params.get('scoringPeriodId'), fantasy_filter
+        )
+    
+    def _request_headers(self, request_key: tuple, headers: Dict = None) -> Dict:
+        """
+        Default + custom headers plus conditional validators for a request
+        """
+        request_headers = self._default_headers(headers)
+        if self.validators is not None:
+            request_headers.update(self.validators.conditional_headers(request_key))
+        return request_headers
+    
+    def _validators_lost(self, request_key: tuple, response) -> bool:
+        """
+        True for a 304 whose stored response was evicted after the validators were sent
+        The request then has to be repeated without validators
+        """
+        return (self.validators is not None and response.status_code == 304
+                and not self.validators.has(request_key))
+    
+    def _decode_response(self, request_key: tuple, response) -> Dict:
+        """
+        Check and decode a response
+        JSON decoding is skipped on 304 or when the body hash matches the last response
+        
+        Args:
+            request_key: Key from _request_key()
+            response: requests/httpx response
+        
+        Returns:
+            JSON response as dictionary
+        """
+        if self.validators is not None and response.status_code == 304:
+            data, _ = self.validators.resolve(request_key, response, None)
+            return data
+        
+        self._check_response(
+            response.status_code,
+            response.headers.get('Content-Type', ''),
+            str(response.url)
+        )
+        
+        response.raise_for_status()
+        
+        if self.validators is None:
+            return response.json()
+        
+        data, _ = self.validators.resolve(request_key, response, lambda content: response.json())
+        return data
+    
+    def _make_request(self, params: Dict = None, headers: Dict = None) -> Dict:
+        """
+        Make authenticated API request with proper headers
+        Fresh responses are served from the response cache without a network call
+        
+        Args:
+            params: Query parameters (e.g., {'view': 'mRoster'})
+            headers: Additional headers (e.g., X-Fantasy-Filter)
+        
+        Returns:
+            JSON response as dictionary
+        """
+        request_key = self._request_key(params, headers)
+        if self.cache is not None:
+            cached = self.cache.get(request_key)
+            if cached is not None:
+                return cached
+        
         try:
-            response = requests.get(
+            response = self.session.get(
                 self.endpoint,
                 params=params,
-                headers=default_headers,
+                headers=self._request_headers(request_key, headers),
                 cookies=self.cookies,
                 timeout=30
             )
             
-            # Check if we got HTML instead of JSON
-            content_type = response.headers.get('Content-Type', '')
-            if 'application/json' not in content_type:
-                print(f"ERROR: Received HTML instead of JSON!")
-                print(f"Status: {response.status_code}")
-                print(f"Content-Type: {content_type}")
-                print(f"URL: {response.url}")
-                raise Exception(f"API returned HTML instead of JSON. Check base URL and view parameters.")
-            
-            # Handle HTTP errors
-            if response.status_code == 401:
-                raise Exception("Authentication failed. Check your espn_s2 and SWID cookies.")
-            elif response.status_code == 404:
-                raise Exception(f"League {self.league_id} not found for year {self.year}.")
+            if self._validators_lost(request_key, response):
+                response = self.session.get(
+                    self.endpoint,
+                    params=params,
+                    headers=self._default_headers(headers),
+                    cookies=self.cookies,
+                    timeout=30
+                )
             
-            response.raise_for_status()
-            return response.json()
+            data = self._decode_response(request_key, response)
             
         except requests.exceptions.JSONDecodeError as e:
             print(f"JSON Decode Error: {e}")
@@ -101,6 +332,145 @@ class ESPNFantasyClient:
             raise Exception(f"Invalid JSON response. Received HTML or malformed data.")
         except Exception as e:
             raise Exception(f"Error making request: {e}")
+        
+        if self.cache is not None:
+            self.cache.put(request_key, data)
+        
+        return data
+    
+    def fetch_views(self, views: List[str], scoring_period_id: int = None) -> LeagueSnapshot:
+        """
+        Fetch several league views in a single request
+        The result is kept as the client's snapshot so get_league_info, get_teams,
+        get_my_team and get_current_matchup can read it without more network calls,
+        until it is older than the TTL of the views they read (see _view_ttl)
+        
+        Args:
+            views: View names (e.g., ['mSettings', 'mTeam', 'mRoster', 'mMatchup', 'mMatchupScore'])
+            scoring_period_id: Specific scoring period (optional - uses current if not provided)
+        
+        Returns:
+            LeagueSnapshot with the combined response
+        """
+        views = list(dict.fromkeys(views))  # De-duplicate, keep order
+        data = self._request_views(views, scoring_period_id)
+        
+        self.snapshot = LeagueSnapshot(
+            views=frozenset(views),
+            data=data,
+            scoring_period_id=scoring_period_id
+        )
+        return self.snapshot
+    
+    def clear_snapshot(self) -> None:
+        """
+        Drop the stored snapshot so the next call goes back to the API
+        """
+        self.snapshot = None
+    
+    def _view_data(self, views: List[str], scoring_period_id: int = None) -> Dict:
+        """
+        Get response data for the given views, from the snapshot when it covers them
+        
+        Args:
+            views: View names needed by the caller
+            scoring_period_id: Specific scoring period (optional)
+        
+        Returns:
+            JSON response as dictionary
+        """
+        if self.snapshot is not None and self.snapshot.covers(views, scoring_period_id, self._view_ttl(views)):
+            return self.snapshot.data
+        
+        return self._request_views(views, scoring_period_id)
+    
+    def _request_views(self, views: List[str], scoring_period_id: int = None) -> Dict:
+        """
+        Request several views at once, leaving out separable views that are cached on their own
+        
+        Args:
+            views: View names to return data for
+            scoring_period_id: Specific scoring period (optional)
+        
+        Returns:
+            JSON response as dictionary, covering every requested view
+        """
+        cached, fetch = self._cached_view_parts(views, scoring_period_id)
+        data = self._make_request(params=self._view_params(fetch, scoring_period_id))
+        return self._merge_view_parts(views, scoring_period_id, data, cached)
+    
+    def _separable_view_key(self, view: str, scoring_period_id: int = None) -> tuple:
+        """
+        Cache key of a separable view - the same key a request for that view alone uses
+        """
+        return ResponseCache.make_key(self.league_id, self.year, [view], scoring_period_id or None)
+    
+    def _cached_view_parts(self, views: List[str], scoring_period_id: int = None) -> Tuple[Dict[str, Dict], List[str]]:
+        """
+        Split a combined request into fresh cached separable views and the views still to fetch
+        
+        Returns:
+            Tuple of (view -> cached response, views to request)
+        """
+        if self.cache is None or len(views) < 2:
+            return {}, views
+        
+        cached = {}
+        for view in views:
+            if view in SEPARABLE_VIEWS:
+                part = self.cache.get(self._separable_view_key(view, scoring_period_id))
+                if part is not None:
+                    cached[view] = part
+        
+        fetch = [view for view in views if view not in cached]
+        if not fetch:
+            return {}, views
+        return cached, fetch
+    
+    def _merge_view_parts(self, views: List[str], scoring_period_id: int, data: Dict,
+                          cached: Dict[str, Dict]) -> Dict:
+        """
+        Add cached separable views to a combined response and cache the ones it fetched
+        
+        Args:
+            views: Every view the caller asked for
+            scoring_period_id: Specific scoring period (optional)
+            data: Response for the views that were requested
+            cached: View -> cached response from _cached_view_parts
+        
+        Returns:
+            Response covering every view in views
+        """
+        if self.cache is None or len(views) < 2:
+            return data
+        
+        merged = dict(data)
+        for view, part in cached.items():
+            merged.update({key: part[key] for key in SEPARABLE_VIEWS[view] if key in part})
+        
+        for view in views:
+            if view in SEPARABLE_VIEWS and view not in cached:
+                part = {key: data[key] for key in SEPARABLE_VIEWS[view] + LEAGUE_KEYS if key in data}
+                self.cache.put(self._separable_view_key(view, scoring_period_id), part)
+        
+        return merged
+    
+    def _view_ttl(self, views: List[str]) -> float:
+        """
+        Seconds data for these views stays fresh - the snapshot expires on the same TTLs as the cache
+        """
+        if self.cache is not None:
+            return self.cache.ttl_for(views)
+        return min(DEFAULT_VIEW_TTLS.get(view, 60) for view in views)
+    
+    def _view_params(self, views: List[str], scoring_period_id: int = None) -> Dict:
+        """
+        Build query parameters for one or more views
+        """
+        params = {'view': views if len(views) > 1 else views[0]}
+        if scoring_period_id:
+            params['scoringPeriodId'] = scoring_period_id
+        return params
     
     def get_league_info(self) -> Dict:
         """
@@ -109,9 +479,13 @@ class ESPNFantasyClient:
         Returns:
             Dictionary with league info including name, size, scoring type
         """
-        params = {'view': 'mSettings'}
-        data = self._make_request(params=params)
-        
+        data = self._view_data(['mSettings'])
+        return self._parse_league_info(data)
+    
+    def _parse_league_info(self, data: Dict) -> Dict:
+        """
+        Build the league info dictionary from an mSettings response
+        """
         settings = data.get('settings', {})
         scoring = settings.get('scoringSettings', {})
         
@@ -121,6 +495,12 @@ class ESPNFantasyClient:
             'scoring_type': 'H2H Category' if scoring.get('scoringType') == 'H2H_CATEGORY' else 'Points',
             'roster_slots': settings.get('rosterSettings', {}).get('lineupSlotCounts', {}),
             'acquisition_limit': settings.get('acquisitionSettings', {}).get('acquisitionLimit', -1),
+            'matchup_acquisition_limit': settings.get('acquisitionSettings', {}).get('matchupAcquisitionLimit', -1),
+            # Matchup period -> the scoring periods (days) it spans
+            'matchup_periods': {
+                int(period): scoring_periods
+                for period, scoring_periods in settings.get('scheduleSettings', {}).get('matchupPeriods', {}).items()
+            },
         }
         
         # Get scoring categories for H2H Category leagues
@@ -149,9 +529,13 @@ class ESPNFantasyClient:
         Returns:
             List of team dictionaries
         """
-        params = {'view': 'mTeam'}
-        data = self._make_request(params=params)
-        
+        data = self._view_data(['mTeam'])
+        return self._parse_teams(data)
+    
+    def _parse_teams(self, data: Dict) -> List[Dict]:
+        """
+        Build the team list from an mTeam response
+        """
         teams = []
         for team in data.get('teams', []):
             teams.append({
@@ -159,7 +543,9 @@ class ESPNFantasyClient:
                 'name': f"{team.get('location', '')} {team.get('nickname', '')}".strip(),
                 'owner': team.get('primaryOwner'),
                 'wins': team.get('record', {}).get('overall', {}).get('wins', 0),
-                'losses': team.get('record', {}).get('overall', {}).get('losses', 0)
+                'losses': team.get('record', {}).get('overall', {}).get('losses', 0),
+                'acquisitions': team.get('transactionCounter', {}).get('acquisitions', 0),
+                'matchup_acquisitions': team.get('transactionCounter', {}).get('matchupAcquisitionTotals', {})
             })
         
         print(f"\nFound {len(teams)} teams")
@@ -175,9 +561,13 @@ class ESPNFantasyClient:
         Returns:
             Dictionary with team info and roster
         """
-        params = {'view': 'mRoster'}
-        data = self._make_request(params=params)
-        
+        data = self._view_data(['mRoster'])
+        return self._parse_my_team(data, team_id)
+    
+    def _parse_my_team(self, data: Dict, team_id: int = None) -> Dict:
+        """
+        Build one team's info and roster from an mRoster response
+        """
         teams = data.get('teams', [])
         
         if not teams:
@@ -198,31 +588,61 @@ class ESPNFantasyClient:
         if not my_team:
             raise Exception(f"Team ID {team_id} not found")
         
-        # Extract roster
+        team_info = self._parse_team_roster(my_team)
+        
+        print(f"\nTeam: {team_info['team_name']}")
+        print(f"Roster size: {team_info['roster_size']}")
+        
+        return team_info
+    
+    def _parse_team_roster(self, team: Dict) -> Dict:
+        """
+        Build team info and roster from one team of an mRoster response
+        """
         roster = []
-        for entry in my_team.get('roster', {}).get('entries', []):
+        for entry in team.get('roster', {}).get('entries', []):
             player = entry.get('playerPoolEntry', {}).get('player', {})
             roster.append({
                 'player_id': player.get('id'),
                 'name': player.get('fullName'),
                 'pro_team_id': player.get('proTeamId'),
                 'position': player.get('defaultPositionId'),
+                'eligible_slots': player.get('eligibleSlots', []),
                 'injury_status': player.get('injuryStatus'),
                 'lineup_slot': entry.get('lineupSlotId')
             })
         
-        team_info = {
-            'team_id': team_id,
-            'team_name': f"{my_team.get('location', '')} {my_team.get('nickname', '')}".strip(),
-            'owner': my_team.get('primaryOwner'),
+        return {
+            'team_id': team.get('id'),
+            'team_name': f"{team.get('location', '')} {team.get('nickname', '')}".strip(),
+            'owner': team.get('primaryOwner'),
             'roster': roster,
             'roster_size': len(roster)
         }
+    
+    def get_all_rosters(self, scoring_period_id: int = None) -> Dict[int, Dict]:
+        """
+        Get every team's roster from a single mRoster response
         
-        print(f"\nTeam: {team_info['team_name']}")
-        print(f"Roster size: {team_info['roster_size']}")
+        Args:
+            scoring_period_id: Specific scoring period (optional - uses current if not provided)
         
-        return team_info
+        Returns:
+            Dictionary of team ID -> team info and roster (same shape as get_my_team)
+        """
+        data = self._view_data(['mRoster'], scoring_period_id)
+        return self._parse_all_rosters(data)
+    
+    def _parse_all_rosters(self, data: Dict) -> Dict[int, Dict]:
+        """
+        Build team ID -> roster info from an mRoster response
+        """
+        rosters = {team['id']: self._parse_team_roster(team) for team in data.get('teams', [])}
+        
+        if not rosters:
+            raise Exception("No teams found in league")
+        
+        return rosters
     
     def get_free_agents(self, size: int = 50, position: str = None) -> pd.DataFrame:
         """
@@ -235,6 +655,20 @@ class ESPNFantasyClient:
         Returns:
             DataFrame with available free agents
         """
+        # X-Fantasy-Filter header is REQUIRED for basketball
+        headers = {
+            'x-fantasy-filter': json.dumps(self._free_agent_filters(size, position))
+        }
+        
+        params = {'view': 'kona_player_info'}
+        
+        data = self._make_request(params=params, headers=headers)
+        return self._parse_free_agents(data)
+    
+    def _free_agent_filters(self, size: int = 50, position: str = None) -> Dict:
+        """
+        Build the X-Fantasy-Filter payload for a free agent query
+        """
         # Position mapping for basketball
         position_map = {
             'PG': 0, 'SG': 1, 'SF': 2, 'PF': 3, 'C': 4,
@@ -261,15 +695,12 @@ class ESPNFantasyClient:
                 "value": [position_map[position.upper()]]
             }
         
-        # X-Fantasy-Filter header is REQUIRED for basketball
-        headers = {
-            'x-fantasy-filter': json.dumps(filters)
-        }
-        
-        params = {'view': 'kona_player_info'}
-        
-        data = self._make_request(params=params, headers=headers)
-        
+        return filters
+    
+    def _parse_free_agents(self, data: Dict) -> pd.DataFrame:
+        """
+        Build the free agent DataFrame from a kona_player_info response
+        """
         # Parse player data
         players = []
         for player_entry in data.get('players', []):
@@ -280,6 +711,7 @@ class ESPNFantasyClient:
                 'name': player.get('fullName'),
                 'pro_team_id': player.get('proTeamId'),
                 'position': player.get('defaultPositionId'),
+                'eligible_slots': player.get('eligibleSlots', []),
                 'percent_owned': player.get('ownership', {}).get('percentOwned', 0),
                 'percent_started': player.get('ownership', {}).get('percentStarted', 0),
             })
@@ -289,6 +721,55 @@ class ESPNFantasyClient:
         
         return df
     
+    def get_player_game_logs(self, scoring_period_ids: List[int], size: int = 1000) -> Dict:
+        """
+        Get per-game stat lines for a set of scoring periods (days)
+        
+        Each player's stats list holds one actual-stats split per scoring period
+        they played in (see SINGLE_PERIOD_SPLIT). The raw response is returned so
+        live data and saved fixtures go through the same parser.
+        
+        Args:
+            scoring_period_ids: Scoring periods to include
+            size: Maximum number of players returned
+        
+        Returns:
+            kona_player_info response as dictionary
+        """
+        headers = {'x-fantasy-filter': json.dumps(self._game_log_filters(scoring_period_ids, size))}
+        
+        return self._make_request(params={'view': 'kona_player_info'}, headers=headers)
+    
+    def _game_log_filters(self, scoring_period_ids: List[int], size: int = 1000) -> Dict:
+        """
+        Build the X-Fantasy-Filter payload for a per-game stats query
+        """
+        return {
+            "players": {
+                "filterStatsForSourceIds": {"value": [0]},
+                "filterStatsForSplitTypeIds": {"value": [SINGLE_PERIOD_SPLIT]},
+                "filterStatsForCurrentSeasonScoringPeriodIds": {"value": list(scoring_period_ids)},
+                "limit": size,
+                "sortPercOwned": {
+                    "sortPriority": 1,
+                    "sortAsc": False
+                }
+            }
+        }
+    
+    def get_current_scoring_period(self) -> Optional[int]:
+        """
+        Current scoring period (day of the fantasy season), from the league settings response
+        """
+        data = self._view_data(['mSettings'])
+        return self._parse_current_scoring_period(data)
+    
+    def _parse_current_scoring_period(self, data: Dict) -> Optional[int]:
+        """
+        Current scoring period from any league response
+        """
+        return data.get('scoringPeriodId')
+    
     def get_current_matchup(self, team_id: int = None, week: int = None) -> Dict:
         """
         Get current or specific week matchup details
@@ -300,15 +781,13 @@ class ESPNFantasyClient:
         Returns:
             Dictionary with matchup information
         """
-        params = {
-            'view': ['mMatchup', 'mMatchupScore']
-        }
-        
-        if week:
-            params['scoringPeriodId'] = week
-        
-        data = self._make_request(params=params)
-        
+        data = self._view_data(['mMatchup', 'mMatchupScore'], scoring_period_id=week)
+        return self._parse_current_matchup(data, week)
+    
+    def _parse_current_matchup(self, data: Dict, week: int = None) -> Dict:
+        """
+        Build the matchup list from an mMatchup/mMatchupScore response
+        """
         current_period = data.get('scoringPeriodId', week)
         schedule = data.get('schedule', [])
         
@@ -339,15 +818,7 @@ class ESPNFantasyClient:
         Returns:
             Team abbreviation (e.g., 'ATL', 'BOS')
         """
-        team_map = {
-            1: 'ATL', 2: 'BOS', 3: 'NO', 4: 'CHI', 5: 'CLE',
-            6: 'DAL', 7: 'DEN', 8: 'DET', 9: 'GSW', 10: 'HOU',
-            11: 'IND', 12: 'LAC', 13: 'LAL', 14: 'MIA', 15: 'MIL',
-            16: 'MIN', 17: 'BKN', 18: 'NYK', 19: 'ORL', 20: 'PHI',
-            21: 'PHX', 22: 'POR', 23: 'SAC', 24: 'SAS', 25: 'OKC',
-            26: 'TOR', 27: 'UTAH', 28: 'WAS', 29: 'CHA', 30: 'MEM'
-        }
-        return team_map.get(espn_team_id, 'UNK')
+        return ESPN_TEAM_ABBRS.get(espn_team_id, 'UNK')
 
 
 def main():
@@ -0,0 +1,258 @@
+import argparse
+import json
+import os
+import sys
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+from dotenv import load_dotenv
+
+# Add parent directory to path to import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scrapers.espn_fantasy_client import ESPNFantasyClient, ESPN_TEAM_ABBRS, SINGLE_PERIOD_SPLIT
+from scrapers.espn_fantasy_async_client import AsyncESPNFantasyClient
+from utils.storage import find_table, load_table, save_table, table_path
+
+
+# ESPN stat ID -> game log column (per-game lines carry the same IDs as the season splits)
+GAME_LOG_STATS = {
+    40: 'MIN',
+    0: 'PTS',
+    6: 'REB',
+    3: 'AST',
+    2: 'STL',
+    1: 'BLK',
+    17: '3PM',
+    18: '3PA',
+    13: 'FGM',
+    14: 'FGA',
+    15: 'FTM',
+    16: 'FTA',
+    11: 'TO',
+}
+GAME_LOG_COLUMNS = list(GAME_LOG_STATS.values())
+
+# Stat ID for games played - 0 on a DNP line
+GAMES_PLAYED_STAT = 42
+
+KEY_COLUMNS = ['PlayerID', 'ScoringPeriod']
+
+
+def parse_game_logs(data: Dict) -> pd.DataFrame:
+    """
+    Per-game stat lines from a kona_player_info response
+
+    Only actual-stats, single-period splits are kept; DNP lines (no games
+    played or no minutes) are dropped.
+
+    Args:
+        data: Response from ESPNFantasyClient.get_player_game_logs (or a saved copy)
+
+    Returns:
+        DataFrame with PlayerID, Name, Team, ScoringPeriod and GAME_LOG_COLUMNS
+    """
+    lines = []
+    for entry in data.get('players', []):
+        player = entry.get('player', entry)
+        for split in player.get('stats', []):
+            if split.get('statSplitTypeId') != SINGLE_PERIOD_SPLIT or split.get('statSourceId', 0) != 0:
+                continue
+
+            stats = split.get('stats') or {}
+            if not stats or stats.get(str(GAMES_PLAYED_STAT), 1) == 0 or stats.get('40', 1) == 0:
+                continue
+
+            line = {
+                'PlayerID': player.get('id'),
+                'Name': player.get('fullName'),
+                'Team': ESPN_TEAM_ABBRS.get(player.get('proTeamId'), 'UNK'),
+                'ScoringPeriod': split.get('scoringPeriodId'),
+            }
+            for stat_id, column in GAME_LOG_STATS.items():
+                line[column] = stats.get(str(stat_id), 0)
+            lines.append(line)
+
+    return compact_game_logs(pd.DataFrame(lines, columns=['PlayerID', 'Name', 'Team', 'ScoringPeriod'] + GAME_LOG_COLUMNS))
+
+
+def compact_game_logs(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Game log table with compact dtypes: int32 IDs, int16 periods, float32 stats
+
+    Missing stat columns are added as 0 and rows without an ID or period are dropped.
+    """
+    df = df.copy()
+    for column in GAME_LOG_COLUMNS:
+        if column not in df.columns:
+            df[column] = 0
+
+    df['PlayerID'] = pd.to_numeric(df['PlayerID'], errors='coerce')
+    df['ScoringPeriod'] = pd.to_numeric(df['ScoringPeriod'], errors='coerce')
+    df = df.dropna(subset=KEY_COLUMNS)
+
+    df['PlayerID'] = df['PlayerID'].astype(np.int32)
+    df['ScoringPeriod'] = df['ScoringPeriod'].astype(np.int16)
+    for column in GAME_LOG_COLUMNS:
+        df[column] = pd.to_numeric(df[column], errors='coerce').fillna(0).astype(np.float32)
+
+    return df[['PlayerID', 'Name', 'Team', 'ScoringPeriod'] + GAME_LOG_COLUMNS].reset_index(drop=True)
+
+
+class ESPNGameLogScraper:
+    """
+    Ingests per-game stat lines into a columnar game log table
+
+    The table holds one row per (player, scoring period). Ingesting only adds
+    lines whose key is not stored yet and returns them, so downstream models
+    can update from the new games alone instead of re-reading the whole log.
+    """
+
+    def __init__(self, client: ESPNFantasyClient = None, season: int = 2026, data_dir: str = "data"):
+        """
+        Initialize scraper
+
+        Args:
+            client: ESPN fantasy client used for live fetches (not needed for fixtures)
+            season: Season year (ending year, e.g. 2026 for 2025-26)
+            data_dir: Directory tables live in
+        """
+        if isinstance(client, AsyncESPNFantasyClient):
+            raise TypeError("ESPNGameLogScraper needs a synchronous ESPNFantasyClient "
+                            "(await AsyncESPNFantasyClient.get_player_game_logs and ingest the parsed lines instead)")
+
+        self.client = client
+        self.season = season
+        self.log_path = table_path(f"player_game_logs_{season}_season", data_dir)
+
+    def load(self, columns: Iterable[str] = None) -> pd.DataFrame:
+        """
+        Stored game log (empty table if nothing has been ingested)
+        """
+        if find_table(self.log_path) is None:
+            return compact_game_logs(pd.DataFrame(columns=['PlayerID', 'Name', 'Team', 'ScoringPeriod']))
+        return load_table(self.log_path, columns=columns)
+
+    def last_period(self) -> int:
+        """
+        Latest scoring period in the stored log (0 if empty)
+        """
+        periods = self.load(columns=['ScoringPeriod'])['ScoringPeriod']
+        return int(periods.max()) if len(periods) else 0
+
+    def ingest(self, lines: pd.DataFrame) -> pd.DataFrame:
+        """
+        Append game lines to the stored log
+
+        Args:
+            lines: Game lines (PlayerID, Name, Team, ScoringPeriod, stat columns)
+
+        Returns:
+            The lines that were not stored yet
+        """
+        lines = compact_game_logs(lines).drop_duplicates(KEY_COLUMNS, keep='last')
+        if lines.empty:
+            return lines
+
+        # Only the key columns are read to find what is already stored
+        stored = self.load(columns=KEY_COLUMNS)
+        stored_keys = pd.MultiIndex.from_frame(stored[KEY_COLUMNS])
+        new_lines = lines[~pd.MultiIndex.from_frame(lines[KEY_COLUMNS]).isin(stored_keys)]
+        if new_lines.empty:
+            print("ℹ️  No new game lines")
+            return new_lines
+
+        log = pd.concat([self.load(), new_lines], ignore_index=True) if len(stored) else new_lines
+        log = log.sort_values(['ScoringPeriod', 'PlayerID'], kind='stable').reset_index(drop=True)
+        save_table(log, self.log_path)
+
+        print(f"✓ Stored {len(new_lines)} new game lines ({len(log)} total) in {self.log_path}")
+        return new_lines.sort_values(KEY_COLUMNS, kind='stable').reset_index(drop=True)
+
+    def ingest_fixture(self, filepath: str) -> pd.DataFrame:
+        """
+        Ingest a local fixture: a saved kona_player_info response (.json) or a game log table
+
+        Returns:
+            The lines that were not stored yet
+        """
+        if filepath.lower().endswith('.json'):
+            with open(filepath) as f:
+                lines = parse_game_logs(json.load(f))
+        else:
+            lines = load_table(filepath)
+
+        print(f"✓ Read {len(lines)} game lines from {filepath}")
+        return self.ingest(lines)
+
+    def fetch(self, scoring_period_ids: List[int], size: int = 1000) -> pd.DataFrame:
+        """
+        Fetch game lines for some scoring periods from ESPN
+
+        Returns:
+            Parsed game lines (not stored)
+        """
+        if self.client is None:
+            raise ValueError("An ESPNFantasyClient is required to fetch game logs")
+        return parse_game_logs(self.client.get_player_game_logs(scoring_period_ids, size))
+
+    def refresh(self, through_period: Optional[int] = None, batch_size: int = 7) -> pd.DataFrame:
+        """
+        Fetch and store every completed scoring period after the last stored one
+
+        Args:
+            through_period: Last period to fetch (default: the one before the current period)
+            batch_size: Scoring periods per request
+
+        Returns:
+            The newly stored lines
+        """
+        if through_period is None:
+            if self.client is None:
+                raise ValueError("An ESPNFantasyClient is required to fetch game logs")
+            current = self.client.get_current_scoring_period()
+            if current is None:
+                raise Exception("Could not determine the current scoring period")
+            through_period = current - 1
+
+        first_period = self.last_period() + 1
+        if first_period > through_period:
+            print(f"ℹ️  Game log is up to date (through period {through_period})")
+            return compact_game_logs(pd.DataFrame(columns=KEY_COLUMNS))
+
+        print(f"Fetching scoring periods {first_period}-{through_period}...")
+        batches = []
+        for start in range(first_period, through_period + 1, batch_size):
+            periods = list(range(start, min(start + batch_size, through_period + 1)))
+            batch = self.fetch(periods)
+            print(f"  ✓ Periods {periods[0]}-{periods[-1]}: {len(batch)} game lines")
+            batches.append(batch)
+
+        return self.ingest(pd.concat(batches, ignore_index=True))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ingest per-game stat lines into the game log table")
+    parser.add_argument('--fixture', help="Saved kona_player_info JSON or game log table to ingest instead of ESPN")
+    parser.add_argument('--season', type=int, default=2026, help="Season year (ending year)")
+    parser.add_argument('--through', type=int, help="Last scoring period to fetch")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("ESPN GAME LOG INGESTION")
+    print("=" * 60)
+
+    if args.fixture:
+        scraper = ESPNGameLogScraper(season=args.season)
+        scraper.ingest_fixture(args.fixture)
+    else:
+        load_dotenv()
+        client = ESPNFantasyClient(int(os.getenv('LEAGUE_ID') or 265333986), args.season,
+                                   os.getenv('ESPN_S2'), os.getenv('SWID'))
+        scraper = ESPNGameLogScraper(client, season=args.season)
+        scraper.refresh(args.through)
+
+
+if __name__ == "__main__":
+    main()
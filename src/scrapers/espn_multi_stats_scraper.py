@@ -1,20 +1,52 @@
-import requests
 from bs4 import BeautifulSoup
 import pandas as pd
-import time
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterator, Union
 import json
+import os
+import sys
+
+# Add parent directory to path to import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.http_session import create_session
+from utils.conditional import ValidatorStore
+from utils.rate_limiter import TokenBucket, fetch_pages_concurrently
+from utils.storage import save_table, export_csv, load_table, table_columns, table_path
+from scrapers.stats_table_parser import (
+    CsvPageSink, StatsColumnBuilder, StatsPage, collect_pages, get_stats_parser, open_page_sink
+)
 
 class ESPNMultiStatsScraper:
     """
     Enhanced scraper for multiple ESPN NBA player stat categories
     """
-    def __init__(self):
+    def __init__(self, requests_per_second: float = 1.0, burst: int = 2, max_workers: int = 4,
+                 parser_backend: str = 'auto'):
+        """
+        Initialize multi-category scraper
+        
+        Args:
+            requests_per_second: Sustained request rate to ESPN (politeness limit)
+            burst: Requests allowed back-to-back before the rate applies
+            max_workers: Pages fetched in parallel per category
+            parser_backend: Stats table parser - 'lxml', 'bs4' or 'auto' (lxml when installed)
+        """
         self.base_url = "https://www.espn.com/nba/stats/player"
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         }
         
+        # Keep-alive session + ETag/Last-Modified validators so unchanged pages are not re-parsed
+        self.session = create_session(pool_size=max(10, max_workers))
+        self.validators = ValidatorStore()
+        
+        # Token bucket shared by every request (all pages and all categories)
+        self.rate_limiter = TokenBucket(rate=requests_per_second, burst=burst)
+        self.max_workers = max_workers
+        
+        # Pluggable stats-table parser (lxml fast path, BeautifulSoup fallback)
+        self.parser = get_stats_parser(parser_backend)
+        
         # Define available stat categories
         self.stat_categories = {
             'general': '',  # Default view
@@ -43,7 +75,8 @@ class ESPNMultiStatsScraper:
         
         try:
             print(f"\nTesting category '{category}': {url}")
-            response = requests.get(url, headers=self.headers, timeout=10)
+            self.rate_limiter.acquire()
+            response = self.session.get(url, headers=self.headers, timeout=10)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -76,8 +109,7 @@ class ESPNMultiStatsScraper:
         
         results = {}
         for category in self.stat_categories.keys():
-            results[category] = self.test_stat_category(category)
-            time.sleep(0.5)  # Be polite
+            results[category] = self.test_stat_category(category)  # Rate limited
         
         print(f"\n{'=' * 60}")
         print("SUMMARY:")
@@ -91,29 +123,27 @@ class ESPNMultiStatsScraper:
         
         return results
     
-    def scrape_category(self, category: str, max_pages: int = 20) -> Optional[pd.DataFrame]:
+    def iter_pages(self, category: str, max_pages: int = 20, max_workers: int = None) -> Iterator[StatsPage]:
         """
-        Scrape all pages for a specific stat category
+        Stream parsed pages of one category in page order, stopping at the first empty page
+        Each page is yielded as soon as it (and every page before it) has arrived, so
+        consumers can start on the first page after one request instead of the whole scrape
         
         Args:
             category: Category name from self.stat_categories
             max_pages: Maximum number of pages to scrape
-            
-        Returns:
-            DataFrame with all players' stats for that category
+            max_workers: Pages fetched in parallel (default: the scraper's max_workers, 1 = sequential)
+        
+        Yields:
+            StatsPage batch per page (columns of player records)
         """
         if category not in self.stat_categories:
-            print(f"Unknown category: {category}")
-            return None
-        
-        print(f"\n{'=' * 60}")
-        print(f"SCRAPING CATEGORY: {category.upper()}")
-        print("=" * 60)
+            raise ValueError(f"Unknown category: {category}")
         
-        all_data = []
+        max_workers = max_workers or self.max_workers
         category_url = self.stat_categories[category]
         
-        for page in range(1, max_pages + 1):
+        def fetch_page(page: int) -> Optional[StatsPage]:
             print(f"\nPage {page}/{max_pages}...")
             
             # Construct URL
@@ -123,98 +153,102 @@ class ESPNMultiStatsScraper:
                 url = f"{self.base_url}{category_url}/_/page/{page}"
             
             try:
-                response = requests.get(url, headers=self.headers, timeout=10)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.content, 'html.parser')
-                tables = soup.find_all('table', class_='Table')
+                self.rate_limiter.acquire()
+                stats_page, changed = self.validators.fetch(
+                    self.session, url, self._parse_stats_page, headers=self.headers, timeout=10
+                )
                 
-                if len(tables) < 2:
+                if stats_page is None:
                     print(f"  No more data at page {page}")
-                    break
-                
-                # Parse player names (Table 1)
-                name_table = tables[0]
-                players_data = []
-                name_rows = name_table.find_all('tr', class_='Table__TR')
-                
-                for row in name_rows:
-                    cells = row.find_all('td')
-                    if not cells:
-                        continue
-                    
-                    row_data = []
-                    for i, cell in enumerate(cells):
-                        if i == 0:  # Rank
-                            row_data.append(cell.get_text(strip=True))
-                        elif i == 1:  # Player info
-                            player_link = cell.find('a', class_='AnchorLink')
-                            team_abbrev = cell.find('span', class_='athleteCell__teamAbbrev')
-                            
-                            player_name = player_link.get_text(strip=True) if player_link else ''
-                            team = team_abbrev.get_text(strip=True) if team_abbrev else ''
-                            
-                            player_id = None
-                            if player_link and player_link.get('href'):
-                                href = player_link['href']
-                                parts = href.split('/id/')
-                                if len(parts) > 1:
-                                    player_id = parts[1].split('/')[0]
-                            
-                            row_data.extend([player_name, team, player_id])
-                    
-                    if row_data:
-                        players_data.append(row_data)
-                
-                # Parse stats (Table 2)
-                stats_table = tables[1]
-                stats_headers = [th.get_text(strip=True) for th in stats_table.find_all('th') if th.get_text(strip=True)]
-                
-                stats_data = []
-                stats_rows = stats_table.find_all('tr', class_='Table__TR')
-                
-                for row in stats_rows:
-                    cells = row.find_all('td')
-                    if not cells:
-                        continue
-                    row_stats = [cell.get_text(strip=True) for cell in cells]
-                    if row_stats:
-                        stats_data.append(row_stats)
+                    return None
                 
-                # Combine data
-                if players_data and stats_data:
-                    name_df = pd.DataFrame(players_data, columns=['RK', 'Name', 'Team', 'PlayerID'])
-                    stats_df = pd.DataFrame(stats_data, columns=stats_headers)
-                    page_df = pd.concat([name_df, stats_df], axis=1)
-                    all_data.append(page_df)
-                    print(f"  ✓ Scraped {len(page_df)} players")
-                else:
-                    break
-                
-                time.sleep(1)
+                note = "" if changed else " (unchanged, parse skipped)"
+                print(f"  ✓ Scraped {len(stats_page)} players (page {page}){note}")
+                return stats_page
                 
             except Exception as e:
                 print(f"  Error on page {page}: {e}")
-                break
+                return None
         
-        if all_data:
-            combined_df = pd.concat(all_data, ignore_index=True)
-            print(f"\n✓ Total: {len(combined_df)} players, {len(combined_df.columns)} columns")
-            return combined_df
-        else:
+        return fetch_pages_concurrently(fetch_page, max_pages, max_workers)
+    
+    def scrape_category(self, category: str, max_pages: int = 20, max_workers: int = None) -> Optional[pd.DataFrame]:
+        """
+        Scrape all pages for a specific stat category
+        Pages are streamed into one set of columns and turned into a DataFrame once
+        
+        Args:
+            category: Category name from self.stat_categories
+            max_pages: Maximum number of pages to scrape
+            max_workers: Pages fetched in parallel (default: the scraper's max_workers, 1 = sequential)
+            
+        Returns:
+            DataFrame with all players' stats for that category
+        """
+        if category not in self.stat_categories:
+            print(f"Unknown category: {category}")
             return None
+        
+        print(f"\n{'=' * 60}")
+        print(f"SCRAPING CATEGORY: {category.upper()}")
+        print("=" * 60)
+        
+        combined_df = collect_pages(self.iter_pages(category, max_pages, max_workers))
+        
+        if combined_df is not None:
+            print(f"\n✓ Total: {len(combined_df)} players, {len(combined_df.columns)} columns")
+        return combined_df
     
-    def scrape_all_categories(self, categories: List[str], max_pages: int = 20, season: str = "2025") -> Dict[str, pd.DataFrame]:
+    def stream_category_to_csv(self, category: str, filepath: str, max_pages: int = 20,
+                               max_workers: int = None) -> int:
+        """
+        Scrape a category straight to disk, one page at a time
+        Memory stays at about one page regardless of how many pages are scraped
+        
+        Args:
+            category: Category name from self.stat_categories
+            filepath: Output CSV path
+            max_pages: Maximum number of pages to scrape
+            max_workers: Pages fetched in parallel (default: the scraper's max_workers, 1 = sequential)
+            
+        Returns:
+            Number of player rows written
+        """
+        with CsvPageSink(filepath) as sink:
+            for page in self.iter_pages(category, max_pages, max_workers):
+                sink.write(page)
+        
+        print(f"  ✓ Streamed {sink.num_rows} players ({sink.num_pages} pages) to {filepath}")
+        return sink.num_rows
+    
+    def _parse_stats_page(self, content: bytes) -> Optional[StatsPage]:
+        """
+        Parse one ESPN stats page (name table + stats table) into columns
+        
+        Args:
+            content: Raw page HTML
+        
+        Returns:
+            StatsPage for the page, or None if the page has no player data
+        """
+        return self.parser.parse_columns(content)
+    
+    def scrape_all_categories(self, categories: List[str], max_pages: int = 20, season: str = "2025",
+                              keep_frames: bool = False) -> Dict[str, Union[str, pd.DataFrame]]:
         """
         Scrape multiple stat categories
+        Each page goes straight to the category's file, so memory stays at about one
+        page per category unless keep_frames asks for the DataFrames as well
         
         Args:
             categories: List of category names to scrape
             max_pages: Max pages per category
             season: Season identifier
+            keep_frames: Also collect each category into a DataFrame in memory
             
         Returns:
-            Dictionary mapping category names to DataFrames
+            Dictionary mapping category names to their saved table path
+            (or to DataFrames with keep_frames) - either form can go to merge_categories
         """
         print("=" * 60)
         print(f"SCRAPING MULTIPLE CATEGORIES - {season} SEASON")
@@ -227,24 +261,35 @@ class ESPNMultiStatsScraper:
                 print(f"\n⚠ Skipping unknown category: {category}")
                 continue
             
-            df = self.scrape_category(category, max_pages)
-            if df is not None:
-                results[category] = df
-                # Save individual category
-                filename = f"player_stats_{season}_{category}.csv"
-                df.to_csv(f"data/{filename}", index=False)
-                print(f"  ✓ Saved: data/{filename}")
+            print(f"\n{'=' * 60}")
+            print(f"SCRAPING CATEGORY: {category.upper()}")
+            print("=" * 60)
             
-            time.sleep(2)  # Be extra polite between categories
+            # Each page is appended to the category file as it arrives
+            # (Arrow record batches when pyarrow is installed, CSV rows otherwise)
+            filepath = table_path(f"player_stats_{season}_{category}")
+            builder = StatsColumnBuilder() if keep_frames else None
+            with open_page_sink(filepath) as sink:
+                for page in self.iter_pages(category, max_pages):
+                    sink.write(page)
+                    if builder is not None:
+                        builder.append(page)
+            
+            if sink.num_rows:
+                results[category] = builder.to_dataframe() if builder is not None else filepath
+                print(f"\n✓ Total: {sink.num_rows} players, {len(sink.fieldnames)} columns")
+                print(f"  ✓ Saved: {filepath}")
+            elif os.path.exists(filepath):
+                os.remove(filepath)
         
         return results
     
-    def merge_categories(self, dataframes: Dict[str, pd.DataFrame], season: str = "2025") -> pd.DataFrame:
+    def merge_categories(self, dataframes: Dict[str, Union[str, pd.DataFrame]], season: str = "2025") -> pd.DataFrame:
         """
         Merge multiple stat category DataFrames into one master dataset
         
         Args:
-            dataframes: Dict of category name -> DataFrame
+            dataframes: Dict of category name -> DataFrame or saved table path (from scrape_all_categories)
             season: Season identifier
             
         Returns:
@@ -259,19 +304,20 @@ class ESPNMultiStatsScraper:
             return None
         
         # Start with first dataframe as base
-        base_category = list(dataframes.keys())[0]
-        merged = dataframes[base_category].copy()
+        base_category, base = list(dataframes.items())[0]
+        merged = base.copy() if isinstance(base, pd.DataFrame) else load_table(base)
         print(f"\nBase: {base_category} ({len(merged.columns)} columns)")
         
         # Merge additional categories
         for category, df in list(dataframes.items())[1:]:
             # Merge on player identifiers
-            print(f"Adding: {category} ({len(df.columns)} columns)")
+            columns = list(df.columns) if isinstance(df, pd.DataFrame) else table_columns(df)
+            print(f"Adding: {category} ({len(columns)} columns)")
             
-            # Keep only new columns (avoid duplicates)
+            # Keep only new columns (avoid duplicates) - saved tables only load those
             merge_cols = ['Name', 'Team', 'PlayerID']
-            new_cols = [col for col in df.columns if col not in merged.columns or col in merge_cols]
-            df_subset = df[new_cols]
+            new_cols = [col for col in columns if col not in merged.columns or col in merge_cols]
+            df_subset = df[new_cols] if isinstance(df, pd.DataFrame) else load_table(df, columns=new_cols)
             
             merged = merged.merge(df_subset, on=merge_cols, how='left', suffixes=('', f'_{category}'))
             print(f"  ✓ Merged (total columns now: {len(merged.columns)})")
@@ -279,11 +325,32 @@ class ESPNMultiStatsScraper:
         print(f"\n✓ Final merged dataset: {len(merged)} players, {len(merged.columns)} columns")
         
         # Save merged dataset
-        filename = f"player_stats_{season}_merged.csv"
-        merged.to_csv(f"data/{filename}", index=False)
-        print(f"✓ Saved: data/{filename}")
+        filepath = save_table(merged, table_path(f"player_stats_{season}_merged"))
+        print(f"✓ Saved: {filepath}")
         
         return merged
+    
+    def save_stats(self, df: pd.DataFrame, season: str = "2025", category: str = None,
+                   csv_export: bool = False) -> str:
+        """
+        Save one category's stats to the data directory
+        
+        Args:
+            df: DataFrame to save
+            season: Season identifier
+            category: Category name used in the filename (optional)
+            csv_export: Also write a CSV copy for spreadsheets
+            
+        Returns:
+            Path of the saved table
+        """
+        name = f"player_stats_{season}_{category}" if category else f"player_stats_{season}_season"
+        filepath = save_table(df, table_path(name))
+        print(f"\n✓ Stats saved to {filepath}")
+        if csv_export:
+            print(f"  CSV export: {export_csv(df, filepath)}")
+        print(f"  Total records: {len(df)}")
+        return filepath
 
 
 def main():
@@ -1,20 +1,58 @@
-import requests
 from bs4 import BeautifulSoup
 import pandas as pd
 import time
-from typing import List, Dict, Optional
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple
+import hashlib
+import json
+import os
+import sys
+import numpy as np
+
+# Add parent directory to path to import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.http_session import create_session
+from utils.conditional import ValidatorStore
+from utils.rate_limiter import TokenBucket
+from utils.storage import save_table, export_csv, table_path, find_table, load_table
+from utils.season_calendar import SeasonCalendar
 
 class ESPNScheduleScraper:
     """
     Scraper for ESPN NBA team schedules
     """
-    def __init__(self):
+    def __init__(self, requests_per_second: float = 2.0, burst: int = 4, max_workers: int = 8,
+                 retries: int = 2):
+        """
+        Initialize schedule scraper
+        
+        Args:
+            requests_per_second: Sustained request rate to ESPN (global across workers)
+            burst: Requests allowed back-to-back before the rate applies
+            max_workers: Teams scraped in parallel by get_all_team_schedules
+            retries: Extra attempts per team after a failed scrape
+        """
         self.base_url = "https://www.espn.com/nba/team/schedule/_/name"
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         }
         
+        # Keep-alive session + ETag/Last-Modified validators so unchanged pages are not re-parsed
+        self.session = create_session(pool_size=max(10, max_workers))
+        self.validators = ValidatorStore()
+        
+        # Global rate limit shared by all workers
+        self.rate_limiter = TokenBucket(rate=requests_per_second, burst=burst)
+        self.max_workers = max_workers
+        self.retries = retries
+        
+        # Year rollover for ESPN's year-less dates, cached across teams and seasons
+        self.calendar = SeasonCalendar()
+        
+        # Teams that failed in the last get_all_team_schedules run (team -> error)
+        self.failed_teams: Dict[str, str] = {}
+        
         # All 30 NBA teams with their ESPN abbreviations
         self.nba_teams = {
             'ATL': 'Atlanta Hawks',
@@ -56,7 +94,7 @@ class ESPNScheduleScraper:
         url = f"{self.base_url}/{team_abbr.lower()}"
         
         try:
-            response = requests.get(url, headers=self.headers)
+            response = self.session.get(url, headers=self.headers)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -130,98 +168,168 @@ class ESPNScheduleScraper:
         Returns:
             DataFrame with team's schedule including parsed dates and back-to-backs
         """
-        url = f"{self.base_url}/{team_abbr.lower()}"
-        
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Find schedule table
-            tables = soup.find_all('table', class_='Table')
-            
-            if not tables:
-                print(f"No tables found for {team_abbr}")
-                return None
-            
-            schedule_table = tables[0]
-            tbody = schedule_table.find('tbody')
-            
-            if not tbody:
-                print(f"No tbody found for {team_abbr}")
-                return None
-            
-            # Find all rows
-            all_rows = tbody.find_all('tr')
-            
-            # Find header row (has Table_Headers class)
-            headers = []
-            header_row_idx = None
-            for idx, row in enumerate(all_rows):
-                cells = row.find_all('td')
-                if cells and 'Table_Headers' in cells[0].get('class', []):
-                    headers = [cell.get_text(strip=True) for cell in cells]
-                    header_row_idx = idx
-                    break
-            
-            if not headers:
-                print(f"Could not find headers for {team_abbr}")
-                return None
-            
-            # Extract schedule data (skip section headers and header row)
-            schedule_data = []
-            for row in all_rows[header_row_idx + 1:]:
-                cells = row.find_all('td')
-                if not cells:
-                    continue
-                
-                # Skip section divider rows (like "Regular Season", "Playoffs", etc.)
-                if len(cells) == 1 or 'Table__Title' in cells[0].get('class', []):
-                    continue
-                
-                row_data = []
-                for cell in cells:
-                    text = cell.get_text(strip=True)
-                    row_data.append(text)
-                
-                if row_data and len(row_data) >= 3:  # At least DATE, OPPONENT, TIME
-                    schedule_data.append(row_data)
-            
-            # Create DataFrame
-            if schedule_data:
-                # Use only the relevant columns (ignore 'tickets' column)
-                df = pd.DataFrame(schedule_data, columns=headers[:len(schedule_data[0])])
-                
-                # Keep only relevant columns
-                relevant_cols = ['DATE', 'OPPONENT', 'TIME', 'TV']
-                df = df[[col for col in relevant_cols if col in df.columns]]
-                
-                # Add team column
-                df.insert(0, 'Team', team_abbr.upper())
-                
-                # Parse and enhance the schedule
-                df = self._enhance_schedule(df, team_abbr.upper())
-                
-                print(f"  ✓ Scraped {len(df)} games for {team_abbr.upper()}")
-                return df
-            else:
-                print(f"  ✗ No schedule data found for {team_abbr.upper()}")
-                return None
-                
+            return self._scrape_team_schedule(team_abbr, season)
         except Exception as e:
             print(f"  ✗ Error scraping {team_abbr.upper()}: {e}")
             import traceback
             traceback.print_exc()
             return None
     
-    def _enhance_schedule(self, df: pd.DataFrame, team_abbr: str) -> pd.DataFrame:
+    def _scrape_team_schedule(self, team_abbr: str, season: str = "2026") -> Optional[pd.DataFrame]:
+        """
+        Fetch and parse one team's schedule, letting request/parse errors propagate
+        
+        Args:
+            team_abbr: Team abbreviation
+            season: Season identifier
+        
+        Returns:
+            Enhanced schedule DataFrame or None if the page had no schedule
+        """
+        url = self._schedule_url(team_abbr, season)
+        
+        self.rate_limiter.acquire()
+        df, changed = self.validators.fetch(
+            self.session, url,
+            lambda content: self._parse_schedule_page(content, team_abbr, season),
+            headers=self.headers, timeout=10
+        )
+        
+        if df is None:
+            return None
+        
+        note = "" if changed else " (unchanged, parse skipped)"
+        print(f"  ✓ Scraped {len(df)} games for {team_abbr.upper()}{note}")
+        return df.copy()
+    
+    def _schedule_url(self, team_abbr: str, season: str) -> str:
+        return f"{self.base_url}/{team_abbr.lower()}/season/{season}"
+    
+    def _parse_schedule_page(self, content: bytes, team_abbr: str, season: str = "2026") -> Optional[pd.DataFrame]:
+        """
+        Parse a team schedule page into an enhanced schedule DataFrame
+        
+        Args:
+            content: Raw page HTML
+            team_abbr: Team abbreviation
+            season: Season the page belongs to (decides the year of each date)
+        
+        Returns:
+            Enhanced schedule DataFrame or None if no schedule was found
+        """
+        table = self._extract_schedule_rows(content, team_abbr)
+        if table is None:
+            return None
+        
+        headers, schedule_data = table
+        return self._build_schedule(headers, schedule_data, team_abbr, season)
+    
+    def _extract_schedule_rows(self, content: bytes, team_abbr: str) -> Optional[Tuple[List[str], List[List[str]]]]:
+        """
+        Extract the raw schedule table (header cells + game rows) from a team page
+        
+        Args:
+            content: Raw page HTML
+            team_abbr: Team abbreviation
+        
+        Returns:
+            Tuple of (headers, rows of cell text) or None if no schedule was found
+        """
+        soup = BeautifulSoup(content, 'html.parser')
+        
+        # Find schedule table
+        tables = soup.find_all('table', class_='Table')
+        
+        if not tables:
+            print(f"No tables found for {team_abbr}")
+            return None
+        
+        schedule_table = tables[0]
+        tbody = schedule_table.find('tbody')
+        
+        if not tbody:
+            print(f"No tbody found for {team_abbr}")
+            return None
+        
+        # Find all rows
+        all_rows = tbody.find_all('tr')
+        
+        # Find header row (has Table_Headers class)
+        headers = []
+        header_row_idx = None
+        for idx, row in enumerate(all_rows):
+            cells = row.find_all('td')
+            if cells and 'Table_Headers' in cells[0].get('class', []):
+                headers = [cell.get_text(strip=True) for cell in cells]
+                header_row_idx = idx
+                break
+        
+        if not headers:
+            print(f"Could not find headers for {team_abbr}")
+            return None
+        
+        # Extract schedule data (skip section headers and header row)
+        schedule_data = []
+        for row in all_rows[header_row_idx + 1:]:
+            cells = row.find_all('td')
+            if not cells:
+                continue
+            
+            # Skip section divider rows (like "Regular Season", "Playoffs", etc.)
+            if len(cells) == 1 or 'Table__Title' in cells[0].get('class', []):
+                continue
+            
+            row_data = []
+            for cell in cells:
+                text = cell.get_text(strip=True)
+                row_data.append(text)
+            
+            if row_data and len(row_data) >= 3:  # At least DATE, OPPONENT, TIME
+                schedule_data.append(row_data)
+        
+        if not schedule_data:
+            print(f"  ✗ No schedule data found for {team_abbr.upper()}")
+            return None
+        
+        return headers, schedule_data
+    
+    def _build_schedule(self, headers: List[str], schedule_data: List[List[str]], team_abbr: str,
+                        season: str = "2026") -> pd.DataFrame:
+        """
+        Turn raw schedule rows into an enhanced schedule DataFrame
+        
+        Args:
+            headers: Header cells of the schedule table
+            schedule_data: Game rows (cell text)
+            team_abbr: Team abbreviation
+            season: Season the rows belong to
+        
+        Returns:
+            Enhanced schedule DataFrame
+        """
+        # Use only the relevant columns (ignore 'tickets' column)
+        df = pd.DataFrame(schedule_data, columns=headers[:len(schedule_data[0])])
+        
+        # Keep only relevant columns
+        relevant_cols = ['DATE', 'OPPONENT', 'TIME', 'TV']
+        df = df[[col for col in relevant_cols if col in df.columns]]
+        
+        # Add team column
+        df.insert(0, 'Team', team_abbr.upper())
+        
+        # Parse and enhance the schedule
+        return self._enhance_schedule(df, team_abbr.upper(), season)
+    
+    def _enhance_schedule(self, df: pd.DataFrame, team_abbr: str, season: str = "2026") -> pd.DataFrame:
         """
         Enhance schedule with parsed dates, day of week, home/away, back-to-backs
+        All steps are column operations - no per-row apply or loop
         
         Args:
             df: Raw schedule DataFrame
             team_abbr: Team abbreviation
+            season: Season identifier - decides which year each "Wed, Oct 22" falls in
         
         Returns:
             Enhanced DataFrame with additional columns
@@ -229,29 +337,11 @@ class ESPNScheduleScraper:
         # Parse dates from ESPN format "Wed, Oct 22"
         if 'DATE' in df.columns:
             try:
-                # ESPN format: "Wed, Oct 22" or similar
-                # We need to add the year (2025 for Oct-Dec, 2026 for Jan+)
-                def parse_espn_date(date_str):
-                    try:
-                        # First try parsing with just the date part
-                        # ESPN format is like "Wed, Oct 22" - day name, month, day
-                        from datetime import datetime
-                        
-                        # Parse the date string
-                        # Add current year first
-                        temp_date = datetime.strptime(date_str + ', 2025', '%a, %b %d, %Y')
-                        
-                        # Adjust year based on month
-                        # Oct, Nov, Dec = 2025; Jan-Sep = 2026
-                        if temp_date.month < 10:
-                            temp_date = temp_date.replace(year=2026)
-                        
-                        return pd.Timestamp(temp_date)
-                    except Exception as e:
-                        print(f"      Error parsing date '{date_str}': {e}")
-                        return pd.NaT
+                df['ParsedDate'] = self.calendar.parse_dates(df['DATE'], season)
                 
-                df['ParsedDate'] = df['DATE'].apply(parse_espn_date)
+                failed = df.loc[df['ParsedDate'].isna() & df['DATE'].notna(), 'DATE']
+                if len(failed):
+                    print(f"      Error parsing {len(failed)} date(s) for {team_abbr}: {failed.head(5).tolist()}")
                 
                 # Debug: Show first few parsed dates
                 print(f"    First 3 parsed dates: {df['ParsedDate'].head(3).tolist()}")
@@ -260,21 +350,17 @@ class ESPNScheduleScraper:
                 df['DayOfWeek'] = df['ParsedDate'].dt.day_name()
                 
                 # Sort by date
-                df = df.sort_values('ParsedDate').reset_index(drop=True)
+                df = df.sort_values('ParsedDate', kind='stable').reset_index(drop=True)
                 
                 # Detect back-to-backs - mark BOTH games
-                df['IsBackToBack'] = False
-                df['BackToBackPosition'] = 'None'
+                # A game the day after the previous one is 'Second', a game the day before the next one
+                # is 'First'; the middle game of three straight days is 'First' (same as the old row loop)
+                day_gap = df['ParsedDate'].diff().dt.days
+                after_previous = (day_gap == 1).to_numpy()
+                before_next = (day_gap.shift(-1) == 1).to_numpy()
                 
-                for i in range(1, len(df)):
-                    if pd.notna(df.loc[i, 'ParsedDate']) and pd.notna(df.loc[i-1, 'ParsedDate']):
-                        days_diff = (df.loc[i, 'ParsedDate'] - df.loc[i-1, 'ParsedDate']).days
-                        if days_diff == 1:
-                            # Mark BOTH games as back-to-backs
-                            df.loc[i-1, 'IsBackToBack'] = True
-                            df.loc[i-1, 'BackToBackPosition'] = 'First'
-                            df.loc[i, 'IsBackToBack'] = True
-                            df.loc[i, 'BackToBackPosition'] = 'Second'
+                df['IsBackToBack'] = after_previous | before_next
+                df['BackToBackPosition'] = np.where(before_next, 'First', np.where(after_previous, 'Second', 'None'))
                 
                 # Debug: Show back-to-backs
                 b2b_count = df['IsBackToBack'].sum()
@@ -288,75 +374,316 @@ class ESPNScheduleScraper:
         # Parse opponent and home/away
         if 'OPPONENT' in df.columns:
             # ESPN format: "vsToronto" (home) or "@Orlando" (away)
-            df['HomeAway'] = df['OPPONENT'].apply(
-                lambda x: 'Away' if str(x).startswith('@') else 'Home'
-            )
+            opponent = df['OPPONENT'].astype(str)
+            df['HomeAway'] = np.where(opponent.str.startswith('@'), 'Away', 'Home')
             
             # Clean opponent name (remove 'vs' and '@' prefixes, handle spaces)
-            def clean_opponent(opp):
-                opp = str(opp)
-                # Remove @ prefix
-                if opp.startswith('@'):
-                    opp = opp[1:]
-                # Remove vs prefix (case insensitive)
-                if opp.lower().startswith('vs'):
-                    opp = opp[2:]
-                return opp.strip()
-            
-            df['OpponentClean'] = df['OPPONENT'].apply(clean_opponent)
+            df['OpponentClean'] = (
+                opponent.str.replace(r'^@', '', regex=True)
+                        .str.replace(r'^(?i:vs)', '', regex=True)
+                        .str.strip()
+            )
         
         return df
     
-    def get_all_team_schedules(self, season: str = "2026") -> Optional[pd.DataFrame]:
+    def _scrape_with_retry(self, team_abbr: str, season: str, retries: int) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
+        """
+        Scrape one team, retrying with exponential backoff
+        
+        Returns:
+            Tuple of (schedule DataFrame or None, error message or None)
+        """
+        error = None
+        for attempt in range(retries + 1):
+            if attempt:
+                time.sleep(0.5 * 2 ** (attempt - 1))
+                print(f"  ↻ Retrying {team_abbr} (attempt {attempt + 1}/{retries + 1})")
+            
+            try:
+                df = self._scrape_team_schedule(team_abbr, season)
+                if df is not None:
+                    return df, None
+                error = "No schedule data found"
+            except Exception as e:
+                error = str(e)
+                print(f"  ✗ Error scraping {team_abbr}: {e}")
+        
+        return None, error
+    
+    def scrape_team_schedules(self, teams: List[str] = None, season: str = "2026", max_workers: int = None,
+                              retries: int = None) -> Tuple[Optional[pd.DataFrame], Dict[str, str]]:
+        """
+        Scrape several team schedules in parallel with per-team retry
+        Fetching, parsing and _enhance_schedule all run in the worker threads
+        
+        Args:
+            teams: Team abbreviations (default: all 30 NBA teams)
+            season: Season identifier (e.g., "2026" for 2025-26 season)
+            max_workers: Teams scraped in parallel (default: the scraper's max_workers)
+            retries: Extra attempts per team (default: the scraper's retries)
+        
+        Returns:
+            Tuple of (combined DataFrame or None, dict of failed team -> error message)
+        """
+        teams = [team.upper() for team in (teams or self.nba_teams.keys())]
+        max_workers = max_workers or self.max_workers
+        retries = self.retries if retries is None else retries
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(lambda team: self._scrape_with_retry(team, season, retries), teams))
+        
+        # Keep team order stable regardless of completion order
+        schedules = [df for df, _ in results if df is not None]
+        failures = {team: error for team, (df, error) in zip(teams, results) if df is None}
+        
+        combined_df = pd.concat(schedules, ignore_index=True) if schedules else None
+        return combined_df, failures
+    
+    def get_all_team_schedules(self, season: str = "2026", max_workers: int = None,
+                               retries: int = None) -> Optional[pd.DataFrame]:
         """
         Scrape schedules for all 30 NBA teams
+        Teams that still fail after retries are reported and kept in self.failed_teams
         
         Args:
             season: Season identifier (e.g., "2026" for 2025-26 season)
+            max_workers: Teams scraped in parallel (default: the scraper's max_workers)
+            retries: Extra attempts per team (default: the scraper's retries)
         
         Returns:
             Combined DataFrame with all team schedules
         """
-        all_schedules = []
         total_teams = len(self.nba_teams)
         
         print(f"\nScraping schedules for all {total_teams} NBA teams...")
         print("=" * 60)
         
-        for idx, (abbr, name) in enumerate(self.nba_teams.items(), 1):
-            print(f"[{idx}/{total_teams}] {name} ({abbr})...")
-            
-            df = self.get_team_schedule(abbr, season)
-            if df is not None:
-                all_schedules.append(df)
-            
-            # Be polite to ESPN's servers
-            time.sleep(0.5)
+        combined_df, self.failed_teams = self.scrape_team_schedules(
+            season=season, max_workers=max_workers, retries=retries
+        )
         
-        if all_schedules:
-            combined_df = pd.concat(all_schedules, ignore_index=True)
+        if self.failed_teams:
+            print(f"\n⚠ {len(self.failed_teams)} team(s) failed:")
+            for abbr, error in self.failed_teams.items():
+                print(f"  - {self.nba_teams.get(abbr, abbr)} ({abbr}): {error}")
+        
+        if combined_df is not None:
             print(f"\n{'=' * 60}")
             print(f"✓ Successfully scraped {len(combined_df)} total games")
-            print(f"  Teams: {combined_df['Team'].nunique()}")
+            print(f"  Teams: {combined_df['Team'].nunique()}/{total_teams}")
             print(f"  Columns: {combined_df.columns.tolist()}")
             return combined_df
         else:
             print("\n✗ No schedule data collected")
             return None
     
-    def save_schedules(self, df: pd.DataFrame, season: str = "2026") -> None:
+    def _fetch_schedule_rows(self, team_abbr: str, season: str, retries: int) -> Tuple[Optional[Tuple], Optional[str]]:
         """
-        Save schedules to CSV file
+        Fetch one team's raw schedule table, retrying with exponential backoff
+        Raw rows are cached under their own validator key, so a 304 skips extraction too
+        
+        Returns:
+            Tuple of ((headers, rows) or None, error message or None)
+        """
+        url = self._schedule_url(team_abbr, season)
+        error = None
+        for attempt in range(retries + 1):
+            if attempt:
+                time.sleep(0.5 * 2 ** (attempt - 1))
+                print(f"  ↻ Retrying {team_abbr} (attempt {attempt + 1}/{retries + 1})")
+            
+            try:
+                self.rate_limiter.acquire()
+                table, _ = self.validators.fetch(
+                    self.session, url,
+                    lambda content: self._extract_schedule_rows(content, team_abbr),
+                    headers=self.headers, timeout=10, key=('rows', url)
+                )
+                if table is not None:
+                    return table, None
+                error = "No schedule data found"
+            except Exception as e:
+                error = str(e)
+                print(f"  ✗ Error scraping {team_abbr}: {e}")
+        
+        return None, error
+    
+    @staticmethod
+    def _hash_schedule_rows(table: Tuple[List[str], List[List[str]]]) -> str:
+        # Hash of the table contents only - page chrome (ads, timestamps) does not count as a change
+        return hashlib.sha1(json.dumps(table, separators=(',', ':')).encode()).hexdigest()
+    
+    def refresh_schedules(self, season: str = "2026", teams: List[str] = None, max_workers: int = None,
+                          retries: int = None) -> Tuple[Optional[pd.DataFrame], pd.DataFrame]:
+        """
+        Incrementally refresh the stored schedule table
+        
+        Every team page is fetched (conditionally), but only teams whose raw schedule
+        table hash changed since the last refresh are re-parsed and enhanced. Their
+        rows are swapped into the stored table, which is then saved along with the
+        per-team hashes. Teams that fail keep their stored rows.
+        
+        Args:
+            season: Season identifier (e.g., "2026" for 2025-26 season)
+            teams: Team abbreviations (default: all 30 NBA teams)
+            max_workers: Teams fetched in parallel (default: the scraper's max_workers)
+            retries: Extra attempts per team (default: the scraper's retries)
+        
+        Returns:
+            Tuple of (updated schedule DataFrame or None, change log DataFrame with
+            Team, Change ('added'/'removed'/'moved'), Opponent, HomeAway, OldDate, NewDate)
+        """
+        teams = [team.upper() for team in (teams or self.nba_teams.keys())]
+        max_workers = max_workers or self.max_workers
+        retries = self.retries if retries is None else retries
+        
+        filepath = table_path(f"team_schedules_{season}_season")
+        hashes_path = self._hashes_path(season)
+        
+        stored_path = find_table(filepath)
+        stored_df = load_table(stored_path, parse_dates=['ParsedDate']) if stored_path else None
+        stored_hashes = self._load_hashes(hashes_path)
+        stored_teams = set(stored_df['Team'].unique()) if stored_df is not None else set()
+        
+        print(f"\nRefreshing schedules for {len(teams)} teams...")
+        print("=" * 60)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            fetched = list(executor.map(lambda team: self._fetch_schedule_rows(team, season, retries), teams))
+        
+        self.failed_teams = {team: error for team, (table, error) in zip(teams, fetched) if table is None}
+        
+        team_frames = []
+        changes = []
+        new_hashes = dict(stored_hashes)
+        changed_teams = []
+        
+        for team, (table, _) in zip(teams, fetched):
+            old_rows = stored_df[stored_df['Team'] == team] if team in stored_teams else None
+            
+            if table is None:
+                # Failed fetch - keep whatever we had
+                if old_rows is not None:
+                    team_frames.append(old_rows)
+                continue
+            
+            table_hash = self._hash_schedule_rows(table)
+            if old_rows is not None and stored_hashes.get(team) == table_hash:
+                team_frames.append(old_rows)
+                continue
+            
+            # Changed (or new) team: only now pay for building + _enhance_schedule
+            headers, rows = table
+            new_rows = self._build_schedule(headers, rows, team, season)
+            team_frames.append(new_rows)
+            new_hashes[team] = table_hash
+            changed_teams.append(team)
+            changes.extend(self._diff_team_games(team, old_rows, new_rows))
+        
+        # Teams outside this refresh stay as stored
+        if stored_df is not None:
+            others = stored_df[~stored_df['Team'].isin(teams)]
+            if len(others):
+                team_frames.append(others)
+        
+        changelog = pd.DataFrame(changes, columns=['Team', 'Change', 'Opponent', 'HomeAway', 'OldDate', 'NewDate'])
+        
+        print(f"\n✓ {len(changed_teams)} team(s) changed, {len(teams) - len(changed_teams) - len(self.failed_teams)} unchanged")
+        if changed_teams:
+            print(f"  Re-parsed: {', '.join(changed_teams)}")
+        for change, count in changelog['Change'].value_counts().items():
+            print(f"  {change}: {count} game(s)")
+        if self.failed_teams:
+            print(f"⚠ {len(self.failed_teams)} team(s) failed: {', '.join(self.failed_teams)}")
+        
+        if not team_frames:
+            print("\n✗ No schedule data collected")
+            return None, changelog
+        
+        updated_df = pd.concat(team_frames, ignore_index=True)
+        if changed_teams or stored_path != filepath:
+            save_table(updated_df, filepath)
+            self._save_hashes(hashes_path, new_hashes)
+            print(f"✓ Schedules saved to {filepath}")
+        
+        return updated_df, changelog
+    
+    @staticmethod
+    def _diff_team_games(team: str, old_rows: Optional[pd.DataFrame], new_rows: pd.DataFrame) -> List[Dict]:
+        """
+        Games added, removed or moved (same opponent and venue, new date) for one team
+        """
+        def games(df: Optional[pd.DataFrame]) -> List[Tuple]:
+            if df is None or df.empty:
+                return []
+            return list(zip(df['OpponentClean'], df['HomeAway'], df['ParsedDate']))
+        
+        old_games, new_games = games(old_rows), games(new_rows)
+        new_set = set(new_games)
+        old_set = set(old_games)
+        removed = [game for game in old_games if game not in new_set]
+        added = [game for game in new_games if game not in old_set]
+        
+        changes = []
+        for opponent, home_away, old_date in removed:
+            # Same matchup on another date = postponed/rescheduled game
+            match = next((game for game in added if game[:2] == (opponent, home_away)), None)
+            if match is not None:
+                added.remove(match)
+                changes.append({'Team': team, 'Change': 'moved', 'Opponent': opponent, 'HomeAway': home_away,
+                                'OldDate': old_date, 'NewDate': match[2]})
+            else:
+                changes.append({'Team': team, 'Change': 'removed', 'Opponent': opponent, 'HomeAway': home_away,
+                                'OldDate': old_date, 'NewDate': pd.NaT})
+        
+        for opponent, home_away, new_date in added:
+            changes.append({'Team': team, 'Change': 'added', 'Opponent': opponent, 'HomeAway': home_away,
+                            'OldDate': pd.NaT, 'NewDate': new_date})
+        
+        return changes
+    
+    @staticmethod
+    def _hashes_path(season: str) -> str:
+        return f"data/team_schedules_{season}_hashes.json"
+    
+    @staticmethod
+    def _load_hashes(path: str) -> Dict[str, str]:
+        if not os.path.exists(path):
+            return {}
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠ Could not load schedule hashes from {path}: {e}")
+            return {}
+    
+    @staticmethod
+    def _save_hashes(path: str, hashes: Dict[str, str]) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(hashes, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+    
+    def save_schedules(self, df: pd.DataFrame, season: str = "2026", csv_export: bool = False) -> str:
+        """
+        Save schedules to the data directory
+        Written as Feather so ParsedDate (datetime64) and IsBackToBack (bool) load back as-is
         
         Args:
             df: DataFrame with schedule data
             season: Season identifier
+            csv_export: Also write a CSV copy for spreadsheets
+        
+        Returns:
+            Path of the saved table
         """
-        filename = f"team_schedules_{season}_season.csv"
-        filepath = f"data/{filename}"
-        df.to_csv(filepath, index=False)
+        filepath = save_table(df, table_path(f"team_schedules_{season}_season"))
         print(f"\n✓ Schedules saved to {filepath}")
+        if csv_export:
+            print(f"  CSV export: {export_csv(df, filepath)}")
         print(f"  Total records: {len(df)}")
+        return filepath
     
     def analyze_weekly_games(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -400,7 +727,7 @@ def main():
     season = "2026"  # 2025-26 season
     
     print("=" * 60)
-    print(f"NBA TEAM SCHEDULES - {season} SEASON (2025-26)")
+    print(f"NBA TEAM SCHEDULES - {season} SEASON ({scraper.calendar.season_label(season)})")
     print("=" * 60)
     
     # Option 1: Inspect a single team's page
@@ -416,7 +743,7 @@ def main():
     
     # Option 3: Scrape all teams
     print("\n" + "=" * 60)
-    user_input = input("\nScrape ALL 30 team schedules? This will take ~30 seconds (y/n): ")
+    user_input = input("\nScrape ALL 30 team schedules? This will take ~15 seconds (y/n): ")
     
     if user_input.lower() == 'y':
         df_all = scraper.get_all_team_schedules(season)
@@ -431,10 +758,10 @@ def main():
             print(df_all.head(20))
             
             # Save to file
-            scraper.save_schedules(df_all, season)
+            filepath = scraper.save_schedules(df_all, season)
             
             print("\n✓ Ready for schedule analysis!")
-            print(f"  File: data/team_schedules_{season}_season.csv")
+            print(f"  File: {filepath}")
         else:
             print("Failed to scrape schedules")
     else:
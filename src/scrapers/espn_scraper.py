@@ -1,19 +1,50 @@
 import requests
 from bs4 import BeautifulSoup
 import pandas as pd
-import time
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterator
 import json
+import os
+import sys
+
+# Add parent directory to path to import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.http_session import create_session
+from utils.conditional import ValidatorStore
+from utils.rate_limiter import TokenBucket, fetch_pages_concurrently
+from utils.storage import save_table, export_csv
+from scrapers.stats_table_parser import StatsPage, collect_pages, get_stats_parser
 
 class ESPNStatsScraper:
     """
     Scraper for ESPN NBA player statistics
     """
-    def __init__(self):
+    def __init__(self, requests_per_second: float = 1.0, burst: int = 2, max_workers: int = 4,
+                 parser_backend: str = 'auto'):
+        """
+        Initialize stats scraper
+        
+        Args:
+            requests_per_second: Sustained request rate to ESPN (politeness limit)
+            burst: Requests allowed back-to-back before the rate applies
+            max_workers: Pages fetched in parallel by get_all_players_paginated
+            parser_backend: Stats table parser - 'lxml', 'bs4' or 'auto' (lxml when installed)
+        """
         self.base_url = "https://www.espn.com/nba/stats/player"
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         }
+        
+        # Keep-alive session + ETag/Last-Modified validators so unchanged pages are not re-parsed
+        self.session = create_session(pool_size=max(10, max_workers))
+        self.validators = ValidatorStore()
+        
+        # Token bucket shared by every request this scraper makes
+        self.rate_limiter = TokenBucket(rate=requests_per_second, burst=burst)
+        self.max_workers = max_workers
+        
+        # Pluggable stats-table parser (lxml fast path, BeautifulSoup fallback)
+        self.parser = get_stats_parser(parser_backend)
     
     def inspect_page_structure(self) -> None:
         """
@@ -21,7 +52,7 @@ class ESPNStatsScraper:
         Useful for debugging and initial development
         """
         try:
-            response = requests.get(self.base_url, headers=self.headers)
+            response = self.session.get(self.base_url, headers=self.headers)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -74,83 +105,19 @@ class ESPNStatsScraper:
         url = f"{self.base_url}/{stat_type}" if stat_type != "_/view/general" else self.base_url
         
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Find both tables
-            tables = soup.find_all('table', class_='Table')
+            self.rate_limiter.acquire()
+            page, changed = self.validators.fetch(
+                self.session, url, self._parse_stats_page, headers=self.headers, timeout=10
+            )
             
-            if len(tables) < 2:
-                print(f"Expected 2 tables but found {len(tables)}")
+            if page is None:
+                print("Expected 2 tables with player data but none were found")
                 return None
             
-            # TABLE 1: Player names and info
-            name_table = tables[0]
-            name_headers = []
-            for th in name_table.find_all('th'):
-                name_headers.append(th.get_text(strip=True) or 'RK')
-            
-            players_data = []
-            name_rows = name_table.find_all('tr', class_='Table__TR')
-            
-            for row in name_rows:
-                cells = row.find_all('td')
-                if not cells:
-                    continue
-                
-                row_data = []
-                for i, cell in enumerate(cells):
-                    if i == 0:  # Rank column
-                        row_data.append(cell.get_text(strip=True))
-                    elif i == 1:  # Player name column
-                        player_link = cell.find('a', class_='AnchorLink')
-                        team_abbrev = cell.find('span', class_='athleteCell__teamAbbrev')
-                        
-                        player_name = player_link.get_text(strip=True) if player_link else ''
-                        team = team_abbrev.get_text(strip=True) if team_abbrev else ''
-                        
-                        # Extract player ID
-                        player_id = None
-                        if player_link and player_link.get('href'):
-                            href = player_link['href']
-                            parts = href.split('/id/')
-                            if len(parts) > 1:
-                                player_id = parts[1].split('/')[0]
-                        
-                        row_data.extend([player_name, team, player_id])
-                
-                if row_data:
-                    players_data.append(row_data)
-            
-            # TABLE 2: Stats
-            stats_table = tables[1]
-            stats_headers = []
-            for th in stats_table.find_all('th'):
-                header_text = th.get_text(strip=True)
-                if header_text:  # Only add non-empty headers
-                    stats_headers.append(header_text)
-            
-            stats_data = []
-            stats_rows = stats_table.find_all('tr', class_='Table__TR')
-            
-            for row in stats_rows:
-                cells = row.find_all('td')
-                if not cells:
-                    continue
-                
-                row_stats = [cell.get_text(strip=True) for cell in cells]
-                if row_stats:
-                    stats_data.append(row_stats)
-            
-            # Combine the data
-            name_df = pd.DataFrame(players_data, columns=['RK', 'Name', 'Team', 'PlayerID'])
-            stats_df = pd.DataFrame(stats_data, columns=stats_headers)
-            
-            # Merge by index (same row order)
-            combined_df = pd.concat([name_df, stats_df], axis=1)
+            if not changed:
+                print("ℹ Page unchanged since last fetch, reusing parsed data")
             
+            combined_df = page.to_dataframe()
             print(f"Successfully scraped {len(combined_df)} players with {len(combined_df.columns)} columns")
             return combined_df
             
@@ -163,23 +130,43 @@ class ESPNStatsScraper:
             traceback.print_exc()
             return None
     
-    def save_stats(self, df: pd.DataFrame, season: str = "2025", filename: str = None) -> None:
+    def _parse_stats_page(self, content: bytes) -> Optional[StatsPage]:
         """
-        Save stats to CSV file in data directory with season identifier
+        Parse one ESPN stats page (name table + stats table) into columns
+        
+        Args:
+            content: Raw page HTML
+        
+        Returns:
+            StatsPage for the page, or None if the page has no player data
+        """
+        return self.parser.parse_columns(content)
+    
+    def save_stats(self, df: pd.DataFrame, season: str = "2025", filename: str = None,
+                   csv_export: bool = False) -> str:
+        """
+        Save stats to the data directory with season identifier
+        Written as Feather (dtypes from clean_dataframe are kept) unless filename has another extension
         
         Args:
             df: DataFrame to save
             season: Season identifier (e.g., "2025" for 2024-25 season)
             filename: Custom filename (optional)
+            csv_export: Also write a CSV copy for spreadsheets
+        
+        Returns:
+            Path of the saved table
         """
         if filename is None:
-            filename = f"player_stats_{season}_season.csv"
+            filename = f"player_stats_{season}_season"
         
-        filepath = f"data/{filename}"
-        df.to_csv(filepath, index=False)
+        filepath = save_table(df, f"data/{filename}")
         print(f"\n✓ Stats saved to {filepath}")
+        if csv_export:
+            print(f"  CSV export: {export_csv(df, filepath)}")
         print(f"  Total records: {len(df)}")
         print(f"  Columns: {len(df.columns)}")
+        return filepath
     
     def clean_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -214,6 +201,9 @@ class ESPNStatsScraper:
                 except Exception as e:
                     print(f"\nError converting {col}: {str(e)}")
                     print(f"Unique values in {col}: {df_clean[col].unique()}")
+                    # Per-game averages (e.g. FGM 3.3) are not whole numbers - keep them as floats
+                    # so the column is still numeric in the stored table
+                    df_clean[col] = pd.to_numeric(df_clean[col], errors='coerce')
         
         # Convert floats
         for col in float_columns:
@@ -232,112 +222,68 @@ class ESPNStatsScraper:
         
         return df_clean
     
-    def get_all_players_paginated(self, max_pages: int = 20, season: str = "2025") -> Optional[pd.DataFrame]:
+    def iter_pages(self, max_pages: int = 20, max_workers: int = None) -> Iterator[StatsPage]:
         """
-        Get multiple pages of player stats
-        ESPN typically shows 50 players per page, ~400 total players
+        Stream parsed stats pages in page order, stopping at the first empty page
+        Each page is yielded as soon as it (and every page before it) has arrived
         
         Args:
-            max_pages: Maximum number of pages to scrape (default 20 should get all players)
-            season: Season identifier for file naming (e.g., "2025" for 2024-25 season)
+            max_pages: Maximum number of pages to scrape
+            max_workers: Pages fetched in parallel (default: the scraper's max_workers, 1 = sequential)
         
-        Returns:
-            Combined DataFrame of all pages
+        Yields:
+            StatsPage batch per page (columns of player records)
         """
-        all_data = []
+        max_workers = max_workers or self.max_workers
         
-        for page in range(1, max_pages + 1):
+        def fetch_page(page: int) -> Optional[StatsPage]:
             print(f"\nScraping page {page}/{max_pages}...")
             
             # Construct URL with page parameter
             url = f"{self.base_url}/_/page/{page}"
             
             try:
-                response = requests.get(url, headers=self.headers, timeout=10)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.content, 'html.parser')
-                tables = soup.find_all('table', class_='Table')
+                # Be polite to ESPN's servers
+                self.rate_limiter.acquire()
+                stats_page, changed = self.validators.fetch(
+                    self.session, url, self._parse_stats_page, headers=self.headers, timeout=10
+                )
                 
                 # Check if we got data (empty page means we've reached the end)
-                if len(tables) < 2:
+                if stats_page is None:
                     print(f"No more data found at page {page}")
-                    break
-                
-                # Parse both tables (same logic as get_player_stats)
-                name_table = tables[0]
-                stats_table = tables[1]
+                    return None
                 
-                # Extract player names
-                players_data = []
-                name_rows = name_table.find_all('tr', class_='Table__TR')
-                
-                for row in name_rows:
-                    cells = row.find_all('td')
-                    if not cells:
-                        continue
-                    
-                    row_data = []
-                    for i, cell in enumerate(cells):
-                        if i == 0:  # Rank
-                            row_data.append(cell.get_text(strip=True))
-                        elif i == 1:  # Player info
-                            player_link = cell.find('a', class_='AnchorLink')
-                            team_abbrev = cell.find('span', class_='athleteCell__teamAbbrev')
-                            
-                            player_name = player_link.get_text(strip=True) if player_link else ''
-                            team = team_abbrev.get_text(strip=True) if team_abbrev else ''
-                            
-                            player_id = None
-                            if player_link and player_link.get('href'):
-                                href = player_link['href']
-                                parts = href.split('/id/')
-                                if len(parts) > 1:
-                                    player_id = parts[1].split('/')[0]
-                            
-                            row_data.extend([player_name, team, player_id])
-                    
-                    if row_data:
-                        players_data.append(row_data)
-                
-                # Extract stats
-                stats_headers = [th.get_text(strip=True) for th in stats_table.find_all('th') if th.get_text(strip=True)]
-                
-                stats_data = []
-                stats_rows = stats_table.find_all('tr', class_='Table__TR')
-                
-                for row in stats_rows:
-                    cells = row.find_all('td')
-                    if not cells:
-                        continue
-                    row_stats = [cell.get_text(strip=True) for cell in cells]
-                    if row_stats:
-                        stats_data.append(row_stats)
-                
-                # Combine data for this page
-                if players_data and stats_data:
-                    name_df = pd.DataFrame(players_data, columns=['RK', 'Name', 'Team', 'PlayerID'])
-                    stats_df = pd.DataFrame(stats_data, columns=stats_headers)
-                    page_df = pd.concat([name_df, stats_df], axis=1)
-                    all_data.append(page_df)
-                    print(f"  ✓ Scraped {len(page_df)} players from page {page}")
-                else:
-                    print(f"No valid data on page {page}, stopping")
-                    break
-                
-                # Be polite to ESPN's servers
-                time.sleep(1)
+                note = "" if changed else " (unchanged, parse skipped)"
+                print(f"  ✓ Scraped {len(stats_page)} players from page {page}{note}")
+                return stats_page
                 
             except Exception as e:
                 print(f"Error on page {page}: {e}")
-                break
+                return None
         
-        if all_data:
-            combined_df = pd.concat(all_data, ignore_index=True)
+        return fetch_pages_concurrently(fetch_page, max_pages, max_workers)
+    
+    def get_all_players_paginated(self, max_pages: int = 20, season: str = "2025",
+                                  max_workers: int = None) -> Optional[pd.DataFrame]:
+        """
+        Get multiple pages of player stats
+        ESPN typically shows 50 players per page, ~400 total players
+        Pages are streamed into one set of columns and turned into a DataFrame once
+        
+        Args:
+            max_pages: Maximum number of pages to scrape (default 20 should get all players)
+            season: Season identifier for file naming (e.g., "2025" for 2024-25 season)
+            max_workers: Pages fetched in parallel (default: the scraper's max_workers, 1 = sequential)
+        
+        Returns:
+            Combined DataFrame of all pages
+        """
+        combined_df = collect_pages(self.iter_pages(max_pages, max_workers))
+        
+        if combined_df is not None:
             print(f"\n✓ Total players scraped: {len(combined_df)}")
-            return combined_df
-        else:
-            return None
+        return combined_df
 
 
 def main():
@@ -385,10 +331,10 @@ def main():
             print(df_all.nlargest(10, 'PTS')[['Name', 'Team', 'GP', 'PTS', 'REB', 'AST']])
             
             # Save to file
-            scraper.save_stats(df_all, season=season)
+            filepath = scraper.save_stats(df_all, season=season)
             
             print("\n✓ Ready for analysis!")
-            print(f"  File: data/player_stats_{season}_season.csv")
+            print(f"  File: {filepath}")
         else:
             print("Failed to scrape all players")
     else:
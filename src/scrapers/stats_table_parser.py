@@ -0,0 +1,468 @@
+from bs4 import BeautifulSoup
+import csv
+import os
+import pandas as pd
+from typing import Dict, Iterable, List, Optional
+
+try:
+    from lxml import etree, html as lxml_html
+except ImportError:  # lxml is optional - BeautifulSoup's html.parser is the fallback
+    etree = None
+    lxml_html = None
+
+try:
+    import pyarrow as pa
+except ImportError:  # pyarrow is optional - pages are streamed to CSV without it
+    pa = None
+
+
+# Columns produced from the name table (rank + athlete cell)
+NAME_COLUMNS = ['RK', 'Name', 'Team', 'PlayerID']
+
+
+def _player_id_from_href(href: Optional[str]) -> Optional[str]:
+    """
+    Extract ESPN's player ID from a player link (".../id/1966/lebron-james")
+    """
+    if not href:
+        return None
+    parts = href.split('/id/')
+    if len(parts) > 1:
+        return parts[1].split('/')[0]
+    return None
+
+
+class StatsPage:
+    """
+    Columnar result for one stats page: column name -> list of cell values
+    Name-table columns come first, then the stats-table columns in page order
+    """
+    __slots__ = ('columns', 'num_rows')
+
+    def __init__(self, columns: Dict[str, list]):
+        # Pad ragged columns (name and stats tables of different length) with None
+        self.num_rows = max((len(values) for values in columns.values()), default=0)
+        for values in columns.values():
+            if len(values) < self.num_rows:
+                values.extend([None] * (self.num_rows - len(values)))
+        self.columns = columns
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    def to_dataframe(self) -> pd.DataFrame:
+        return pd.DataFrame(self.columns)
+
+
+class StatsColumnBuilder:
+    """
+    Accumulates StatsPage columns across pages and builds one DataFrame at the end
+    Avoids a DataFrame per page followed by pd.concat
+    """
+
+    def __init__(self):
+        self.columns: Dict[str, list] = {}
+        self.num_rows = 0
+        self.num_pages = 0
+
+    def append(self, page: StatsPage) -> None:
+        for name, values in page.columns.items():
+            column = self.columns.get(name)
+            if column is None:
+                # Column first seen on a later page - backfill earlier rows
+                column = self.columns[name] = [None] * self.num_rows
+            column.extend(values)
+
+        self.num_rows += page.num_rows
+        self.num_pages += 1
+
+        # Columns missing from this page
+        for column in self.columns.values():
+            if len(column) < self.num_rows:
+                column.extend([None] * (self.num_rows - len(column)))
+
+    def to_dataframe(self) -> Optional[pd.DataFrame]:
+        if not self.num_rows:
+            return None
+        return pd.DataFrame(self.columns)
+
+
+def collect_pages(pages: Iterable[StatsPage]) -> Optional[pd.DataFrame]:
+    """
+    Drain a stream of StatsPage objects into a single DataFrame
+
+    Args:
+        pages: Iterable/generator of pages
+
+    Returns:
+        Combined DataFrame or None if no rows were collected
+    """
+    builder = StatsColumnBuilder()
+    for page in pages:
+        builder.append(page)
+    return builder.to_dataframe()
+
+
+class CsvPageSink:
+    """
+    Appends StatsPage batches to a CSV file as they arrive
+    The header is written once from the first page; only one page is held in memory at a time
+    """
+
+    def __init__(self, filepath: str):
+        """
+        Initialize CSV sink
+
+        Args:
+            filepath: Output CSV path (overwritten, parent directory created if needed)
+        """
+        self.filepath = filepath
+        self.fieldnames: Optional[List[str]] = None
+        self.num_rows = 0
+        self.num_pages = 0
+
+        directory = os.path.dirname(filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._file = open(filepath, 'w', newline='')
+        self._writer = csv.writer(self._file)
+        self._dropped = set()
+
+    def write(self, page: StatsPage) -> None:
+        """
+        Append one page (columns are written in the header's order)
+        """
+        if self.fieldnames is None:
+            self.fieldnames = list(page.columns)
+            self._writer.writerow(self.fieldnames)
+
+        extra = [name for name in page.columns if name not in self.fieldnames and name not in self._dropped]
+        if extra:
+            # A CSV header cannot grow after the fact
+            print(f"⚠ Dropping columns not in the first page's header: {', '.join(extra)}")
+            self._dropped.update(extra)
+
+        missing = [None] * page.num_rows
+        columns = [page.columns.get(name, missing) for name in self.fieldnames]
+        self._writer.writerows(zip(*columns))
+        self._file.flush()
+
+        self.num_rows += page.num_rows
+        self.num_pages += 1
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def _infer_arrow_type(values: list):
+    """
+    Arrow type for a column from its first page: int64/float64 when every non-empty cell is numeric, else string
+    """
+    cells = pd.Series([value for value in values if value not in (None, '')], dtype=object)
+    numbers = pd.to_numeric(cells, errors='coerce')
+    if numbers.empty or numbers.isna().any():
+        return pa.string()
+    return pa.int64() if (numbers % 1 == 0).all() else pa.float64()
+
+
+class ArrowPageSink:
+    """
+    Appends StatsPage batches to an Arrow IPC (Feather v2) file as they arrive
+    Each page becomes one record batch; the finished file can be memory-mapped by utils.storage.load_table
+
+    Column types are inferred from the first page (numeric cells -> int64/float64,
+    anything else -> string) and later pages are coerced to them, so the stored
+    table reads back with the same dtypes a CSV would have been re-inferred with.
+    """
+
+    def __init__(self, filepath: str):
+        """
+        Initialize Arrow sink
+
+        Args:
+            filepath: Output .feather path (overwritten, parent directory created if needed)
+        """
+        if pa is None:
+            raise ImportError("pyarrow is not installed")
+
+        self.filepath = filepath
+        self.fieldnames: Optional[List[str]] = None
+        self.num_rows = 0
+        self.num_pages = 0
+
+        directory = os.path.dirname(filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._writer = None
+        self._schema = None
+        self._dropped = set()
+
+    def write(self, page: StatsPage) -> None:
+        """
+        Append one page as a record batch (columns are written in the first page's order)
+        """
+        if self._writer is None:
+            self.fieldnames = list(page.columns)
+            self._schema = pa.schema([(name, _infer_arrow_type(values)) for name, values in page.columns.items()])
+            self._writer = pa.ipc.new_file(self.filepath, self._schema)
+
+        extra = [name for name in page.columns if name not in self.fieldnames and name not in self._dropped]
+        if extra:
+            # The schema is fixed by the first batch
+            print(f"⚠ Dropping columns not in the first page's schema: {', '.join(extra)}")
+            self._dropped.update(extra)
+
+        missing = [None] * page.num_rows
+        arrays = [self._column_array(field, page.columns.get(field.name, missing)) for field in self._schema]
+        self._writer.write_batch(pa.record_batch(arrays, schema=self._schema))
+
+        self.num_rows += page.num_rows
+        self.num_pages += 1
+
+    def _column_array(self, field, values: list):
+        """
+        One column of a page as an Arrow array of the schema's type
+        Cells that do not fit a numeric column (e.g. '-') become nulls
+        """
+        if field.type == pa.string():
+            return pa.array(values, type=pa.string())
+
+        numbers = pd.to_numeric(pd.Series(values, dtype=object), errors='coerce').astype('float64')
+        if field.type == pa.int64():
+            fractional = numbers.notna() & (numbers % 1 != 0)
+            if fractional.any():
+                # The schema is fixed by the first batch
+                print(f"⚠ Dropping {int(fractional.sum())} non-integer value(s) in integer column {field.name}")
+                numbers = numbers.where(~fractional)
+        return pa.array(numbers, type=field.type, from_pandas=True)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def open_page_sink(filepath: str):
+    """
+    Open an incremental page sink for a path - Arrow for .feather, CSV otherwise
+
+    Args:
+        filepath: Output path
+
+    Returns:
+        ArrowPageSink or CsvPageSink
+    """
+    if filepath.lower().endswith('.feather'):
+        return ArrowPageSink(filepath)
+    return CsvPageSink(filepath)
+
+
+class BeautifulSoupStatsParser:
+    """
+    Parses ESPN's two-table stats layout with BeautifulSoup (pure-Python fallback)
+    """
+    name = 'bs4'
+
+    def parse_columns(self, content: bytes) -> Optional[StatsPage]:
+        """
+        Extract a stats page straight into columns
+
+        Args:
+            content: Raw page HTML
+
+        Returns:
+            StatsPage or None if the page has no player data
+        """
+        soup = BeautifulSoup(content, 'html.parser')
+        tables = soup.find_all('table', class_='Table')
+
+        # An empty page means we've reached the end
+        if len(tables) < 2:
+            return None
+
+        ranks, names, teams, player_ids = [], [], [], []
+
+        # TABLE 1: Player names and info
+        for row in tables[0].find_all('tr', class_='Table__TR'):
+            cells = row.find_all('td')
+            if not cells:
+                continue
+
+            ranks.append(cells[0].get_text(strip=True))
+            if len(cells) > 1:
+                player_link = cells[1].find('a', class_='AnchorLink')
+                team_abbrev = cells[1].find('span', class_='athleteCell__teamAbbrev')
+
+                names.append(player_link.get_text(strip=True) if player_link else '')
+                teams.append(team_abbrev.get_text(strip=True) if team_abbrev else '')
+                player_ids.append(_player_id_from_href(player_link.get('href') if player_link else None))
+            else:
+                # Rank-only row - keep the columns aligned row by row
+                names.append(None)
+                teams.append(None)
+                player_ids.append(None)
+
+        # TABLE 2: Stats
+        stats_table = tables[1]
+        stats_headers = [th.get_text(strip=True) for th in stats_table.find_all('th') if th.get_text(strip=True)]
+        stats_columns = [[] for _ in stats_headers]
+
+        for row in stats_table.find_all('tr', class_='Table__TR'):
+            cells = row.find_all('td')
+            if not cells:
+                continue
+            for column, cell in zip(stats_columns, cells):
+                column.append(cell.get_text(strip=True))
+            # Short row - pad the columns it has no cell for
+            for column in stats_columns[len(cells):]:
+                column.append(None)
+
+        if not ranks or not stats_columns or not stats_columns[0]:
+            return None
+
+        columns = dict(zip(NAME_COLUMNS, [ranks, names, teams, player_ids]))
+        columns.update(zip(stats_headers, stats_columns))
+        return StatsPage(columns)
+
+    def parse(self, content: bytes) -> Optional[pd.DataFrame]:
+        """
+        Parse a stats page into a DataFrame (None if the page has no player data)
+        """
+        page = self.parse_columns(content)
+        return page.to_dataframe() if page else None
+
+
+def _has_class(class_name: str) -> str:
+    # XPath equivalent of BeautifulSoup's class_= match on one class in the list
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+
+class LxmlStatsParser:
+    """
+    Compiled extraction engine for ESPN's two-table stats layout
+    Uses lxml with precompiled XPath and fills columns in a single pass over each table
+    """
+    name = 'lxml'
+
+    def __init__(self):
+        if etree is None:
+            raise ImportError("lxml is not installed")
+
+        self._tables = etree.XPath(f"//table[{_has_class('Table')}]")
+        self._rows = etree.XPath(f".//tr[{_has_class('Table__TR')}]")
+        self._cells = etree.XPath("./td")
+        self._headers = etree.XPath(".//th")
+        self._player_link = etree.XPath(f".//a[{_has_class('AnchorLink')}]")
+        self._team_abbrev = etree.XPath(f".//span[{_has_class('athleteCell__teamAbbrev')}]")
+
+        # ESPN serves UTF-8; without a charset declaration in the bytes libxml2 would assume Latin-1
+        self._html_parser = lxml_html.HTMLParser(encoding='utf-8')
+
+    @staticmethod
+    def _text(element) -> str:
+        # Same result as BeautifulSoup's get_text(strip=True)
+        return ''.join(piece.strip() for piece in element.itertext())
+
+    def parse_columns(self, content: bytes) -> Optional[StatsPage]:
+        """
+        Extract a stats page straight into columns
+
+        Args:
+            content: Raw page HTML
+
+        Returns:
+            StatsPage or None if the page has no player data
+        """
+        if not content:
+            return None
+
+        tables = self._tables(lxml_html.fromstring(content, parser=self._html_parser))
+        if len(tables) < 2:
+            return None
+
+        text = self._text
+        ranks, names, teams, player_ids = [], [], [], []
+
+        for row in self._rows(tables[0]):
+            cells = self._cells(row)
+            if not cells:
+                continue
+
+            ranks.append(text(cells[0]))
+            if len(cells) > 1:
+                links = self._player_link(cells[1])
+                abbrevs = self._team_abbrev(cells[1])
+                player_link = links[0] if links else None
+
+                names.append(text(player_link) if player_link is not None else '')
+                teams.append(text(abbrevs[0]) if abbrevs else '')
+                player_ids.append(_player_id_from_href(player_link.get('href') if player_link is not None else None))
+            else:
+                # Rank-only row - keep the columns aligned row by row
+                names.append(None)
+                teams.append(None)
+                player_ids.append(None)
+
+        stats_table = tables[1]
+        stats_headers = [header for header in (text(th) for th in self._headers(stats_table)) if header]
+        stats_columns = [[] for _ in stats_headers]
+
+        for row in self._rows(stats_table):
+            cells = self._cells(row)
+            if not cells:
+                continue
+            for column, cell in zip(stats_columns, cells):
+                column.append(text(cell))
+            # Short row - pad the columns it has no cell for
+            for column in stats_columns[len(cells):]:
+                column.append(None)
+
+        if not ranks or not stats_columns or not stats_columns[0]:
+            return None
+
+        columns = dict(zip(NAME_COLUMNS, [ranks, names, teams, player_ids]))
+        columns.update(zip(stats_headers, stats_columns))
+        return StatsPage(columns)
+
+    def parse(self, content: bytes) -> Optional[pd.DataFrame]:
+        """
+        Parse a stats page into a DataFrame (None if the page has no player data)
+        """
+        page = self.parse_columns(content)
+        return page.to_dataframe() if page else None
+
+
+def get_stats_parser(backend: str = 'auto'):
+    """
+    Get a stats-table parser backend
+
+    Args:
+        backend: 'lxml', 'bs4', or 'auto' (lxml when installed, otherwise bs4)
+
+    Returns:
+        Parser instance with parse_columns(content) and parse(content)
+    """
+    if backend == 'auto':
+        backend = 'lxml' if etree is not None else 'bs4'
+
+    if backend == 'lxml':
+        return LxmlStatsParser()
+    if backend == 'bs4':
+        return BeautifulSoupStatsParser()
+
+    raise ValueError(f"Unknown parser backend: {backend} (expected 'lxml', 'bs4' or 'auto')")
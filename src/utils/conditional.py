@@ -0,0 +1,151 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+import requests
+
+
+class ValidatorStore:
+    """
+    Remembers ETag/Last-Modified validators and the parsed result of each resource
+
+    Requests are sent with If-None-Match/If-Modified-Since. A 304 response, or a
+    200 whose body hashes the same as last time, returns the previously parsed
+    result so JSON decoding / HTML parsing is skipped entirely.
+    """
+
+    def __init__(self, max_entries: int = 512):
+        """
+        Initialize validator store
+
+        Args:
+            max_entries: Max resources remembered before least-recently-used ones are dropped
+        """
+        self.max_entries = max_entries
+        self.not_modified = 0  # 304 responses
+        self.unchanged = 0     # 200 responses with an identical body hash
+        self.parsed = 0        # Responses that had to be parsed
+
+        self._entries: "OrderedDict[Hashable, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def conditional_headers(self, key: Hashable) -> Dict[str, str]:
+        """
+        Conditional request headers for a resource we have seen before
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def has(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def resolve(self, key: Hashable, response: requests.Response, parse: Callable[[bytes], Any]) -> Tuple[Any, bool]:
+        """
+        Turn a response into a parsed result, reusing the stored one when nothing changed
+
+        Args:
+            key: Resource key
+            response: Response to a request sent with conditional_headers(key)
+            parse: Function turning the raw body into the result to store
+
+        Returns:
+            Tuple of (parsed result, changed flag)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+        if response.status_code == 304:
+            if entry is None:
+                # A 304 has no body to parse
+                raise ValueError(f"304 Not Modified for {key!r} with no stored result to reuse")
+            with self._lock:
+                self._entries.move_to_end(key)
+                self.not_modified += 1
+            return entry['value'], False
+
+        content = response.content
+        content_hash = hashlib.sha1(content).hexdigest()
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+
+        if entry is not None and entry['hash'] == content_hash:
+            with self._lock:
+                entry.update(etag=etag, last_modified=last_modified)
+                self._entries.move_to_end(key)
+                self.unchanged += 1
+            return entry['value'], False
+
+        value = parse(content)
+
+        with self._lock:
+            self._entries[key] = {
+                'etag': etag,
+                'last_modified': last_modified,
+                'hash': content_hash,
+                'value': value
+            }
+            self._entries.move_to_end(key)
+            self.parsed += 1
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        return value, True
+
+    def fetch(self, session: requests.Session, url: str, parse: Callable[[bytes], Any],
+              headers: Dict = None, params: Dict = None, timeout: float = 10,
+              key: Optional[Hashable] = None) -> Tuple[Any, bool]:
+        """
+        Conditional GET that only parses the body when it changed
+
+        Args:
+            session: Session to send the request with
+            url: Resource URL
+            parse: Function turning the raw body into the result to store
+            headers: Extra request headers
+            params: Query parameters
+            timeout: Request timeout in seconds
+            key: Resource key (default: the URL)
+
+        Returns:
+            Tuple of (parsed result, changed flag)
+
+        Raises:
+            requests.HTTPError for error status codes
+        """
+        key = key if key is not None else url
+
+        request_headers = dict(headers or {})
+        request_headers.update(self.conditional_headers(key))
+
+        response = session.get(url, headers=request_headers, params=params, timeout=timeout)
+
+        if response.status_code == 304 and not self.has(key):
+            # The stored result was evicted after the validators were sent - nothing to reuse
+            response = session.get(url, headers=headers, params=params, timeout=timeout)
+
+        if response.status_code != 304:
+            response.raise_for_status()
+
+        return self.resolve(key, response, parse)
+
+    def stats(self) -> Dict:
+        """
+        Counters for skipped vs. performed parses
+        """
+        return {
+            'entries': len(self._entries),
+            'not_modified': self.not_modified,
+            'unchanged': self.unchanged,
+            'parsed': self.parsed
+        }
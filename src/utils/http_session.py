@@ -0,0 +1,47 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Iterable
+
+
+def create_session(pool_size: int = 10, max_retries: int = 3, backoff_factor: float = 0.5,
+                   status_forcelist: Iterable[int] = (429, 500, 502, 503, 504)) -> requests.Session:
+    """
+    Create a requests Session with a pooled, keep-alive connection adapter
+
+    Reusing one session means the TCP+TLS handshake to a host is paid once
+    and later calls ride the open connection. The same session can be passed
+    to several clients so they share one pool.
+
+    Args:
+        pool_size: Max connections kept alive per host
+        max_retries: Retries for connection errors and retryable status codes
+        backoff_factor: Exponential backoff between retries (0.5 -> 0.5s, 1s, 2s, ...)
+        status_forcelist: HTTP status codes that should be retried
+
+    Returns:
+        Configured requests.Session
+    """
+    retry = Retry(
+        total=max_retries,
+        connect=max_retries,
+        read=max_retries,
+        status=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=tuple(status_forcelist),
+        allowed_methods=frozenset(['GET', 'HEAD']),
+        respect_retry_after_header=True,
+        raise_on_status=False  # Hand the final response back so callers can report it
+    )
+
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=retry
+    )
+
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+
+    return session
@@ -0,0 +1,108 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, Optional, TypeVar
+
+T = TypeVar('T')
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter
+    Allows short bursts up to `burst` requests, then `rate` requests per second
+    """
+
+    def __init__(self, rate: float = 1.0, burst: int = 1):
+        """
+        Initialize token bucket
+
+        Args:
+            rate: Tokens added per second (sustained requests per second)
+            burst: Bucket size (max requests sent back-to-back)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def try_acquire(self) -> bool:
+        """
+        Take a token if one is available, without waiting
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+    def acquire(self) -> None:
+        """
+        Block until a token is available, then take it
+        """
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def fetch_pages_concurrently(fetch_page: Callable[[int], Optional[T]], max_pages: int,
+                             max_workers: int = 4) -> Iterator[T]:
+    """
+    Fetch numbered pages with a thread pool, stopping at the first empty page
+
+    Up to `max_workers` pages are in flight at once. Results are yielded in page
+    order as soon as each one (and every page before it) is done, and no new
+    page is requested once an empty page has been seen, so at most
+    max_workers - 1 requests are made past the end of the data.
+    Rate limiting is the job of `fetch_page` (e.g. TokenBucket.acquire()).
+
+    Args:
+        fetch_page: Function taking a 1-based page number, returning the page result
+                    or None for an empty page / end of data
+        max_pages: Maximum number of pages to fetch
+        max_workers: Number of pages fetched in parallel
+
+    Yields:
+        Page results in page order, up to (not including) the first empty page
+    """
+    in_flight = {}
+    next_page = 1
+    stop = threading.Event()
+
+    def run(page_number: int) -> Optional[T]:
+        # Pages queued behind the end of the data skip their request entirely
+        if stop.is_set():
+            return None
+        return fetch_page(page_number)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for page in range(1, max_pages + 1):
+            # Keep the pool full
+            while next_page <= max_pages and len(in_flight) < max_workers:
+                in_flight[next_page] = executor.submit(run, next_page)
+                next_page += 1
+
+            result = in_flight.pop(page).result()
+            if result is None:
+                stop.set()
+                for pending in in_flight.values():
+                    pending.cancel()
+                return
+
+            yield result
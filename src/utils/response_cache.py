@@ -0,0 +1,209 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+
+# Seconds each ESPN view stays fresh
+# League settings almost never change; live matchup scores move every few seconds
+DEFAULT_VIEW_TTLS = {
+    'mSettings': 6 * 60 * 60,
+    'mTeam': 10 * 60,
+    'mRoster': 5 * 60,
+    'mMatchup': 60,
+    'mMatchupScore': 15,
+    'kona_player_info': 5 * 60,
+}
+
+
+class ResponseCache:
+    """
+    LRU cache of API responses with per-view TTLs
+    Keys are (league, year, views, scoringPeriodId, x-fantasy-filter hash)
+    """
+
+    def __init__(self, max_entries: int = 256, view_ttls: Dict[str, float] = None,
+                 default_ttl: float = 60, persist_path: str = None):
+        """
+        Initialize response cache
+
+        Args:
+            max_entries: Max cached responses before least-recently-used ones are evicted
+            view_ttls: Per-view TTL overrides in seconds (merged over DEFAULT_VIEW_TTLS)
+            default_ttl: TTL for views without an explicit entry
+            persist_path: JSON file to load from and save() to (optional)
+        """
+        self.max_entries = max_entries
+        self.view_ttls = dict(DEFAULT_VIEW_TTLS)
+        if view_ttls:
+            self.view_ttls.update(view_ttls)
+        self.default_ttl = default_ttl
+        self.persist_path = persist_path
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._entries: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        if persist_path and os.path.exists(persist_path):
+            self.load()
+
+    @staticmethod
+    def make_key(league_id: int, year: int, views: Iterable[str], scoring_period_id: Optional[int] = None,
+                 fantasy_filter: Optional[str] = None) -> Tuple:
+        """
+        Build a cache key for one API request
+
+        Args:
+            league_id: ESPN league ID
+            year: Season year
+            views: View names in the request (order does not matter)
+            scoring_period_id: scoringPeriodId query parameter (optional)
+            fantasy_filter: Raw x-fantasy-filter header value (optional)
+
+        Returns:
+            Hashable cache key
+        """
+        filter_hash = hashlib.sha1(fantasy_filter.encode()).hexdigest() if fantasy_filter else None
+        return (int(league_id), int(year), tuple(sorted(set(views))), scoring_period_id, filter_hash)
+
+    def ttl_for(self, views: Iterable[str]) -> float:
+        """
+        TTL for a request - the shortest TTL of the views it contains
+
+        A combined request therefore expires with its most volatile view. The
+        fantasy client caches views listed in SEPARABLE_VIEWS (mSettings) under
+        their own single-view key as well, so those keep their longer TTL.
+        """
+        ttls = [self.view_ttls.get(view, self.default_ttl) for view in views]
+        return min(ttls) if ttls else self.default_ttl
+
+    def get(self, key: Tuple) -> Optional[Any]:
+        """
+        Get a fresh cached response, counting the hit or miss
+
+        Returns:
+            Cached response or None if missing/expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at < time.time():
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Tuple, value: Any, ttl: float = None) -> None:
+        """
+        Store a response
+
+        Args:
+            key: Key from make_key()
+            value: Decoded response
+            ttl: Seconds to keep it (default: TTL of the key's views)
+        """
+        if self.max_entries <= 0:
+            return
+
+        if ttl is None:
+            ttl = self.ttl_for(key[2])
+
+        with self._lock:
+            self._entries[key] = (time.time() + ttl, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, league_id: int = None) -> None:
+        """
+        Drop cached responses for one league, or everything if no league given
+        """
+        with self._lock:
+            if league_id is None:
+                self._entries.clear()
+            else:
+                for key in [k for k in self._entries if k[0] == int(league_id)]:
+                    del self._entries[key]
+
+    def stats(self) -> Dict:
+        """
+        Hit/miss counters and current size
+        """
+        total = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / total if total else 0.0
+        }
+
+    def save(self, path: str = None) -> None:
+        """
+        Write unexpired entries to a JSON file
+
+        Args:
+            path: Output file (default: persist_path)
+        """
+        path = path or self.persist_path
+        if not path:
+            return
+
+        now = time.time()
+        with self._lock:
+            records = [
+                {'key': list(key[:2]) + [list(key[2])] + list(key[3:]), 'expires_at': expires_at, 'value': value}
+                for key, (expires_at, value) in self._entries.items()
+                if expires_at >= now
+            ]
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(records, f)
+        os.replace(tmp_path, path)
+
+    def load(self, path: str = None) -> None:
+        """
+        Load unexpired entries from a JSON file written by save()
+
+        Args:
+            path: Input file (default: persist_path)
+        """
+        path = path or self.persist_path
+        try:
+            with open(path) as f:
+                records = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠ Could not load response cache from {path}: {e}")
+            return
+
+        now = time.time()
+        with self._lock:
+            for record in records:
+                if record['expires_at'] < now:
+                    continue
+                league_id, year, views, scoring_period_id, filter_hash = record['key']
+                key = (league_id, year, tuple(views), scoring_period_id, filter_hash)
+                self._entries[key] = (record['expires_at'], record['value'])
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
@@ -0,0 +1,93 @@
+import calendar
+import threading
+from typing import Dict, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+# "Oct" -> 10
+MONTH_NUMBERS = {abbr: number for number, abbr in enumerate(calendar.month_abbr) if abbr}
+
+
+class SeasonCalendar:
+    """
+    Resolves ESPN's year-less schedule dates ("Wed, Oct 22") for a season
+
+    A season is named by the year it ends in ("2026" = 2025-26). Months from
+    `rollover_month` on belong to the starting year, earlier months to the
+    ending year. Parsed dates are cached per (season, string): every team's
+    page repeats the same ~180 date strings, so a full scrape - or a backfill
+    over several seasons - parses each distinct string once.
+    """
+
+    def __init__(self, rollover_month: int = 10):
+        """
+        Initialize calendar
+
+        Args:
+            rollover_month: First month of the season's starting year (October for the NBA)
+        """
+        if not 1 <= rollover_month <= 12:
+            raise ValueError("rollover_month must be between 1 and 12")
+
+        self.rollover_month = rollover_month
+        self._cache: Dict[Tuple[str, str], pd.Timestamp] = {}
+        self._lock = threading.Lock()
+
+        # Distinct (season, string) pairs parsed so far
+        self.parsed = 0
+
+    @staticmethod
+    def season_years(season: str) -> Tuple[int, int]:
+        """
+        Calendar years a season spans
+
+        Args:
+            season: Season identifier (e.g., "2026" for 2025-26 season)
+
+        Returns:
+            Tuple of (start year, end year)
+        """
+        end_year = int(season)
+        return end_year - 1, end_year
+
+    def season_label(self, season: str) -> str:
+        """
+        Display name of a season ("2026" -> "2025-26")
+        """
+        start_year, end_year = self.season_years(season)
+        return f"{start_year}-{end_year % 100:02d}"
+
+    def parse_dates(self, dates: pd.Series, season: str) -> pd.Series:
+        """
+        Parse ESPN schedule dates in bulk
+
+        Args:
+            dates: Date strings like "Wed, Oct 22" (the weekday is optional)
+            season: Season identifier the dates belong to
+
+        Returns:
+            datetime64 Series aligned with `dates` (NaT where a string could not be parsed)
+        """
+        season = str(season)
+        strings = pd.unique(dates.dropna().astype(str))
+
+        with self._lock:
+            missing = [s for s in strings if (season, s) not in self._cache]
+            if missing:
+                parsed = self._parse_strings(pd.Series(missing, dtype=object), season)
+                self._cache.update(zip(((season, s) for s in missing), parsed))
+                self.parsed += len(missing)
+            lookup = {s: self._cache[(season, s)] for s in strings}
+
+        return pd.to_datetime(dates.map(lookup))
+
+    def _parse_strings(self, strings: pd.Series, season: str) -> pd.Series:
+        # Drop the weekday and pick the year from the month first, so "Feb 29" parses in leap years
+        start_year, end_year = self.season_years(season)
+        month_day = strings.str.split(', ', n=1).str[-1].str.strip()
+        month = month_day.str[:3].str.title().map(MONTH_NUMBERS)
+        year = np.where(month >= self.rollover_month, str(start_year), str(end_year))
+
+        return pd.to_datetime(month_day + ' ' + year, format='%b %d %Y', errors='coerce')
@@ -0,0 +1,184 @@
+import os
+from typing import Iterable, List, Optional
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is optional - CSV is the fallback format
+    pa = None
+    feather = None
+    pq = None
+
+
+# Binary formats first: loading them is a memory-mapped read instead of a text parse
+FORMAT_EXTENSIONS = {
+    'feather': '.feather',
+    'parquet': '.parquet',
+    'csv': '.csv',
+}
+DEFAULT_FORMAT = 'feather' if pa is not None else 'csv'
+
+
+def _format_for(filepath: str) -> Optional[str]:
+    extension = os.path.splitext(filepath)[1].lower()
+    for fmt, fmt_extension in FORMAT_EXTENSIONS.items():
+        if extension == fmt_extension:
+            return fmt
+    return None
+
+
+def _require_pyarrow(fmt: str) -> None:
+    if pa is None:
+        raise ImportError(f"pyarrow is required for the {fmt} format (pip install pyarrow)")
+
+
+def table_path(name: str, data_dir: str = "data", fmt: str = None) -> str:
+    """
+    Build the path of a stored table
+
+    Args:
+        name: Table name without extension (e.g., "player_stats_2025_season")
+        data_dir: Directory tables live in
+        fmt: 'feather', 'parquet' or 'csv' (default: DEFAULT_FORMAT)
+
+    Returns:
+        File path with the format's extension
+    """
+    fmt = fmt or DEFAULT_FORMAT
+    if fmt not in FORMAT_EXTENSIONS:
+        raise ValueError(f"Unknown table format: {fmt} (expected one of {', '.join(FORMAT_EXTENSIONS)})")
+    return os.path.join(data_dir, f"{name}{FORMAT_EXTENSIONS[fmt]}")
+
+
+def find_table(filepath: str) -> Optional[str]:
+    """
+    Locate a stored table, preferring binary formats
+
+    The path may name any format or have no extension at all. Siblings with the
+    same base name are tried in FORMAT_EXTENSIONS order, so an old CSV is still
+    found when no Feather/Parquet copy exists yet.
+
+    Args:
+        filepath: Table path (with or without extension)
+
+    Returns:
+        Existing file path, or None if no format of the table exists
+    """
+    base = os.path.splitext(filepath)[0] if _format_for(filepath) else filepath
+
+    for fmt, extension in FORMAT_EXTENSIONS.items():
+        candidate = base + extension
+        if fmt != 'csv' and pa is None:
+            continue
+        if os.path.exists(candidate):
+            return candidate
+
+    return filepath if os.path.exists(filepath) else None
+
+
+def save_table(df: pd.DataFrame, filepath: str, fmt: str = None) -> str:
+    """
+    Save a DataFrame, keeping its dtypes (Int64, datetime64, bool)
+
+    Feather files are written uncompressed so loads can memory-map them. The
+    table is written to a temporary file and renamed over the target, so readers
+    still mapping the previous version keep seeing intact data.
+
+    Args:
+        df: DataFrame to save
+        filepath: Output path - its extension picks the format, if it has one
+        fmt: Format for paths without a known extension (default: DEFAULT_FORMAT)
+
+    Returns:
+        Path the table was written to
+    """
+    fmt = _format_for(filepath) or fmt or DEFAULT_FORMAT
+    if not _format_for(filepath):
+        filepath = filepath + FORMAT_EXTENSIONS[fmt]
+
+    directory = os.path.dirname(filepath)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    tmp_path = f"{filepath}.tmp"
+    if fmt == 'csv':
+        df.to_csv(tmp_path, index=False)
+    else:
+        _require_pyarrow(fmt)
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        if fmt == 'feather':
+            feather.write_feather(table, tmp_path, compression='uncompressed')
+        else:
+            pq.write_table(table, tmp_path)
+
+    os.replace(tmp_path, filepath)
+    return filepath
+
+
+def export_csv(df: pd.DataFrame, filepath: str) -> str:
+    """
+    Export a DataFrame as CSV (for spreadsheets - the analyzers read the binary tables)
+
+    Returns:
+        Path of the CSV file
+    """
+    return save_table(df, os.path.splitext(filepath)[0] + '.csv')
+
+
+def table_columns(filepath: str) -> List[str]:
+    """
+    Column names of a stored table, without loading its data
+    """
+    fmt = _format_for(filepath)
+    if fmt == 'feather':
+        with pa.memory_map(filepath) as source:
+            return pa.ipc.open_file(source).schema.names
+    if fmt == 'parquet':
+        return pq.read_schema(filepath).names
+    return list(pd.read_csv(filepath, nrows=0).columns)
+
+
+def load_table(filepath: str, columns: Iterable[str] = None, parse_dates: List[str] = None) -> pd.DataFrame:
+    """
+    Load a stored table
+
+    Feather is memory-mapped and Parquet/Feather keep the saved dtypes. CSV is
+    only parsed as a fallback (e.g. a table saved before pyarrow was installed).
+
+    Args:
+        filepath: Table path (with or without extension - see find_table)
+        columns: Only load these columns (missing ones are skipped)
+        parse_dates: Columns to convert with pd.to_datetime when they come back as text
+
+    Returns:
+        DataFrame
+
+    Raises:
+        FileNotFoundError if no format of the table exists
+    """
+    path = find_table(filepath)
+    if path is None:
+        raise FileNotFoundError(f"Table not found: {filepath}")
+
+    fmt = _format_for(path)
+    if columns is not None:
+        available = set(table_columns(path))
+        columns = [col for col in columns if col in available]
+
+    if fmt == 'feather':
+        _require_pyarrow(fmt)
+        df = feather.read_table(path, columns=columns, memory_map=True).to_pandas()
+    elif fmt == 'parquet':
+        _require_pyarrow(fmt)
+        df = pq.read_table(path, columns=columns, memory_map=True).to_pandas()
+    else:
+        df = pd.read_csv(path, usecols=columns)
+
+    for col in parse_dates or []:
+        if col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[col]):
+            df[col] = pd.to_datetime(df[col])
+
+    return df
@@ -0,0 +1,105 @@
+"""
+AsyncESPNFantasyClient against a local stub of the league endpoint
+"""
+import asyncio
+import contextlib
+import io
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from scrapers.espn_fantasy_async_client import AsyncESPNFantasyClient, refresh_leagues
+from scrapers.espn_fantasy_client import ESPNFantasyClient
+
+DELAY = 0.2
+LEAGUES = 20
+
+
+def league_response(league_id: int) -> dict:
+    return {
+        'settings': {
+            'name': f"League {league_id}",
+            'size': 2,
+            'scoringSettings': {'scoringType': 'H2H_CATEGORY', 'scoringItems': [{'statId': 0}]},
+        },
+        'status': {'currentMatchupPeriod': 1},
+        'teams': [
+            {'id': 1, 'location': 'Team', 'nickname': 'One', 'roster': {'entries': []}},
+            {'id': 2, 'location': 'Team', 'nickname': 'Two', 'roster': {'entries': []}},
+        ],
+        'schedule': [],
+        'scoringPeriodId': 3,
+    }
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        time.sleep(DELAY)
+        league_id = int(self.path.split('/leagues/')[1].split('?')[0])
+        body = json.dumps(league_response(league_id)).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+@pytest.fixture
+def stub_url(monkeypatch):
+    server = StubServer(('127.0.0.1', 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(ESPNFantasyClient, 'BASE_URL', f"http://127.0.0.1:{server.server_address[1]}")
+    monkeypatch.delenv('ESPN_S2', raising=False)
+    monkeypatch.delenv('SWID', raising=False)
+    yield
+    server.shutdown()
+    server.server_close()
+
+
+def test_refresh_leagues_runs_concurrently(stub_url):
+    league_ids = list(range(100, 100 + LEAGUES))
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        results = asyncio.run(refresh_leagues(league_ids, views=['mSettings', 'mTeam']))
+        elapsed = time.perf_counter() - start
+
+    assert sorted(results) == league_ids
+    for league_id, snapshot in results.items():
+        assert not isinstance(snapshot, Exception), snapshot
+        assert snapshot.settings['name'] == f"League {league_id}"
+
+    # Sequential requests would take LEAGUES * DELAY (4 s)
+    assert elapsed < LEAGUES * DELAY / 2
+
+
+def test_async_methods_match_sync_client(stub_url):
+    async def fetch():
+        async with AsyncESPNFantasyClient(7) as client:
+            return await asyncio.gather(
+                client.get_league_info(),
+                client.get_teams(),
+                client.get_all_rosters(),
+                client.get_current_scoring_period(),
+            )
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        with ESPNFantasyClient(7) as client:
+            expected = [client.get_league_info(), client.get_teams(), client.get_all_rosters(),
+                        client.get_current_scoring_period()]
+        actual = asyncio.run(fetch())
+
+    assert actual == expected
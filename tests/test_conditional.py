@@ -0,0 +1,71 @@
+"""
+Conditional requests when the stored result is gone by the time the 304 arrives
+"""
+import contextlib
+import io
+import json
+
+import pytest
+
+from scrapers.espn_fantasy_client import ESPNFantasyClient
+from utils.conditional import ValidatorStore
+
+
+class FakeResponse:
+    url = 'http://stub/resource'
+
+    def __init__(self, status_code, body=b'', content_type='application/json'):
+        self.status_code = status_code
+        self.content = body
+        self.headers = {'Content-Type': content_type, 'ETag': '"v1"'} if status_code == 200 else {}
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(self.status_code)
+
+
+class EvictingSession:
+    """
+    Answers the first request (and any conditional one) with 304, as if our validators had just been evicted
+    """
+
+    def __init__(self, body: dict):
+        self.body = json.dumps(body).encode()
+        self.sent = []
+
+    def get(self, url, headers=None, **kwargs):
+        headers = headers or {}
+        self.sent.append(dict(headers))
+        if 'If-None-Match' in headers or not self.sent[:-1]:
+            return FakeResponse(304)
+        return FakeResponse(200, self.body)
+
+
+def test_fetch_retries_without_validators():
+    store = ValidatorStore()
+    session = EvictingSession({'rows': [1, 2]})
+
+    value, changed = store.fetch(session, 'http://stub/resource', json.loads)
+
+    assert (value, changed) == ({'rows': [1, 2]}, True)
+    assert len(session.sent) == 2 and 'If-None-Match' not in session.sent[1]
+
+
+def test_resolve_rejects_304_without_entry():
+    with pytest.raises(ValueError):
+        ValidatorStore().resolve('missing', FakeResponse(304), json.loads)
+
+
+def test_client_retries_without_validators(monkeypatch):
+    monkeypatch.delenv('ESPN_S2', raising=False)
+    monkeypatch.delenv('SWID', raising=False)
+    session = EvictingSession({'settings': {'name': 'League'}})
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        client = ESPNFantasyClient(1, 2026, session=session, use_cache=False)
+        assert client.get_league_info()['name'] == 'League'
+
+    assert len(session.sent) == 2
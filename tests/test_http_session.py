@@ -0,0 +1,82 @@
+"""
+Pooled keep-alive session used by the fantasy client
+"""
+import contextlib
+import io
+import json
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from scrapers.espn_fantasy_client import ESPNFantasyClient
+from utils.http_session import create_session
+
+
+class CountingHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    connections = 0
+    failures = 0  # Requests still to answer with 503
+
+    def setup(self):
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        CountingHandler.connections += 1
+
+    def do_GET(self):
+        if CountingHandler.failures:
+            CountingHandler.failures -= 1
+            status, body = 503, b'{}'
+        else:
+            status, body = 200, json.dumps({'settings': {'name': 'League'}}).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_url(monkeypatch):
+    CountingHandler.connections = 0
+    CountingHandler.failures = 0
+    server = ThreadingHTTPServer(('127.0.0.1', 0), CountingHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    monkeypatch.setattr(ESPNFantasyClient, 'BASE_URL', url)
+    monkeypatch.delenv('ESPN_S2', raising=False)
+    monkeypatch.delenv('SWID', raising=False)
+    yield url
+    server.shutdown()
+    server.server_close()
+
+
+def test_client_reuses_one_connection(stub_url):
+    with contextlib.redirect_stdout(io.StringIO()):
+        with ESPNFantasyClient(1, 2026, use_cache=False, conditional=False) as client:
+            for _ in range(20):
+                assert client._make_request(params={'view': 'mSettings'})['settings']['name'] == 'League'
+
+    assert CountingHandler.connections == 1
+
+
+def test_session_retries_server_errors(stub_url):
+    CountingHandler.failures = 2
+    with create_session(max_retries=3, backoff_factor=0) as session:
+        response = session.get(f"{stub_url}/league")
+
+    assert response.status_code == 200
+    assert CountingHandler.failures == 0
+
+
+def test_session_hands_back_last_error(stub_url):
+    CountingHandler.failures = 5
+    with create_session(max_retries=1, backoff_factor=0) as session:
+        response = session.get(f"{stub_url}/league")
+
+    assert response.status_code == 503
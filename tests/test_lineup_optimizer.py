@@ -0,0 +1,92 @@
+"""
+Daily lineup solver: greedy matching against brute force, IR and slotless leagues
+"""
+import random
+from collections import Counter
+from functools import lru_cache
+
+import numpy as np
+import pytest
+
+from analyzers.lineup_optimizer import IR_SLOT, POSITION_SLOTS, LineupOptimizer, eligible_slots
+
+
+# PG, SG, SF, PF, C, G, F, 3 UT (bench and IR slots are not starting slots)
+ROSTER_SLOTS = {'0': 1, '1': 1, '2': 1, '3': 1, '4': 1, '5': 1, '6': 1, '11': 3, '12': 3, '13': 1}
+
+
+def best_lineup_value(eligible, values, slots) -> float:
+    """
+    Exhaustive search: every player either takes a free eligible slot or sits
+    """
+    @lru_cache(maxsize=None)
+    def best(player: int, used: int) -> float:
+        if player == len(eligible):
+            return 0.0
+        value = best(player + 1, used)
+        for k, slot in enumerate(slots):
+            if not used >> k & 1 and slot in eligible[player]:
+                value = max(value, values[player] + best(player + 1, used | 1 << k))
+        return value
+
+    return best(0, 0)
+
+
+@pytest.mark.parametrize('seed', range(200))
+def test_greedy_matching_is_optimal(seed):
+    rng = random.Random(seed)
+    optimizer = LineupOptimizer(ROSTER_SLOTS)
+    players = rng.randint(1, 13)
+    eligible = [set(rng.sample(sorted(POSITION_SLOTS[rng.randint(1, 5)]), rng.randint(1, 3))) for _ in range(players)]
+    values = [rng.random() for _ in range(players)]
+
+    assigned = optimizer.assign_day(eligible, values)
+
+    # A valid lineup: eligible slots only, no slot used more often than the league allows
+    used = Counter(slot for slot in assigned if slot is not None)
+    assert all(used[slot] <= optimizer.slots.count(slot) for slot in used)
+    assert all(slot is None or slot in slots for slot, slots in zip(assigned, eligible))
+
+    started_value = sum(value for value, slot in zip(values, assigned) if slot is not None)
+    assert started_value == pytest.approx(best_lineup_value(eligible, values, tuple(optimizer.slots)))
+
+
+def test_started_games_benches_lowest_value_when_slots_run_out():
+    optimizer = LineupOptimizer({'4': 1, '12': 3})
+    centers = [{4}, {4}, {4}]
+    games = np.array([[1, 1], [1, 0], [1, 1]], dtype=np.int8)
+
+    started = optimizer.started_games(centers, games, [0.5, 0.9, 0.1])
+
+    assert started.tolist() == [[0, 1], [1, 0], [0, 0]]
+
+
+def test_started_games_skips_players_on_ir():
+    optimizer = LineupOptimizer(ROSTER_SLOTS)
+    roster = [
+        {'eligible_slots': [0, 5, 11, 12, 13], 'lineup_slot': 0},
+        {'eligible_slots': [4, 10, 11, 12, 13], 'lineup_slot': IR_SLOT},
+        {'position': 5, 'lineup_slot': 12},
+    ]
+    eligible = [eligible_slots(player) for player in roster]
+    games = np.ones((3, 4), dtype=np.int8)
+
+    started = optimizer.started_games(eligible, games, [1.0, 5.0, 2.0])
+
+    assert eligible[1] == set()
+    assert started.tolist() == [[1] * 4, [0] * 4, [1] * 4]
+
+
+def test_started_games_without_slot_counts_keeps_every_game():
+    optimizer = LineupOptimizer({})
+    games = np.array([[1, 0, 1], [1, 1, 1]], dtype=np.int8)
+
+    assert optimizer.slots == []
+    assert optimizer.started_games([set(), {4}], games, [1.0, 2.0]).tolist() == games.tolist()
+
+
+def test_bench_and_ir_counts_are_not_starting_slots():
+    assert LineupOptimizer({'12': 3, '13': 1}).slots == []
+    assert eligible_slots({'eligible_slots': [0, 5, 11, 12, 13]}) == {0, 5, 11}
+    assert eligible_slots({'position': 5}) == POSITION_SLOTS[5]
+    assert eligible_slots({}) == {11}
@@ -0,0 +1,91 @@
+"""
+Matchup period -> projection window
+"""
+import contextlib
+import io
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from analyzers.matchup_analyzer import MatchupAnalyzer
+from analyzers.projection_engine import RosterProjection
+
+
+class StubClient:
+    def __init__(self, current):
+        self.current = current
+
+    def get_current_scoring_period(self):
+        return self.current
+
+
+def analyzer(current, matchup_periods):
+    analyzer = MatchupAnalyzer.__new__(MatchupAnalyzer)
+    analyzer.espn_client = StubClient(current)
+    analyzer.league_info = {'matchup_periods': matchup_periods}
+    return analyzer
+
+
+def day(offset):
+    return (datetime.now() + timedelta(days=offset)).strftime('%Y-%m-%d')
+
+
+PERIODS = {1: list(range(1, 8)), 2: list(range(8, 15)), 3: list(range(15, 29))}
+
+
+@pytest.mark.parametrize('week, expected', [
+    (None, (day(0), day(3))),   # Current period 11 -> days 11-14
+    (2, (day(0), day(3))),
+    (3, (day(4), day(17))),     # Two-week period ahead
+    (1, (day(0), day(-4))),     # Finished period - empty range
+])
+def test_matchup_dates(week, expected):
+    assert analyzer(11, PERIODS).matchup_dates(week) == expected
+
+
+def test_matchup_dates_without_periods_runs_to_sunday():
+    today = datetime.now()
+    sunday = (today + timedelta(days=6 - today.weekday())).strftime('%Y-%m-%d')
+    assert analyzer(11, {}).matchup_dates(2) == (today.strftime('%Y-%m-%d'), sunday)
+
+
+class RecordingAnalyzer(MatchupAnalyzer):
+    """
+    Projects empty rosters, so analyses stop early, and records the dates they were asked for
+    """
+    def __init__(self, current, matchup_periods, scoring_type):
+        self.espn_client = StubClient(current)
+        self.espn_client.get_my_team = lambda team_id: {'roster': []}
+        self.league_info = {'matchup_periods': matchup_periods}
+        self.scoring_type = scoring_type
+        self.team_id = 1
+        self.requested = []
+
+    def get_current_matchup_scores(self, week=None):
+        return {'week': week, 'matchup_period': 3, 'your_team_id': 1, 'opponent_team_id': 2,
+                'scoring_type': self.scoring_type, 'your_total_score': 0.0, 'opponent_total_score': 0.0,
+                'point_differential': 0.0, 'is_winning': False}
+
+    def acquisitions_left(self, matchup_period, days_left):
+        self.requested.append(('acquisitions', matchup_period, days_left))
+        return 0
+
+    def project_roster(self, roster, start_date, end_date):
+        self.requested.append(('projection', start_date, end_date))
+        return RosterProjection([], [], np.empty(0, dtype=np.intp), np.empty(0), [], np.empty((0, 0)), np.empty(0))
+
+
+def test_analyze_matchup_projects_the_matchup_period():
+    analyzer = RecordingAnalyzer(11, PERIODS, 'Points')
+    with contextlib.redirect_stdout(io.StringIO()):
+        analyzer.analyze_matchup()
+    assert analyzer.requested == [('projection', day(4), day(17))]
+
+
+def test_optimize_streaming_plans_over_the_matchup_period():
+    analyzer = RecordingAnalyzer(11, PERIODS, 'H2H Category')
+    with contextlib.redirect_stdout(io.StringIO()):
+        analyzer.optimize_streaming()
+    # Acquisitions get the period's 14 days; your roster and the opponent's are projected over them
+    assert analyzer.requested == [('acquisitions', 3, 14)] + [('projection', day(4), day(17))] * 2
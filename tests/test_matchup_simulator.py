@@ -0,0 +1,115 @@
+"""
+Monte Carlo matchup simulation: speed, percentage categories and probabilities
+"""
+import contextlib
+import io
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analyzers.matchup_simulator import MatchupSimulator
+from analyzers.projection_engine import DEFAULT_PROJECTED_STATS, ProjectionEngine
+
+
+CATEGORIES = ['PTS', 'REB', 'AST', 'STL', 'BLK', '3PM', 'TO', 'FG%', 'FT%']
+SCORED = [{'category': c, 'is_negative': c == 'TO'} for c in CATEGORIES]
+
+
+def stats_table(players: int = 200, seed: int = 0) -> pd.DataFrame:
+    """
+    Per-game averages with attempts >= makes
+    """
+    rng = np.random.default_rng(seed)
+    fga = rng.uniform(4, 20, players)
+    fta = rng.uniform(0, 8, players)
+    return pd.DataFrame({
+        'PTS': rng.uniform(5, 30, players),
+        'REB': rng.uniform(1, 12, players),
+        'AST': rng.uniform(0.5, 9, players),
+        'STL': rng.uniform(0, 2, players),
+        'BLK': rng.uniform(0, 2, players),
+        '3PM': rng.uniform(0, 4, players),
+        'TO': rng.uniform(0.5, 4, players),
+        'FGA': fga,
+        'FGM': fga * rng.uniform(0.35, 0.6, players),
+        'FTA': fta,
+        'FTM': fta * rng.uniform(0.5, 0.95, players),
+    })
+
+
+@pytest.fixture(scope='module')
+def engine():
+    with contextlib.redirect_stdout(io.StringIO()):
+        return ProjectionEngine(stats_table(), DEFAULT_PROJECTED_STATS + CATEGORIES)
+
+
+def roster(engine, seed: int):
+    rng = np.random.default_rng(seed)
+    return engine.project(rng.choice(len(engine.rates), 13, replace=False), rng.integers(2, 5, 13))
+
+
+def test_ten_thousand_trials_well_under_a_second(engine):
+    simulator = MatchupSimulator(engine, trials=10000, seed=0)
+    yours, opponent = roster(engine, 1), roster(engine, 2)
+    simulator.simulate(yours, opponent, SCORED)
+
+    start = time.perf_counter()
+    simulator.simulate(yours, opponent, SCORED)
+    assert time.perf_counter() - start < 1.0
+
+
+def test_probabilities_sum_to_one(engine):
+    simulator = MatchupSimulator(engine, trials=2000, seed=0)
+    result = simulator.simulate(roster(engine, 1), roster(engine, 2), SCORED)
+
+    overall = result['win_probability'] + result['tie_probability'] + result['loss_probability']
+    assert overall == pytest.approx(1.0)
+    assert set(result['categories']) == set(CATEGORIES)
+    for probabilities in result['categories'].values():
+        assert probabilities['win'] + probabilities['tie'] + probabilities['loss'] == pytest.approx(1.0)
+    assert 0 <= result['expected_categories_won'] <= len(CATEGORIES)
+
+
+def test_makes_are_drawn_from_simulated_attempts(engine):
+    simulator = MatchupSimulator(engine, trials=5000, seed=0)
+    projection = roster(engine, 3)
+    totals = simulator.simulate_totals(projection)
+    columns = engine.columns
+
+    for made, attempted in (('FGM', 'FGA'), ('FTM', 'FTA')):
+        makes, attempts = totals[:, columns.index(made)], totals[:, columns.index(attempted)]
+        assert (makes <= attempts).all()
+        # Attempts vary trial to trial, and makes follow them
+        assert attempts.std() > 0
+        assert np.corrcoef(makes, attempts)[0, 1] > 0.5
+        # Long-run percentage is the roster's projected percentage
+        assert makes.sum() / attempts.sum() == pytest.approx(projection.total(made) / projection.total(attempted), abs=0.01)
+
+
+def test_percentages_are_makes_over_attempts_with_week_to_date(engine):
+    yours, opponent = roster(engine, 4), roster(engine, 5)
+    current = {'FGM': 40, 'FGA': 80, 'FTM': 10, 'FTA': 20}
+
+    result = MatchupSimulator(engine, trials=3000, seed=7).simulate(yours, opponent, SCORED, current_yours=current)
+    replay = MatchupSimulator(engine, trials=3000, seed=7)
+    your_totals = replay.simulate_totals(yours)
+
+    fgm = your_totals[:, engine.columns.index('FGM')] + 40
+    fga = your_totals[:, engine.columns.index('FGA')] + 80
+    assert result['categories']['FG%']['your_mean'] == pytest.approx((fgm / fga).mean())
+
+
+def test_sure_shooter_makes_every_attempt():
+    stats = pd.DataFrame({'FGM': [10.0, 0.0], 'FGA': [10.0, 8.0], 'FTM': [4.0, 0.0], 'FTA': [4.0, 0.0]})
+    with contextlib.redirect_stdout(io.StringIO()):
+        engine = ProjectionEngine(stats, ['FG%', 'FT%'])
+    simulator = MatchupSimulator(engine, trials=500, seed=0)
+
+    shooter = simulator.simulate_totals(engine.project([0], [3]))
+    assert (shooter[:, engine.columns.index('FGM')] == shooter[:, engine.columns.index('FGA')]).all()
+
+    bricklayer = simulator.simulate_totals(engine.project([1], [3]))
+    assert (bricklayer[:, engine.columns.index('FGM')] == 0).all()
+    assert (bricklayer[:, engine.columns.index('FTA')] == 0).all()
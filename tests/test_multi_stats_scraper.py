@@ -0,0 +1,49 @@
+"""
+Multi-category scrape streamed to disk and merged from the saved tables
+"""
+import contextlib
+import io
+
+import pandas as pd
+import pytest
+
+from scrapers.espn_multi_stats_scraper import ESPNMultiStatsScraper
+from scrapers.stats_table_parser import StatsPage
+
+CATEGORY_PAGES = {
+    'general': [
+        {'RK': ['1', '2'], 'Name': ['A', 'B'], 'Team': ['BOS', 'LAL'], 'PlayerID': ['11', '12'], 'PTS': ['27.3', '25.0']},
+        {'RK': ['3'], 'Name': ['C'], 'Team': ['NYK'], 'PlayerID': ['13'], 'PTS': ['24.1']},
+    ],
+    'shooting': [
+        {'RK': ['1', '2', '3'], 'Name': ['B', 'A', 'C'], 'Team': ['LAL', 'BOS', 'NYK'], 'PlayerID': ['12', '11', '13'],
+         'PTS': ['25.0', '27.3', '24.1'], '3P%': ['.401', '.355', '.380']},
+    ],
+}
+
+
+@pytest.fixture
+def scraper(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    scraper = ESPNMultiStatsScraper()
+    monkeypatch.setattr(scraper, 'iter_pages', lambda category, max_pages=20, max_workers=None:
+                        iter([StatsPage({name: list(values) for name, values in page.items()})
+                              for page in CATEGORY_PAGES[category]]))
+    return scraper
+
+
+def test_streamed_categories_merge_like_in_memory(scraper):
+    with contextlib.redirect_stdout(io.StringIO()):
+        paths = scraper.scrape_all_categories(['general', 'shooting'])
+        frames = scraper.scrape_all_categories(['general', 'shooting'], keep_frames=True)
+        from_paths = scraper.merge_categories(paths)
+        from_frames = scraper.merge_categories(frames)
+
+    assert all(isinstance(path, str) for path in paths.values())
+    assert all(isinstance(df, pd.DataFrame) for df in frames.values())
+
+    # In-memory frames hold the raw cell text; the saved tables read back typed
+    assert list(from_paths.columns) == list(from_frames.columns)
+    assert from_paths['Name'].tolist() == from_frames['Name'].tolist() == ['A', 'B', 'C']
+    for column in ['RK', 'PlayerID', 'PTS', '3P%']:
+        assert from_paths[column].tolist() == pytest.approx(pd.to_numeric(from_frames[column]).tolist())
@@ -0,0 +1,81 @@
+"""
+Player name normalization and the name/ID index over the stats table
+"""
+import pandas as pd
+import pytest
+
+from analyzers.player_index import PlayerNameIndex, normalize_name
+
+
+@pytest.mark.parametrize('espn, stats', [
+    ('Nikola Jokić', 'Nikola Jokic'),
+    ('Luka Dončić', 'LUKA DONCIC'),
+    ('Jaren Jackson Jr.', 'Jaren Jackson'),
+    ('Jaime Jaquez Jr.', 'Jaime Jaquez Jr'),
+    ('Marvin Bagley III', 'Marvin Bagley'),
+    ('Gary Trent Jr.', 'Gary Trent Jr. '),
+    ('O.G. Anunoby', 'OG Anunoby'),
+    ('P.J. Washington', 'PJ Washington'),
+    ("D'Angelo Russell", 'DAngelo Russell'),
+    ('Karl-Anthony Towns', 'Karl Anthony Towns'),
+])
+def test_normalize_name_matches_spellings(espn, stats):
+    assert normalize_name(espn) == normalize_name(stats)
+
+
+def test_normalize_name_edge_cases():
+    assert normalize_name('Nikola Jokić') == 'nikola jokic'
+    assert normalize_name('Jr.') == 'jr'
+    assert normalize_name(None) == ''
+    assert normalize_name(float('nan')) == ''
+    assert normalize_name('Jalen Williams') != normalize_name('Jaylin Williams')
+
+
+@pytest.fixture
+def stats():
+    return pd.DataFrame({
+        'Name': ['Nikola Jokic', 'Jaren Jackson Jr.', 'Dennis Schroder', 'Dennis Schroder', 'OG Anunoby',
+                 'Jalen Williams', 'Jalen Williams'],
+        'Team': ['DEN', 'MEM', 'GS', 'SAC', 'NY', 'OKC', 'PHO'],
+        'PlayerID': ['3112335', '4277961', '3032979', '3032979', 3934719.0, '4593803', '4432907'],
+    })
+
+
+def test_find_by_name(stats):
+    index = PlayerNameIndex(stats)
+
+    assert index.find('Nikola Jokić') == 0
+    assert index.find('Jaren Jackson') == 1
+    assert index.find('O.G. Anunoby') == 4
+    assert index.find('Nobody Atall') is None
+    assert index.find(None) is None
+
+
+def test_find_prefers_the_current_team_row(stats):
+    index = PlayerNameIndex(stats)
+
+    # Traded player listed once per team - the current team wins, else the first row
+    assert index.find('Dennis Schröder', 'SAC') == 3
+    assert index.find('Dennis Schröder', 'GS') == 2
+    assert index.find('Dennis Schröder', 'LAL') == 2
+    assert index.find('Dennis Schröder') == 2
+
+
+def test_find_tries_the_player_id_first(stats):
+    index = PlayerNameIndex(stats)
+
+    # Two different players share a name - the ID tells them apart whatever the team says
+    assert index.find('Jalen Williams', 'OKC', player_id=4432907) == 6
+    assert index.find('Jalen Williams', player_id='4593803') == 5
+    # IDs read back from CSV as floats still match
+    assert index.find('OG Anunoby', player_id=3934719) == 4
+    # Unknown IDs fall back to the name
+    assert index.find('Jalen Williams', 'PHO', player_id=999) == 6
+    assert index.find('Nikola Jokic', player_id=None) == 0
+
+
+def test_index_without_player_ids():
+    index = PlayerNameIndex(pd.DataFrame({'Name': ['Nikola Jokic', None], 'Team': ['DEN', 'BOS']}))
+
+    assert index.find('Nikola Jokić', player_id=3112335) == 0
+    assert len(index) == 1
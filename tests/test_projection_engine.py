@@ -0,0 +1,116 @@
+"""
+Vectorized roster projections must equal the dict-per-player projection they
+replaced (frozen below).
+"""
+import contextlib
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analyzers.projection_engine import DEFAULT_PROJECTED_STATS, ProjectionEngine
+
+
+STATS = ['PTS', 'REB', 'AST', 'STL', 'BLK', '3PM', 'FGM', 'FGA', 'FTM', 'FTA', 'TO']
+
+
+def old_player_projections(player_stats: pd.DataFrame, rows, games) -> pd.DataFrame:
+    """
+    Frozen copy of get_player_projections: one dict per player from the stats row
+    """
+    projections = []
+    for row, games_remaining in zip(rows, games):
+        stats = player_stats.iloc[row]
+        projection = {'Player': stats['Name'], 'Team': stats['Team'], 'GamesRemaining': games_remaining}
+        for column in STATS:
+            projection[column] = stats.get(column, 0) * games_remaining
+        projections.append(projection)
+    return pd.DataFrame(projections)
+
+
+def old_team_totals(projections_df: pd.DataFrame) -> dict:
+    """
+    Frozen copy of the analyze_matchup totals: column sums, percentages as made / attempted
+    """
+    totals = {column: projections_df[column].sum() for column in STATS}
+    totals['FG%'] = totals['FGM'] / totals['FGA'] if totals['FGA'] > 0 else 0
+    totals['FT%'] = totals['FTM'] / totals['FTA'] if totals['FTA'] > 0 else 0
+    return totals
+
+
+def synthetic_stats(seed: int, players: int = 300) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({column: rng.gamma(2.0, 2.0, players).round(1) for column in STATS})
+    df['FGA'] = df['FGM'] + rng.gamma(2.0, 2.0, players).round(1)
+    df['FTA'] = df['FTM'] + rng.gamma(1.0, 1.0, players).round(1)
+    df.insert(0, 'Name', [f'Player {i}' for i in range(players)])
+    df.insert(1, 'Team', rng.choice(['BOS', 'DEN', 'LAL', 'MIA'], players))
+    return df
+
+
+def rosters(seed: int, players: int, count: int = 10):
+    rng = np.random.default_rng(seed + 100)
+    rows = [rng.choice(players, size=13, replace=False) for _ in range(count)]
+    games = [rng.integers(0, 5, size=13) for _ in range(count)]
+    return rows, games
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_per_player_and_totals_match_dict_projection(seed):
+    stats = synthetic_stats(seed)
+    engine = ProjectionEngine(stats)
+    rows, games = rosters(seed, len(stats), count=1)
+    names = stats['Name'].iloc[rows[0]].tolist()
+    teams = stats['Team'].iloc[rows[0]].tolist()
+
+    projection = engine.project(rows[0], games[0], names, teams)
+    expected = old_player_projections(stats, rows[0], games[0])
+
+    pd.testing.assert_frame_equal(projection.to_dataframe()[expected.columns], expected, check_dtype=False)
+    totals = old_team_totals(expected)
+    for category, value in totals.items():
+        assert projection.category_value(category) == pytest.approx(value)
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_league_totals_match_one_dict_projection_per_team(seed):
+    stats = synthetic_stats(seed)
+    engine = ProjectionEngine(stats)
+    rows, games = rosters(seed, len(stats))
+    team_ids = list(range(1, len(rows) + 1))
+
+    league = engine.project_teams(team_ids, [f'Team {t}' for t in team_ids], rows, games)
+    matrix = league.category_matrix(STATS + ['FG%', 'FT%'])
+
+    for team_id, team_rows, team_games in zip(team_ids, rows, games):
+        expected = old_team_totals(old_player_projections(stats, team_rows, team_games))
+        for category, value in expected.items():
+            assert matrix.at[team_id, category] == pytest.approx(value)
+            assert league.rosters[team_id].category_value(category) == pytest.approx(value)
+
+
+def test_missing_and_blank_stats_count_as_zero():
+    stats = synthetic_stats(0, players=20).drop(columns='BLK')
+    stats.loc[3, 'PTS'] = np.nan
+    with contextlib.redirect_stdout(io.StringIO()):
+        engine = ProjectionEngine(stats)
+
+    projection = engine.project([3, 4], [2, 3])
+    expected = old_player_projections(stats, [3, 4], [2, 3])
+
+    assert engine.columns == DEFAULT_PROJECTED_STATS
+    assert projection.total('BLK') == 0.0
+    # Pandas sums skip the NaN, so the old total counted the blank stat as 0 too
+    assert projection.total('PTS') == pytest.approx(expected['PTS'].sum())
+
+
+def test_roster_without_attempts_has_zero_percentages():
+    stats = synthetic_stats(0, players=5)
+    engine = ProjectionEngine(stats)
+
+    projection = engine.project([0, 1], [0, 0])
+
+    assert projection.category_value('FG%') == 0.0
+    assert projection.category_value('FT%') == 0.0
+    assert engine.project([], []).totals.tolist() == [0.0] * len(STATS)
@@ -0,0 +1,112 @@
+"""
+Concurrent page fetching: page order, stopping at the end of the data, rate limiting
+"""
+import contextlib
+import io
+import random
+import threading
+import time
+
+import pytest
+
+from scrapers.espn_scraper import ESPNStatsScraper
+from scrapers.stats_table_parser import StatsPage
+from utils.rate_limiter import TokenBucket, fetch_pages_concurrently
+
+
+class PageSource:
+    """
+    Pages 1..last hold data, later pages are empty; each request sleeps a random few ms
+    """
+
+    def __init__(self, last: int, seed: int = 0):
+        self.last = last
+        self.rng = random.Random(seed)
+        self.requested = []
+        self.lock = threading.Lock()
+
+    def __call__(self, page: int):
+        with self.lock:
+            self.requested.append(page)
+            delay = self.rng.uniform(0, 0.01)
+        time.sleep(delay)
+        return f'page {page}' if page <= self.last else None
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_pages_come_back_in_order(seed):
+    source = PageSource(last=12, seed=seed)
+
+    pages = list(fetch_pages_concurrently(source, max_pages=12, max_workers=4))
+
+    assert pages == [f'page {page}' for page in range(1, 13)]
+    assert sorted(source.requested) == list(range(1, 13))
+
+
+@pytest.mark.parametrize('max_workers', [1, 2, 4, 8])
+def test_stops_at_the_first_empty_page(max_workers):
+    source = PageSource(last=5)
+
+    pages = list(fetch_pages_concurrently(source, max_pages=20, max_workers=max_workers))
+
+    assert pages == [f'page {page}' for page in range(1, 6)]
+    # Nothing past the pages already in flight when the empty page came back
+    assert max(source.requested) <= 6 + max_workers - 1
+    assert 6 in source.requested
+
+
+def test_sequential_fetch_makes_one_request_past_the_end():
+    source = PageSource(last=3)
+
+    assert list(fetch_pages_concurrently(source, max_pages=20, max_workers=1)) == ['page 1', 'page 2', 'page 3']
+    assert source.requested == [1, 2, 3, 4]
+
+
+def test_data_after_a_gap_is_not_yielded():
+    def fetch(page):
+        return None if page == 3 else page
+
+    assert list(fetch_pages_concurrently(fetch, max_pages=10, max_workers=4)) == [1, 2]
+
+
+def test_max_pages_caps_the_requests():
+    source = PageSource(last=100)
+
+    assert len(list(fetch_pages_concurrently(source, max_pages=7, max_workers=3))) == 7
+    assert sorted(source.requested) == list(range(1, 8))
+
+
+def test_token_bucket_allows_a_burst_then_the_rate():
+    bucket = TokenBucket(rate=20, burst=3)
+
+    assert [bucket.try_acquire() for _ in range(4)] == [True, True, True, False]
+
+    start = time.monotonic()
+    bucket.acquire()
+    bucket.acquire()
+    assert time.monotonic() - start >= 0.08
+
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+    with pytest.raises(ValueError):
+        TokenBucket(burst=0)
+
+
+def test_iter_pages_streams_pages_until_the_empty_one(monkeypatch):
+    with contextlib.redirect_stdout(io.StringIO()):
+        scraper = ESPNStatsScraper(requests_per_second=1000, burst=10, max_workers=3)
+    requested = []
+
+    def fetch(session, url, parse, **kwargs):
+        page = int(url.rsplit('/', 1)[-1])
+        requested.append(page)
+        if page > 4:
+            return None, True
+        return StatsPage({'RK': [str(page)], 'Name': [f'Player {page}']}), True
+
+    monkeypatch.setattr(scraper.validators, 'fetch', fetch)
+    with contextlib.redirect_stdout(io.StringIO()):
+        pages = list(scraper.iter_pages(max_pages=20))
+
+    assert [page.columns['RK'] for page in pages] == [['1'], ['2'], ['3'], ['4']]
+    assert max(requested) <= 5 + 3 - 1
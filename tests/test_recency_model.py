@@ -0,0 +1,54 @@
+"""
+Incremental recency-weighted averages
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from analyzers.recency_model import RecencyModel
+
+
+def games(rows, period_dtype=np.int64):
+    df = pd.DataFrame(rows, columns=['PlayerID', 'Name', 'Team', 'ScoringPeriod', 'PTS'])
+    df['ScoringPeriod'] = df['ScoringPeriod'].astype(period_dtype)
+    return df
+
+
+LOG = games([
+    (1, 'A', 'BOS', 1, 10.0), (2, 'B', 'LAL', 1, 20.0),
+    (1, 'A', 'BOS', 2, 30.0), (2, 'B', 'LAL', 3, 5.0),
+    (1, 'A', 'BOS', 4, 12.0),
+])
+
+
+def test_incremental_updates_match_one_batch():
+    batch = RecencyModel(half_life=2, columns=['PTS'])
+    batch.update(LOG)
+
+    incremental = RecencyModel(half_life=2, columns=['PTS'])
+    for period in sorted(LOG['ScoringPeriod'].unique()):
+        incremental.update(LOG[LOG['ScoringPeriod'] == period])
+
+    pd.testing.assert_frame_equal(incremental.averages(), batch.averages())
+    assert incremental.state['LastPeriod'].tolist() == [4, 3]
+    assert incremental.state['Games'].tolist() == [3, 2]
+
+
+@pytest.mark.parametrize('period_dtype', [np.int16, np.int32, np.int64])
+def test_update_with_only_known_players(period_dtype):
+    model = RecencyModel(columns=['PTS'])
+    model.update(games([(1, 'A', 'BOS', 1, 10.0), (2, 'B', 'LAL', 2, 20.0)], period_dtype))
+
+    assert model.update(games([(1, 'A', 'BOS', 3, 30.0)], period_dtype)) == 1
+    assert model.state['LastPeriod'].tolist() == [3, 2]
+    assert model.state['LastPeriod'].dtype == np.int32
+
+
+def test_repeated_lines_are_skipped(tmp_path):
+    model = RecencyModel(columns=['PTS'])
+    model.update(LOG)
+    path = model.save(str(tmp_path / 'recency.feather'))
+
+    loaded = RecencyModel.load(path)
+    assert loaded.update(LOG) == 0
+    pd.testing.assert_frame_equal(loaded.averages(), model.averages(), check_dtype=False)
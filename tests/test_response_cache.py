@@ -0,0 +1,160 @@
+"""
+Per-view TTLs on combined league requests and the league snapshot
+"""
+import contextlib
+import io
+import json
+from datetime import timedelta
+
+import pytest
+
+from scrapers.espn_fantasy_client import ESPNFantasyClient, LeagueSnapshot
+from utils.response_cache import ResponseCache
+
+LEAGUE_VIEWS = ['mSettings', 'mTeam', 'mRoster', 'mMatchup', 'mMatchupScore']
+
+
+class FakeResponse:
+    status_code = 200
+    url = 'http://stub/league'
+
+    def __init__(self, data):
+        self.headers = {'Content-Type': 'application/json'}
+        self.content = json.dumps(data).encode()
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    """
+    Answers every request with the keys its views produce, recording the views asked for
+    """
+
+    def __init__(self):
+        self.requests = []
+
+    def get(self, url, params=None, **kwargs):
+        views = params['view'] if isinstance(params['view'], list) else [params['view']]
+        self.requests.append(sorted(views))
+
+        data = {'id': 1, 'scoringPeriodId': len(self.requests)}
+        if 'mSettings' in views:
+            data['settings'] = {'name': f"Settings #{len(self.requests)}", 'size': 2}
+        if 'mTeam' in views or 'mRoster' in views:
+            data['teams'] = [{'id': 1}]
+        if 'mMatchup' in views or 'mMatchupScore' in views:
+            data['schedule'] = []
+        return FakeResponse(data)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.delenv('ESPN_S2', raising=False)
+    monkeypatch.delenv('SWID', raising=False)
+
+    # Everything but mSettings expires at once
+    cache = ResponseCache(view_ttls={'mTeam': 0, 'mRoster': 0, 'mMatchup': 0, 'mMatchupScore': 0})
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield ESPNFantasyClient(1, 2026, session=FakeSession(), cache=cache, conditional=False)
+
+
+def test_ttl_for_is_shortest_view_ttl():
+    cache = ResponseCache()
+    assert cache.ttl_for(['mSettings']) == 6 * 60 * 60
+    assert cache.ttl_for(LEAGUE_VIEWS) == 15
+    assert cache.ttl_for(['unknownView']) == cache.default_ttl
+
+
+def test_combined_request_caches_settings_on_their_own_ttl(client):
+    first = client.fetch_views(LEAGUE_VIEWS)
+    second = client.fetch_views(LEAGUE_VIEWS)
+
+    # The second refresh leaves mSettings out and reuses the cached settings
+    assert client.session.requests == [sorted(LEAGUE_VIEWS), sorted(LEAGUE_VIEWS[1:])]
+    assert second.settings == first.settings == {'name': 'Settings #1', 'size': 2}
+    assert second.current_scoring_period == 2
+    assert second.teams and 'schedule' in second.data
+
+    # A settings-only call is served from the same entry
+    client.clear_snapshot()
+    assert client.get_league_info()['name'] == 'Settings #1'
+    assert len(client.session.requests) == 2
+
+
+def test_expired_settings_are_fetched_again(client):
+    client.fetch_views(LEAGUE_VIEWS)
+    client.cache.invalidate()
+    snapshot = client.fetch_views(LEAGUE_VIEWS)
+
+    assert client.session.requests == [sorted(LEAGUE_VIEWS)] * 2
+    assert snapshot.settings['name'] == 'Settings #2'
+
+
+def test_no_split_without_cache(monkeypatch):
+    monkeypatch.delenv('ESPN_S2', raising=False)
+    monkeypatch.delenv('SWID', raising=False)
+    with contextlib.redirect_stdout(io.StringIO()):
+        client = ESPNFantasyClient(1, 2026, session=FakeSession(), use_cache=False, conditional=False)
+        client.fetch_views(LEAGUE_VIEWS)
+        client.fetch_views(LEAGUE_VIEWS)
+
+    assert client.session.requests == [sorted(LEAGUE_VIEWS)] * 2
+
+
+@pytest.fixture
+def uncached_client(monkeypatch):
+    monkeypatch.delenv('ESPN_S2', raising=False)
+    monkeypatch.delenv('SWID', raising=False)
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield ESPNFantasyClient(1, 2026, session=FakeSession(), use_cache=False, conditional=False)
+
+
+def test_snapshot_covers_its_views_and_period():
+    snapshot = LeagueSnapshot(views=frozenset(LEAGUE_VIEWS), data={}, scoring_period_id=None)
+
+    assert snapshot.covers(['mRoster'])
+    assert snapshot.covers(['mMatchup', 'mMatchupScore'], max_age=15)
+    assert not snapshot.covers(['kona_player_info'])
+    assert not snapshot.covers(['mRoster'], scoring_period_id=42)
+
+    snapshot.fetched_at -= timedelta(seconds=20)
+    assert not snapshot.covers(['mMatchupScore'], max_age=15)
+    assert snapshot.covers(['mMatchupScore'])
+
+
+def test_snapshot_expires_on_the_views_ttl(uncached_client):
+    client = uncached_client
+    with contextlib.redirect_stdout(io.StringIO()):
+        client.fetch_views(LEAGUE_VIEWS)
+        client.get_league_info()
+        client.get_my_team()
+        client.get_current_matchup()
+        assert len(client.session.requests) == 1
+
+        # 30 s later the 15 s score view is stale, settings and rosters are not
+        client.snapshot.fetched_at -= timedelta(seconds=30)
+        client.get_league_info()
+        client.get_my_team()
+        client.get_current_matchup()
+        assert client.session.requests[1:] == [['mMatchup', 'mMatchupScore']]
+
+        # Past the 5 min roster TTL only settings are still served from the snapshot
+        client.snapshot.fetched_at -= timedelta(seconds=400)
+        client.get_my_team()
+        client.get_league_info()
+        assert client.session.requests[2:] == [['mRoster']]
+
+
+def test_views_outside_the_snapshot_are_requested(uncached_client):
+    client = uncached_client
+    with contextlib.redirect_stdout(io.StringIO()):
+        client.fetch_views(['mSettings', 'mTeam'])
+        client.get_teams()
+        client.get_my_team()
+        client.get_current_matchup(week=3)
+
+    assert client.session.requests == [['mSettings', 'mTeam'], ['mRoster'], ['mMatchup', 'mMatchupScore']]
@@ -0,0 +1,163 @@
+"""
+The memoized weekly breakdown and team trends must equal the per-week and
+per-team loops they replaced (frozen below).
+"""
+import contextlib
+import io
+import random
+
+import pandas as pd
+import pytest
+
+from analyzers.schedule_analyzer import ScheduleAnalyzer
+from utils.storage import save_table
+
+
+TEAMS = ['ATL', 'BOS', 'BKN', 'CHA', 'CHI', 'DEN', 'GSW', 'LAL', 'MIA', 'NYK']
+
+
+def old_weekly_breakdowns(schedule_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Frozen copy of get_all_weekly_breakdowns: one mask and groupby per Monday
+    """
+    min_date = schedule_df['ParsedDate'].min()
+    max_date = schedule_df['ParsedDate'].max()
+    current_monday = min_date - pd.Timedelta(days=min_date.dayofweek)
+
+    weeks_data = []
+    week_num = 1
+    while current_monday <= max_date:
+        week_end = current_monday + pd.Timedelta(days=6)
+        mask = (schedule_df['ParsedDate'] >= current_monday) & (schedule_df['ParsedDate'] <= week_end)
+        week_info = {
+            'Week': f'Week{week_num}',
+            'WeekStart': current_monday.strftime('%Y-%m-%d'),
+            'WeekEnd': week_end.strftime('%Y-%m-%d')
+        }
+        week_info.update(schedule_df[mask].groupby('Team').size().to_dict())
+        weeks_data.append(week_info)
+        current_monday += pd.Timedelta(days=7)
+        week_num += 1
+
+    df = pd.DataFrame(weeks_data)
+    team_columns = [col for col in df.columns if col not in ['Week', 'WeekStart', 'WeekEnd']]
+    df[team_columns] = df[team_columns].fillna(0).astype(int)
+    return df
+
+
+def old_team_schedule_trends(schedule_df: pd.DataFrame, team: str) -> pd.DataFrame:
+    """
+    Frozen copy of get_team_schedule_trends: iterrows over the weeks, one date-range query per week
+    """
+    weekly_df = old_weekly_breakdowns(schedule_df)
+    team_schedule = weekly_df[['Week', 'WeekStart', 'WeekEnd', team]].copy()
+    team_schedule.columns = ['Week', 'WeekStart', 'WeekEnd', 'GamesInWeek']
+
+    details = []
+    for _, row in team_schedule.iterrows():
+        mask = (
+            (schedule_df['Team'] == team) &
+            (schedule_df['ParsedDate'] >= pd.to_datetime(row['WeekStart'])) &
+            (schedule_df['ParsedDate'] <= pd.to_datetime(row['WeekEnd']))
+        )
+        games = schedule_df[mask].sort_values('ParsedDate')
+        if len(games) > 0:
+            details.append({
+                'GameDays': ', '.join(games['DayOfWeek'].tolist()),
+                'HasBackToBack': games['IsBackToBack'].any(),
+                'Home': (games['HomeAway'] == 'Home').sum(),
+                'Away': (games['HomeAway'] == 'Away').sum(),
+            })
+        else:
+            details.append({'GameDays': 'No games', 'HasBackToBack': False, 'Home': 0, 'Away': 0})
+
+    return pd.concat([team_schedule, pd.DataFrame(details)], axis=1)
+
+
+def synthetic_schedule(seed: int) -> pd.DataFrame:
+    """
+    Season with a late-starting team, a bye week and an unparsed (NaT) date
+    """
+    rng = random.Random(seed)
+    start = pd.Timestamp('2025-10-21')
+    rows = []
+    for t, team in enumerate(TEAMS):
+        first_day = 20 if t == len(TEAMS) - 1 else 0
+        days = sorted(rng.sample([d for d in range(first_day, 120) if not 40 <= d < 47 or t % 3], 35))
+        for day in days:
+            rows.append({'Team': team, 'ParsedDate': start + pd.Timedelta(days=day),
+                         'HomeAway': rng.choice(['Home', 'Away'])})
+    rows.append({'Team': TEAMS[0], 'ParsedDate': pd.NaT, 'HomeAway': 'Home'})
+    rng.shuffle(rows)
+
+    df = pd.DataFrame(rows)
+    df['DayOfWeek'] = df['ParsedDate'].dt.day_name()
+    gap = df.sort_values('ParsedDate').groupby('Team')['ParsedDate']
+    df['IsBackToBack'] = ((gap.diff().dt.days == 1) | (gap.diff(-1).dt.days == -1)).reindex(df.index)
+    return df
+
+
+@pytest.fixture(scope='module', params=range(3))
+def analyzer(request, tmp_path_factory):
+    path = save_table(synthetic_schedule(request.param), str(tmp_path_factory.mktemp('schedule') / 'schedule.feather'))
+    with contextlib.redirect_stdout(io.StringIO()):
+        return ScheduleAnalyzer(path)
+
+
+def test_weekly_breakdown_matches_per_week_loop(analyzer):
+    expected = old_weekly_breakdowns(analyzer.schedule_df)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        first = analyzer.get_all_weekly_breakdowns()
+        second = analyzer.get_all_weekly_breakdowns()
+
+    pd.testing.assert_frame_equal(first, expected, check_dtype=False)
+    pd.testing.assert_frame_equal(second, expected, check_dtype=False)
+
+
+def test_weekly_breakdown_cache_is_not_shared_with_callers(analyzer):
+    with contextlib.redirect_stdout(io.StringIO()):
+        weekly = analyzer.get_all_weekly_breakdowns()
+        weekly['TotalGames'] = 0
+        weekly.loc[0, TEAMS[0]] = 99
+        analyzer.find_best_streaming_weeks()
+
+        again = analyzer.get_all_weekly_breakdowns()
+
+    assert 'TotalGames' not in again.columns
+    pd.testing.assert_frame_equal(again, old_weekly_breakdowns(analyzer.schedule_df), check_dtype=False)
+
+
+def test_season_summary_matches_per_week_loop(analyzer):
+    with contextlib.redirect_stdout(io.StringIO()):
+        summary = analyzer.get_season_schedule_summary()
+
+    expected = old_weekly_breakdowns(analyzer.schedule_df)
+    team_columns = [col for col in expected.columns if col not in ['Week', 'WeekStart', 'WeekEnd']]
+    assert summary['TotalGames'].to_dict() == expected[team_columns].sum().to_dict()
+
+
+@pytest.mark.parametrize('team', TEAMS)
+def test_team_trends_match_per_team_loop(analyzer, team):
+    expected = old_team_schedule_trends(analyzer.schedule_df, team)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        trends = analyzer.get_team_schedule_trends(team.lower())
+
+    pd.testing.assert_frame_equal(trends, expected, check_dtype=False)
+
+
+def test_all_team_trends_are_every_team_slice(analyzer):
+    with contextlib.redirect_stdout(io.StringIO()):
+        all_trends = analyzer.get_all_team_trends()
+        weeks = len(analyzer.get_all_weekly_breakdowns())
+
+    assert len(all_trends) == weeks * len(TEAMS)
+    for team, rows in all_trends.groupby('Team', sort=False):
+        expected = old_team_schedule_trends(analyzer.schedule_df, team)
+        pd.testing.assert_frame_equal(rows.drop(columns='Team').reset_index(drop=True), expected, check_dtype=False)
+
+
+def test_unknown_team_raises(analyzer):
+    with contextlib.redirect_stdout(io.StringIO()), pytest.raises(ValueError):
+        analyzer.get_team_schedule_trends('XXX')
@@ -0,0 +1,145 @@
+"""
+ScheduleIndex lookups must agree with the DataFrame row masks they replaced
+"""
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analyzers.schedule_index import ScheduleIndex
+
+
+TEAMS = ['ATL', 'BOS', 'BKN', 'CHA', 'CHI', 'CLE', 'DAL', 'DEN', 'DET', 'GS']
+SEASON_START = pd.Timestamp('2025-10-22')
+
+
+def synthetic_schedule(seed: int) -> pd.DataFrame:
+    """
+    Random season: each team plays on distinct days, with an unparsed (NaT) row here and there
+    """
+    rng = random.Random(seed)
+    rows = []
+    for team in TEAMS:
+        for day in sorted(rng.sample(range(170), rng.randint(20, 82))):
+            rows.append({
+                'Team': team,
+                'ParsedDate': SEASON_START + pd.Timedelta(days=day),
+                'HomeAway': rng.choice(['Home', 'Away']),
+                'OpponentClean': rng.choice(TEAMS),
+            })
+        if rng.random() < 0.3:
+            rows.append({'Team': team, 'ParsedDate': pd.NaT, 'HomeAway': 'Home', 'OpponentClean': 'TBD'})
+    rng.shuffle(rows)
+    df = pd.DataFrame(rows)
+
+    df['DATE'] = df['ParsedDate'].dt.strftime('%a, %b %-d')
+    df['DayOfWeek'] = df['ParsedDate'].dt.day_name()
+    ordered = df.sort_values(['Team', 'ParsedDate'])
+    gap_before = ordered.groupby('Team')['ParsedDate'].diff().dt.days == 1
+    gap_after = ordered.groupby('Team')['ParsedDate'].diff(-1).dt.days == -1
+    df['IsBackToBack'] = (gap_before | gap_after).reindex(df.index)
+    df['BackToBackPosition'] = np.where(gap_before.reindex(df.index), 'Second',
+                                        np.where(gap_after.reindex(df.index), 'First', 'None'))
+    return df
+
+
+def random_range(rng: random.Random):
+    start = SEASON_START + pd.Timedelta(days=rng.randint(-10, 175))
+    end = start + pd.Timedelta(days=rng.randint(-2, 30))
+    return start.strftime('%Y-%m-%d'), end.strftime('%Y-%m-%d')
+
+
+@pytest.fixture(scope='module', params=range(3))
+def season(request):
+    df = synthetic_schedule(request.param)
+    return df, ScheduleIndex(df), random.Random(request.param)
+
+
+def test_range_counts_match_row_masks(season):
+    df, index, rng = season
+    for _ in range(50):
+        start_date, end_date = random_range(rng)
+        in_range = (df['ParsedDate'] >= pd.to_datetime(start_date)) & (df['ParsedDate'] <= pd.to_datetime(end_date))
+
+        games = df[in_range].groupby('Team').size().reindex(index.teams, fill_value=0)
+        home = df[in_range & (df['HomeAway'] == 'Home')].groupby('Team').size().reindex(index.teams, fill_value=0)
+
+        assert index.game_counts(start_date, end_date).tolist() == games.tolist()
+        assert index.home_counts(start_date, end_date).tolist() == home.tolist()
+        for team in index.teams:
+            assert index.game_count(team, start_date, end_date) == games[team]
+    assert index.game_count('XXX', '2025-10-22', '2026-04-30') == 0
+
+
+def test_start_with_time_of_day_excludes_midnight_games(season):
+    df, index, _ = season
+    start = SEASON_START + pd.Timedelta(days=3, hours=19)
+    end = SEASON_START + pd.Timedelta(days=10)
+    in_range = (df['ParsedDate'] >= start) & (df['ParsedDate'] <= end)
+
+    expected = df[in_range].groupby('Team').size().reindex(index.teams, fill_value=0)
+    assert index.game_counts(start, end).tolist() == expected.tolist()
+
+
+def test_team_rows_match_team_mask(season):
+    df, index, rng = season
+    for _ in range(50):
+        team = rng.choice(TEAMS)
+        start_date, end_date = random_range(rng)
+        mask = (
+            (df['Team'] == team) &
+            (df['ParsedDate'] >= pd.to_datetime(start_date)) &
+            (df['ParsedDate'] <= pd.to_datetime(end_date))
+        )
+        expected = df[mask].sort_values('ParsedDate')
+
+        rows = index.team_rows(team, start_date, end_date)
+        pd.testing.assert_frame_equal(df.iloc[rows], expected)
+
+
+def test_teams_on_and_teams_by_day_match_date_filter(season):
+    df, index, rng = season
+    for _ in range(20):
+        start_date, end_date = random_range(rng)
+        in_range = df[(df['ParsedDate'] >= pd.to_datetime(start_date)) & (df['ParsedDate'] <= pd.to_datetime(end_date))]
+        expected = {
+            str(date): sorted(in_range[in_range['ParsedDate'].dt.date == date]['Team'].tolist())
+            for date in sorted(in_range['ParsedDate'].dt.date.unique())
+        }
+
+        assert index.teams_by_day(start_date, end_date) == expected
+        for date_str, teams in expected.items():
+            assert index.teams_on(date_str) == teams
+    assert index.teams_on('2030-01-01') == []
+
+
+def test_by_week_matches_monday_to_sunday_masks(season):
+    df, index, _ = season
+    weekly = index.by_week(index.games)
+    week_starts = index.week_starts()
+
+    min_date = df['ParsedDate'].min()
+    first_monday = min_date - pd.Timedelta(days=min_date.dayofweek)
+    assert week_starts[0] == first_monday
+    assert week_starts[-1] <= df['ParsedDate'].max() < week_starts[-1] + pd.Timedelta(days=7)
+
+    for w, monday in enumerate(week_starts):
+        mask = (df['ParsedDate'] >= monday) & (df['ParsedDate'] <= monday + pd.Timedelta(days=6))
+        counts = df[mask].groupby('Team').size().reindex(index.teams, fill_value=0)
+        assert weekly[:, w].tolist() == counts.tolist()
+
+
+def test_back_to_back_rows_match_mask(season):
+    df, index, rng = season
+    for _ in range(20):
+        start_date, end_date = random_range(rng)
+        mask = (
+            (df['ParsedDate'] >= pd.to_datetime(start_date)) &
+            (df['ParsedDate'] <= pd.to_datetime(end_date)) &
+            (df['IsBackToBack'] == True)
+        )
+        expected = df[mask].sort_values(['Team', 'ParsedDate'])
+
+        rows = index.back_to_back_rows(start_date, end_date)
+        pd.testing.assert_frame_equal(df.iloc[rows], expected)
@@ -0,0 +1,166 @@
+"""
+Incremental schedule refresh: only changed teams are re-parsed, and the
+change log lists the games added, removed and moved.
+"""
+import contextlib
+import io
+
+import pandas as pd
+import pytest
+
+from scrapers.espn_schedule_scraper import ESPNScheduleScraper
+
+HEADERS = ['DATE', 'OPPONENT', 'TIME', 'TV']
+
+TABLES = {
+    'BOS': [['Wed, Oct 22', 'vsPhiladelphia', '7:30 PM', 'ESPN'],
+            ['Fri, Oct 24', '@New York', '7:00 PM', ''],
+            ['Sat, Oct 25', 'vsDetroit', '8:00 PM', ''],
+            ['Mon, Oct 27', '@Orlando', '7:00 PM', 'NBA TV']],
+    'NYK': [['Wed, Oct 22', '@Cleveland', '7:00 PM', ''],
+            ['Fri, Oct 24', 'vsBoston', '7:00 PM', '']],
+    'LAL': [['Tue, Oct 21', 'vsGolden State', '10:00 PM', 'TNT']],
+}
+
+
+class TeamPages:
+    """
+    _fetch_schedule_rows stand-in serving raw tables; teams set to None fail
+    """
+
+    def __init__(self, tables):
+        self.tables = {team: [list(row) for row in rows] for team, rows in tables.items()}
+
+    def __call__(self, team, season, retries):
+        rows = self.tables.get(team)
+        if rows is None:
+            return None, "timed out"
+        return (HEADERS, [list(row) for row in rows]), None
+
+
+@pytest.fixture
+def scraper(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    with contextlib.redirect_stdout(io.StringIO()):
+        scraper = ESPNScheduleScraper()
+
+    pages = TeamPages(TABLES)
+    monkeypatch.setattr(scraper, '_fetch_schedule_rows', pages)
+
+    built = []
+    build = scraper._build_schedule
+
+    def record_build(headers, rows, team, season='2026'):
+        built.append(team)
+        return build(headers, rows, team, season)
+
+    monkeypatch.setattr(scraper, '_build_schedule', record_build)
+    scraper.pages, scraper.built = pages, built
+    return scraper
+
+
+def refresh(scraper, **kwargs):
+    scraper.built.clear()
+    with contextlib.redirect_stdout(io.StringIO()):
+        return scraper.refresh_schedules(teams=list(TABLES), **kwargs)
+
+
+def changes(changelog: pd.DataFrame) -> list:
+    return sorted(
+        (row.Team, row.Change, row.Opponent, row.HomeAway,
+         None if pd.isna(row.OldDate) else row.OldDate.strftime('%m-%d'),
+         None if pd.isna(row.NewDate) else row.NewDate.strftime('%m-%d'))
+        for row in changelog.itertuples()
+    )
+
+
+def test_first_refresh_parses_every_team(scraper):
+    df, changelog = refresh(scraper)
+
+    assert scraper.built == ['BOS', 'NYK', 'LAL']
+    assert len(df) == 7
+    assert (changelog['Change'] == 'added').all() and len(changelog) == 7
+
+
+def test_unchanged_pages_are_not_reparsed(scraper):
+    first, _ = refresh(scraper)
+    second, changelog = refresh(scraper)
+
+    assert scraper.built == []
+    assert changelog.empty
+    pd.testing.assert_frame_equal(second, first, check_dtype=False)
+
+
+def test_only_changed_team_is_reparsed_and_diffed(scraper):
+    first, _ = refresh(scraper)
+
+    bos = scraper.pages.tables['BOS']
+    bos[1][0] = 'Sun, Oct 26'                                   # Knicks game postponed two days
+    del bos[2]                                                  # Detroit game dropped
+    bos.append(['Wed, Oct 29', 'vsMiami', '7:30 PM', ''])       # Miami game added
+    bos[0][3] = 'TNT'                                           # TV change only - not a game change
+
+    df, changelog = refresh(scraper)
+
+    assert scraper.built == ['BOS']
+    assert changes(changelog) == [
+        ('BOS', 'added', 'Miami', 'Home', None, '10-29'),
+        ('BOS', 'moved', 'New York', 'Away', '10-24', '10-26'),
+        ('BOS', 'removed', 'Detroit', 'Home', '10-25', None),
+    ]
+
+    boston = df[df['Team'] == 'BOS'].sort_values('ParsedDate')
+    assert boston['OpponentClean'].tolist() == ['Philadelphia', 'New York', 'Orlando', 'Miami']
+    assert boston['TV'].iloc[0] == 'TNT'
+    others = ['NYK', 'LAL']
+    pd.testing.assert_frame_equal(df[df['Team'].isin(others)].reset_index(drop=True),
+                                  first[first['Team'].isin(others)].reset_index(drop=True), check_dtype=False)
+
+
+def test_failed_teams_keep_their_stored_rows(scraper):
+    refresh(scraper)
+
+    scraper.pages.tables['LAL'] = None
+    scraper.pages.tables['NYK'][0][0] = 'Thu, Oct 23'
+    df, changelog = refresh(scraper)
+
+    assert scraper.built == ['NYK']
+    assert scraper.failed_teams == {'LAL': 'timed out'}
+    assert df[df['Team'] == 'LAL']['OpponentClean'].tolist() == ['Golden State']
+    assert changes(changelog) == [('NYK', 'moved', 'Cleveland', 'Away', '10-22', '10-23')]
+
+    # The stored hash for LAL is untouched, so once it answers again it is not re-parsed
+    scraper.pages.tables['LAL'] = TABLES['LAL']
+    _, changelog = refresh(scraper)
+    assert scraper.built == [] and changelog.empty
+
+
+def test_teams_outside_the_refresh_stay_stored(scraper):
+    refresh(scraper)
+
+    scraper.built.clear()
+    with contextlib.redirect_stdout(io.StringIO()):
+        df, _ = scraper.refresh_schedules(teams=['nyk'])
+
+    assert scraper.built == []
+    assert sorted(df['Team'].unique()) == ['BOS', 'LAL', 'NYK']
+
+
+def test_diff_matches_moves_by_opponent_and_venue():
+    def rows(games):
+        return pd.DataFrame(games, columns=['OpponentClean', 'HomeAway', 'ParsedDate'])
+
+    day = pd.Timestamp
+    old = rows([('Miami', 'Home', day('2025-11-01')), ('Miami', 'Away', day('2025-12-01')),
+                ('Utah', 'Home', day('2025-11-05'))])
+    new = rows([('Miami', 'Home', day('2025-11-03')), ('Miami', 'Away', day('2025-12-01')),
+                ('Utah', 'Away', day('2025-11-05'))])
+
+    diff = ESPNScheduleScraper._diff_team_games('BOS', old, new)
+
+    assert [(c['Change'], c['Opponent'], c['HomeAway']) for c in diff] == [
+        ('moved', 'Miami', 'Home'), ('removed', 'Utah', 'Home'), ('added', 'Utah', 'Away')
+    ]
+    assert diff[0]['OldDate'] == day('2025-11-01') and diff[0]['NewDate'] == day('2025-11-03')
+    assert ESPNScheduleScraper._diff_team_games('BOS', None, old)[0]['Change'] == 'added'
+    assert ESPNScheduleScraper._diff_team_games('BOS', old, old) == []
@@ -0,0 +1,191 @@
+"""
+The vectorized _enhance_schedule must produce the same columns as the
+row-by-row version it replaced (frozen below). Parallel team scrapes
+retry failed teams and report the ones that never succeed.
+"""
+import contextlib
+import io
+import random
+import time
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from scrapers.espn_schedule_scraper import ESPNScheduleScraper
+
+
+def old_enhance_schedule(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Frozen copy of the per-row _enhance_schedule (before the vectorized rewrite)
+    """
+    def parse_espn_date(date_str):
+        try:
+            temp_date = datetime.strptime(date_str + ', 2025', '%a, %b %d, %Y')
+            if temp_date.month < 10:
+                temp_date = temp_date.replace(year=2026)
+            return pd.Timestamp(temp_date)
+        except Exception:
+            return pd.NaT
+
+    df['ParsedDate'] = df['DATE'].apply(parse_espn_date)
+    df['DayOfWeek'] = df['ParsedDate'].dt.day_name()
+    df = df.sort_values('ParsedDate').reset_index(drop=True)
+
+    df['IsBackToBack'] = False
+    df['BackToBackPosition'] = 'None'
+    for i in range(1, len(df)):
+        if pd.notna(df.loc[i, 'ParsedDate']) and pd.notna(df.loc[i-1, 'ParsedDate']):
+            if (df.loc[i, 'ParsedDate'] - df.loc[i-1, 'ParsedDate']).days == 1:
+                df.loc[i-1, 'IsBackToBack'] = True
+                df.loc[i-1, 'BackToBackPosition'] = 'First'
+                df.loc[i, 'IsBackToBack'] = True
+                df.loc[i, 'BackToBackPosition'] = 'Second'
+
+    df['HomeAway'] = df['OPPONENT'].apply(lambda x: 'Away' if str(x).startswith('@') else 'Home')
+
+    def clean_opponent(opp):
+        opp = str(opp)
+        if opp.startswith('@'):
+            opp = opp[1:]
+        if opp.lower().startswith('vs'):
+            opp = opp[2:]
+        return opp.strip()
+
+    df['OpponentClean'] = df['OPPONENT'].apply(clean_opponent)
+    return df
+
+
+def random_schedule(rng: random.Random, games: int) -> pd.DataFrame:
+    """
+    Shuffled schedule with distinct game days, the odd unparsable date and mixed home/away prefixes
+    """
+    start = pd.Timestamp('2025-10-21')
+    dates = [(start + pd.Timedelta(days=day)).strftime('%a, %b %-d')
+             for day in sorted(rng.sample(range(200), games))]
+    if rng.random() < 0.3:
+        dates[rng.randrange(games)] = 'TBD'
+    opponents = [rng.choice(['vs', '@', 'vs ', '@ ', 'VS']) + rng.choice(['Toronto', 'Orlando', 'LA'])
+                 for _ in dates]
+    rng.shuffle(dates)
+    return pd.DataFrame({'DATE': dates, 'OPPONENT': opponents, 'Team': 'BOS'})
+
+
+@pytest.fixture(scope='module')
+def scraper():
+    with contextlib.redirect_stdout(io.StringIO()):
+        return ESPNScheduleScraper()
+
+
+@pytest.mark.parametrize('seed', range(50))
+def test_enhance_schedule_matches_row_loop(scraper, seed):
+    rng = random.Random(seed)
+    schedule = random_schedule(rng, rng.randint(2, 82))
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        expected = old_enhance_schedule(schedule.copy())
+        actual = scraper._enhance_schedule(schedule.copy(), 'BOS', '2026')
+
+    # The old sort was not stable; compare in a fixed order
+    order = ['ParsedDate', 'OPPONENT', 'DATE']
+    expected = expected.sort_values(order, kind='stable').reset_index(drop=True)
+    actual = actual.sort_values(order, kind='stable').reset_index(drop=True)
+    pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+
+
+def test_three_straight_days(scraper):
+    schedule = pd.DataFrame({
+        'DATE': ['Mon, Nov 3', 'Tue, Nov 4', 'Wed, Nov 5', 'Fri, Nov 7'],
+        'OPPONENT': ['vsToronto', '@Orlando', 'vsLA', '@Toronto'],
+    })
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        df = scraper._enhance_schedule(schedule, 'BOS', '2026')
+
+    assert df['BackToBackPosition'].tolist() == ['First', 'First', 'Second', 'None']
+    assert df['IsBackToBack'].tolist() == [True, True, True, False]
+    assert df['HomeAway'].tolist() == ['Home', 'Away', 'Home', 'Away']
+
+
+real_sleep = time.sleep
+
+
+class FlakyTeams:
+    """
+    _scrape_team_schedule stand-in: each team fails a set number of times before answering
+    """
+
+    def __init__(self, failures: dict, empty=()):
+        self.failures = dict(failures)
+        self.empty = set(empty)
+        self.attempts = {}
+
+    def __call__(self, team, season):
+        self.attempts[team] = self.attempts.get(team, 0) + 1
+        if self.attempts[team] <= self.failures.get(team, 0):
+            raise ConnectionError(f"{team} timed out")
+        if team in self.empty:
+            return None
+        # Later teams answer first, so completion order differs from team order
+        real_sleep(0.01 * (5 - len(self.attempts) % 5))
+        return pd.DataFrame({'Team': [team] * 2, 'Season': [season] * 2})
+
+
+@pytest.fixture
+def flaky(monkeypatch, scraper):
+    sleeps = []
+    # Record the retry backoff instead of waiting it out
+    monkeypatch.setattr(time, 'sleep', sleeps.append)
+
+    def install(failures: dict, empty=()):
+        teams = FlakyTeams(failures, empty)
+        monkeypatch.setattr(scraper, '_scrape_team_schedule', teams)
+        return teams, sleeps
+
+    return install
+
+
+def test_failed_teams_are_retried_with_backoff(scraper, flaky):
+    teams, sleeps = flaky({'BOS': 2, 'LAL': 1})
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        df, failures = scraper.scrape_team_schedules(['ATL', 'BOS', 'LAL', 'NYK'], season='2026', retries=2)
+
+    assert failures == {}
+    assert teams.attempts == {'ATL': 1, 'BOS': 3, 'LAL': 2, 'NYK': 1}
+    assert sorted(sleeps) == [0.5, 0.5, 1.0]
+    # Team order is kept whatever order the workers finished in
+    assert df['Team'].tolist() == ['ATL', 'ATL', 'BOS', 'BOS', 'LAL', 'LAL', 'NYK', 'NYK']
+
+
+def test_teams_failing_every_attempt_are_reported(scraper, flaky):
+    teams, _ = flaky({'BOS': 10}, empty={'NYK'})
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        df, failures = scraper.scrape_team_schedules(['atl', 'bos', 'nyk'], retries=1)
+
+    assert failures == {'BOS': 'BOS timed out', 'NYK': 'No schedule data found'}
+    assert teams.attempts == {'ATL': 1, 'BOS': 2, 'NYK': 2}
+    assert df['Team'].unique().tolist() == ['ATL']
+
+
+def test_all_teams_failing_returns_none(scraper, flaky):
+    flaky({'ATL': 10, 'BOS': 10})
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        df, failures = scraper.scrape_team_schedules(['ATL', 'BOS'], retries=0)
+
+    assert df is None
+    assert set(failures) == {'ATL', 'BOS'}
+
+
+def test_get_all_team_schedules_keeps_failed_teams(scraper, flaky):
+    flaky({'MIA': 10})
+
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        df = scraper.get_all_team_schedules(retries=0, max_workers=8)
+
+    assert scraper.failed_teams == {'MIA': 'MIA timed out'}
+    assert df['Team'].nunique() == len(scraper.nba_teams) - 1
+    assert 'Miami Heat (MIA): MIA timed out' in output.getvalue()
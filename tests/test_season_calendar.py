@@ -0,0 +1,74 @@
+"""
+Year rollover of ESPN's year-less schedule dates, for any season
+"""
+import contextlib
+import io
+
+import pandas as pd
+import pytest
+
+from scrapers.espn_schedule_scraper import ESPNScheduleScraper
+from utils.season_calendar import SeasonCalendar
+
+
+@pytest.mark.parametrize('season, expected', [
+    ('2026', ['2025-10-22', '2025-12-31', '2026-01-01', '2026-04-12']),
+    ('2024', ['2023-10-22', '2023-12-31', '2024-01-01', '2024-04-12']),
+    ('2021', ['2020-10-22', '2020-12-31', '2021-01-01', '2021-04-12']),
+    (2030, ['2029-10-22', '2029-12-31', '2030-01-01', '2030-04-12']),
+])
+def test_months_before_october_fall_in_the_ending_year(season, expected):
+    dates = pd.Series(['Wed, Oct 22', 'Wed, Dec 31', 'Thu, Jan 1', 'Sun, Apr 12'])
+
+    parsed = SeasonCalendar().parse_dates(dates, season)
+
+    assert parsed.dt.strftime('%Y-%m-%d').tolist() == expected
+
+
+def test_leap_day_parses_in_leap_seasons_only():
+    calendar = SeasonCalendar()
+
+    assert calendar.parse_dates(pd.Series(['Thu, Feb 29']), '2024').tolist() == [pd.Timestamp('2024-02-29')]
+    assert calendar.parse_dates(pd.Series(['Feb 29']), '2025').isna().all()
+
+
+def test_unparsable_and_missing_dates_are_nat():
+    parsed = SeasonCalendar().parse_dates(pd.Series(['TBD', None, 'Mon, Nov 3']), '2026')
+
+    assert parsed.isna().tolist() == [True, True, False]
+    assert parsed.iloc[2] == pd.Timestamp('2025-11-03')
+
+
+def test_each_string_is_parsed_once_per_season():
+    calendar = SeasonCalendar()
+    dates = pd.Series(['Wed, Oct 22', 'Fri, Oct 24'] * 50)
+
+    calendar.parse_dates(dates, '2026')
+    calendar.parse_dates(dates, '2026')
+    assert calendar.parsed == 2
+
+    # The same string belongs to another year in another season
+    assert calendar.parse_dates(dates.head(1), '2025').iloc[0] == pd.Timestamp('2024-10-22')
+    assert calendar.parsed == 3
+
+
+def test_custom_rollover_month_and_labels():
+    calendar = SeasonCalendar(rollover_month=7)
+
+    assert calendar.parse_dates(pd.Series(['Jul 1', 'Jun 30']), '2021').tolist() == [
+        pd.Timestamp('2020-07-01'), pd.Timestamp('2021-06-30')
+    ]
+    assert calendar.season_label('2026') == '2025-26'
+    assert calendar.season_label('2000') == '1999-00'
+    with pytest.raises(ValueError):
+        SeasonCalendar(rollover_month=13)
+
+
+def test_scraper_uses_the_season_argument():
+    with contextlib.redirect_stdout(io.StringIO()):
+        scraper = ESPNScheduleScraper()
+        schedule = pd.DataFrame({'DATE': ['Tue, Oct 24', 'Wed, Jan 3'], 'OPPONENT': ['vsMiami', '@Utah']})
+        df = scraper._enhance_schedule(schedule, 'BOS', '2024')
+
+    assert df['ParsedDate'].tolist() == [pd.Timestamp('2023-10-24'), pd.Timestamp('2024-01-03')]
+    assert df['DayOfWeek'].tolist() == ['Tuesday', 'Wednesday']
@@ -0,0 +1,114 @@
+"""
+Stats page parsers and streaming page sinks
+"""
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from scrapers.stats_table_parser import ArrowPageSink, CsvPageSink, StatsPage, get_stats_parser
+from utils.storage import load_table
+
+pytest.importorskip('pyarrow')
+
+
+def pages():
+    return [
+        StatsPage({'RK': ['1', '2'], 'Name': ['A', 'B'], 'Team': ['BOS', 'LAL'], 'PlayerID': ['11', '12'],
+                   'GP': ['10', '9'], 'PTS': ['27.3', '25.0'], 'FG%': ['.512', '.488']}),
+        StatsPage({'RK': ['3', '4'], 'Name': ['C', 'D'], 'Team': ['NYK', 'MIA'], 'PlayerID': ['13', '14'],
+                   'GP': ['8', '10'], 'PTS': ['24.1', '-'], 'FG%': ['.455', '.501']}),
+    ]
+
+
+def test_arrow_sink_keeps_numeric_dtypes(tmp_path):
+    with ArrowPageSink(str(tmp_path / 'stats.feather')) as sink:
+        for page in pages():
+            sink.write(page)
+    with CsvPageSink(str(tmp_path / 'stats.csv')) as sink:
+        for page in pages():
+            sink.write(page)
+
+    arrow = load_table(str(tmp_path / 'stats.feather'))
+    csv = pd.read_csv(tmp_path / 'stats.csv', na_values=['-'])
+
+    assert arrow['RK'].dtype == 'int64' and arrow['GP'].dtype == 'int64' and arrow['PlayerID'].dtype == 'int64'
+    assert arrow['PTS'].dtype == 'float64' and arrow['FG%'].dtype == 'float64'
+    pd.testing.assert_frame_equal(arrow, csv, check_dtype=False)
+    assert arrow['PTS'].isna().tolist() == [False, False, False, True]
+
+
+def test_arrow_sink_nulls_fractions_in_integer_columns(tmp_path):
+    path = str(tmp_path / 'stats.feather')
+    with ArrowPageSink(path) as sink:
+        sink.write(StatsPage({'Name': ['A'], 'GP': ['10']}))
+        sink.write(StatsPage({'Name': ['B'], 'GP': ['9.5']}))
+
+    assert load_table(path)['GP'].isna().tolist() == [False, True]
+
+
+def name_row(rank, name=None, team=None, player_id=None):
+    if name is None:
+        return f'<tr class="Table__TR"><td>{rank}</td></tr>'
+    return (f'<tr class="Table__TR"><td>{rank}</td><td><a class="AnchorLink" '
+            f'href="https://www.espn.com/nba/player/_/id/{player_id}/x">{name}</a>'
+            f'<span class="athleteCell__teamAbbrev">{team}</span></td></tr>')
+
+
+def stats_row(*cells):
+    return '<tr class="Table__TR">' + ''.join(f'<td>{cell}</td>' for cell in cells) + '</tr>'
+
+
+RAGGED_PAGE = (
+    '<html><body><table class="Table">'
+    + name_row(1, 'A', 'BOS', 11) + name_row(2) + name_row(3, 'C', 'NYK', 13)
+    + '</table><table class="Table"><tr><th>GP</th><th>PTS</th></tr>'
+    + stats_row('10', '27.3') + stats_row('9') + stats_row('8', '24.1')
+    + '</table></body></html>'
+).encode()
+
+
+@pytest.mark.parametrize('backend', ['bs4', 'lxml'])
+def test_ragged_rows_stay_aligned(backend):
+    if backend == 'lxml':
+        pytest.importorskip('lxml')
+    df = get_stats_parser(backend).parse(RAGGED_PAGE)
+    df = df.astype(object).where(df.notna(), None)
+
+    assert df['RK'].tolist() == ['1', '2', '3']
+    assert df['Name'].tolist() == ['A', None, 'C']
+    assert df['PlayerID'].tolist() == ['11', None, '13']
+    assert df['GP'].tolist() == ['10', '9', '8']
+    assert df['PTS'].tolist() == ['27.3', None, '24.1']
+
+
+FIXTURE_PAGES = sorted((Path(__file__).parent / 'fixtures' / 'stats_pages').glob('*.html'))
+
+
+@pytest.mark.parametrize('path', FIXTURE_PAGES[:-1], ids=lambda path: path.name)
+def test_backends_agree_on_saved_pages(path):
+    pytest.importorskip('lxml')
+    content = path.read_bytes()
+
+    expected = get_stats_parser('bs4').parse(content)
+    actual = get_stats_parser('lxml').parse(content)
+
+    assert len(expected) in (50, 30)
+    assert list(expected.columns[:4]) == ['RK', 'Name', 'Team', 'PlayerID']
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_saved_page_details():
+    pytest.importorskip('lxml')
+    df = get_stats_parser('lxml').parse(FIXTURE_PAGES[2].read_bytes())
+
+    assert df['Name'].iloc[:2].tolist() == ['Nikola Jokić', 'ShaiGilgeous-Alexander']
+    assert df['PlayerID'].iloc[0] == '3100'
+    assert df['RK'].iloc[-1] == '130'
+
+
+@pytest.mark.parametrize('backend', ['bs4', 'lxml'])
+def test_empty_page_is_end_of_data(backend):
+    if backend == 'lxml':
+        pytest.importorskip('lxml')
+    assert get_stats_parser(backend).parse_columns(FIXTURE_PAGES[-1].read_bytes()) is None
@@ -0,0 +1,134 @@
+"""
+Streaming optimizer: acquisition limits, drop timing and started-game counts
+"""
+import contextlib
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analyzers.lineup_optimizer import LineupOptimizer
+from analyzers.projection_engine import ProjectionEngine
+from analyzers.schedule_index import ScheduleIndex
+from analyzers.streaming_optimizer import StreamingOptimizer
+
+
+CATEGORIES = [{'category': c, 'is_negative': False} for c in ['PTS', 'REB', 'AST']]
+START, END = '2025-11-03', '2025-11-09'
+
+
+def schedule(games: dict) -> ScheduleIndex:
+    """
+    Index over {team: [day offsets from START]}
+    """
+    rows = [{'Team': team, 'ParsedDate': pd.Timestamp(START) + pd.Timedelta(days=day), 'HomeAway': 'Home',
+             'IsBackToBack': False}
+            for team, days in games.items() for day in days]
+    return ScheduleIndex(pd.DataFrame(rows))
+
+
+def engine(stats: list) -> ProjectionEngine:
+    with contextlib.redirect_stdout(io.StringIO()):
+        return ProjectionEngine(pd.DataFrame(stats, columns=['PTS', 'REB', 'AST']), ['PTS', 'REB', 'AST'])
+
+
+def players(names, teams, rows, eligible=None) -> pd.DataFrame:
+    df = pd.DataFrame({'Player': names, 'Team': teams, 'Row': rows})
+    if eligible is not None:
+        df['Eligible'] = eligible
+    return df
+
+
+@pytest.fixture
+def random_league():
+    def build(seed: int):
+        rng = np.random.default_rng(seed)
+        teams = [f'T{t:02d}' for t in range(12)]
+        index = schedule({team: np.flatnonzero(rng.random(7) < 0.5).tolist() for team in teams})
+        projection = engine(rng.uniform([5, 2, 1], [25, 10, 8], size=(40, 3)).tolist())
+        team_of = rng.choice(teams, 40)
+        roster = players([f'R{i}' for i in range(5)], team_of[:5].tolist(), list(range(5)))
+        pool = players([f'F{i}' for i in range(5, 35)], team_of[5:35].tolist(), list(range(5, 35)))
+        opponent = projection.project(range(35, 40), [4] * 5)
+        return index, projection, roster, pool, opponent
+    return build
+
+
+def test_no_acquisitions_left_means_no_moves(random_league):
+    index, projection, roster, pool, opponent = random_league(0)
+    optimizer = StreamingOptimizer(projection, index, CATEGORIES)
+
+    plan = optimizer.optimize(roster, pool, opponent, START, END, acquisitions=0, min_gain=0.0)
+
+    assert plan['moves'].empty
+    assert plan['final'] == plan['baseline']
+
+    plan = optimizer.optimize(roster, pool, opponent, START, END, acquisitions=3, min_gain=0.0)
+    assert len(plan['moves']) == 3
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_players_are_never_dropped_before_they_join(random_league, seed):
+    index, projection, roster, pool, opponent = random_league(seed)
+    optimizer = StreamingOptimizer(projection, index, CATEGORIES)
+
+    plan = optimizer.optimize(roster, pool, opponent, START, END, acquisitions=6, min_gain=0.0)
+
+    joined = {}
+    dropped = set()
+    for move in plan['moves'].itertuples():
+        assert move.Drop not in dropped
+        if move.Drop in joined:
+            assert move.Day >= joined[move.Drop]
+        dropped.add(move.Drop)
+        joined[move.Add] = move.Day
+
+
+def test_dropping_a_late_pickup_waits_for_the_day_it_joined():
+    # R0 plays Mon-Wed and F1 only Thu-Sun, so F1 replaces R0 on Thursday. F1 has no games
+    # before Thursday, so dropping it on Monday for F2 (who plays every day) would cost nothing
+    # extra and add three more F2 games - but F1 is only on the roster from Thursday on.
+    index = schedule({'AAA': [0, 1, 2], 'BBB': [3, 4, 5, 6], 'CCC': list(range(7)), 'OPP': list(range(7))})
+    projection = engine([[10, 5, 3], [30, 10, 6], [12, 5, 3], [15, 7, 4]])
+    roster = players(['R0'], ['AAA'], [0])
+    pool = players(['F1', 'F2'], ['BBB', 'CCC'], [1, 2])
+    opponent = projection.project([3, 3], [4, 4])
+    optimizer = StreamingOptimizer(projection, index, CATEGORIES[:1])
+
+    plan = optimizer.optimize(roster, pool, opponent, START, END, acquisitions=2, min_gain=-1.0)
+
+    first, second = plan['moves'][['Day', 'Drop', 'Add']].values.tolist()
+    assert first == ['2025-11-06', 'R0', 'F1']
+    assert second[1:] == ['F1', 'F2']
+    assert second[0] >= '2025-11-06'
+
+
+def test_games_added_counts_starts_for_each_drop():
+    # One C slot and one PG slot: F1 (a center) only starts when the better center R0 is gone or idle
+    index = schedule({'AAA': [0, 2, 4], 'BBB': [1, 3, 5], 'CCC': [0, 1, 2, 3], 'OPP': list(range(7))})
+    projection = engine([[30, 10, 5], [5, 2, 1], [20, 8, 4], [12, 5, 3]])
+    lineup = LineupOptimizer({'0': 1, '4': 1, '12': 3})
+    roster = players(['R0', 'R1'], ['AAA', 'BBB'], [0, 1], [{4}, {0}])
+    pool = players(['F1'], ['CCC'], [2], [{4}])
+    opponent = projection.project([3, 3], [3, 3])
+    optimizer = StreamingOptimizer(projection, index, CATEGORIES, lineup, {'PTS': 1.0}, refine=50)
+
+    plan = optimizer.optimize(roster, pool, opponent, START, END, acquisitions=1, min_gain=-10.0)
+
+    def started_after_swap(drop: str, day: str) -> int:
+        d = (pd.Timestamp(day) - pd.Timestamp(START)).days
+        games, _ = index.team_games(['AAA', 'BBB', 'CCC'], START, END)
+        games = games.astype(np.float64)
+        games[roster['Player'].tolist().index(drop), d:] = 0
+        games[2, :d] = 0
+        started = lineup.started_games([{4}, {0}, {4}], games, projection.values([0, 1, 2], {'PTS': 1.0}))
+        return int(started[2].sum())
+
+    swaps = plan['top_swaps'].set_index('Drop')
+    assert set(swaps.index) == {'R0', 'R1'}
+    for drop, swap in swaps.iterrows():
+        assert swap['GamesAdded'] == started_after_swap(drop, swap['Day'])
+
+    move = plan['moves'].iloc[0]
+    assert move['GamesAdded'] == started_after_swap(move['Drop'], move['Day'])